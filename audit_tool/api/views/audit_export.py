@@ -5,10 +5,8 @@ from datetime import timedelta
 from distutils.util import strtobool
 from uuid import uuid4
 
-import boto3
 import requests
 import unicodedata
-from botocore.client import Config
 from django.conf import settings
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -42,6 +40,7 @@ class AuditExportApiView(APIView):
                        "?key={key}&part=id,snippet&id={id}"
     DATA_API_KEY = settings.YOUTUBE_API_DEVELOPER_KEY
     MAX_ROWS = 1000000
+    EXPORT_CHUNK_SIZE = 2000
     cache = {}
     local_file = None
 
@@ -166,6 +165,15 @@ class AuditExportApiView(APIView):
         # pylint: enable=broad-except
             return ""
 
+    def load_lookup_tables(self):
+        """
+        Load languages, categories and countries with a query per table, so that get_lang, get_category and
+        get_country do not query for each exported row
+        """
+        self.cache['language'] = dict(AuditLanguage.objects.values_list('id', 'language'))
+        self.cache['category'] = dict(AuditCategory.objects.values_list('id', 'category_display_iab'))
+        self.cache['country'] = dict(AuditCountry.objects.values_list('id', 'country'))
+
     def get_lang(self, obj_id):
         if 'language' not in self.cache:
             self.cache['language'] = {}
@@ -231,6 +239,7 @@ class AuditExportApiView(APIView):
         #    do_exclusion = True
         export.set_current_step("delete_blocklist_channels")
         self.delete_blocklist_channels(audit)
+        self.load_lookup_tables()
         cols = [
             "Video URL",
             "Name",
@@ -295,6 +304,9 @@ class AuditExportApiView(APIView):
             max_rows = audit.params.get('MAX_VIDEO_ROWS')
         if count > max_rows:
             count = max_rows
+        # stream rows with their video, channel and metadata joined instead of querying them for each row
+        videos = videos.select_related("video__auditvideometa", "video__channel__auditchannelmeta")[:count]\
+            .iterator(chunk_size=self.EXPORT_CHUNK_SIZE)
         num_done = 0
         self.local_file = "export_files/{}".format(uuid4().hex)
         with open(self.local_file, 'w+', newline='') as my_file:
@@ -302,10 +314,7 @@ class AuditExportApiView(APIView):
             wr.writerow(cols)
             print("EXPORT {}: starting video processing {}".format(export.id, self.local_file))
             export.set_current_step("creating_big_dict")
-            stop = False
             for avp in videos:
-                if stop:
-                    continue
                 vid = avp.video
                 try:
                     v = vid.auditvideometa
@@ -476,9 +485,6 @@ class AuditExportApiView(APIView):
                     if export.percent_done > old_percent:
                         export.save(update_fields=['percent_done'])
                     print("video export {} at {}.  {}/{}".format(export.id, export.percent_done, num_done, count))
-                if num_done >= max_rows or num_done >= count:
-                    stop = True
-                    continue
         export.set_current_step("preparing_to_move_file")
         with open(self.local_file) as my_file:
             s3_file_name = uuid4().hex
@@ -556,6 +562,7 @@ class AuditExportApiView(APIView):
         self.get_categories()
         export.set_current_step("delete_blocklist_channels")
         self.delete_blocklist_channels(audit)
+        self.load_lookup_tables()
         cols = [
             "Channel Title",
             "Channel URL",
@@ -617,8 +624,9 @@ class AuditExportApiView(APIView):
         channels = AuditChannelProcessor.objects.filter(audit_id=audit_id)
         if clean is not None:
             channels = channels.filter(clean=clean)
+        channels = channels.select_related("channel__auditchannelmeta")
         export.set_current_step("processing_initial_objs")
-        for cid in channels:
+        for cid in channels.iterator(chunk_size=self.EXPORT_CHUNK_SIZE):
             full_channel_id = cid.channel.channel_id
             channel_ids.append(full_channel_id)
             if not auditchannelmeta_dict.get(full_channel_id):
@@ -697,7 +705,7 @@ class AuditExportApiView(APIView):
             wr.writerow(cols)
             print("EXPORT: starting channel processing of export {}".format(export.id))
             export.set_current_step("creating_big_dict")
-            for db_channel in channels:
+            for db_channel in channels.iterator(chunk_size=self.EXPORT_CHUNK_SIZE):
                 channel = db_channel.channel
                 v = auditchannelmeta_dict.get(channel.channel_id)
                 if not v:
@@ -955,16 +963,6 @@ class AuditS3Exporter(S3Exporter):
     bucket_name = settings.AMAZON_S3_AUDITS_EXPORTS_BUCKET_NAME
     export_content_type = "application/CSV"
 
-    @classmethod
-    def _presigned_s3(cls):
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=cls.aws_access_key_id,
-            aws_secret_access_key=cls.aws_secret_access_key,
-            config=Config(signature_version='s3v4')
-        )
-        return s3
-
     @classmethod
     def get_s3_key(cls, name):
         key = name
@@ -1,15 +1,14 @@
 import logging
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from urllib.parse import urlencode
 
-import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from pid import PidFile
-from threading import Thread
 
 from audit_tool.models import AuditChannelMeta
 from audit_tool.models import AuditChannelProcessor
@@ -17,7 +16,9 @@ from audit_tool.models import AuditProcessor
 from audit_tool.models import AuditVideo
 from audit_tool.models import AuditVideoProcessor
 from audit_tool.models import BlacklistItem
+from audit_tool.utils.data_api import get_session
 from audit_tool.utils.regex_trie import get_optimized_regex
+from utils.utils import chunks_generator
 from utils.utils import remove_tags_punctuation
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,7 @@ class Command(BaseCommand):
     YOUTUBE_CHANNELS_URL = 'https://www.googleapis.com/youtube/v3/channels'
     YOUTUBE_PLAYLISTITEMS_URL = 'https://www.googleapis.com/youtube/v3/playlistItems'
     CHANNEL_VIDEOS_ENDPOINT_MAX_VIDEOS = 500
+    CHANNELS_API_BATCH_SIZE = 50
 
     def __init__(self, stdout=None, stderr=None, no_color=False, force_color=False):
         super(Command, self).__init__(stdout=stdout, stderr=stderr, no_color=no_color, force_color=force_color)
@@ -58,6 +60,7 @@ class Command(BaseCommand):
         self.exclusion_hit_count = None
         self.num_videos = None
         self.placement_list = None
+        self.uploads_playlist_ids = {}
 
     def add_arguments(self, parser):
         parser.add_argument("thread_id", type=int)
@@ -133,23 +136,21 @@ class Command(BaseCommand):
                 print("Audit of channels completed, turning to video processor.")
                 raise Exception("Audit of channels completed, turning to video processor")
             raise Exception("not first thread but audit is done")
-        pending_channels = pending_channels.filter(channel__processed_time__isnull=False)
+        pending_channels = pending_channels.filter(channel__processed_time__isnull=False)\
+            .select_related("channel__auditchannelmeta")
         start = self.thread_id * num
-        counter = 0
-        threads = []
-        for channel in pending_channels[start:start + num]:
-            counter += 1
-            t = Thread(target=self.do_check_channel, args=(channel,))
-            threads.append(t)
-            t.start()
-            if len(threads) >= self.NUM_THREADS:
-                for t in threads:
-                    t.join()
-                threads = []
-            # self.do_check_channel(channel)
-        if len(threads) > 0:
-            for t in threads:
-                t.join()
+        channels = list(pending_channels[start:start + num])
+        counter = len(channels)
+        num_videos = self.get_num_videos()
+        self.uploads_playlist_ids = self.get_uploads_playlist_ids(
+            [acp.channel.channel_id for acp in channels if self.uses_uploads_playlist(num_videos, acp)]
+        )
+        # channels are checked by a bounded pool of threads so that a slow channel does not hold up others
+        with ThreadPoolExecutor(max_workers=self.NUM_THREADS) as executor:
+            futures = [executor.submit(self.do_check_channel, acp) for acp in channels]
+        for future in futures:
+            if future.exception() is not None:
+                logger.error(future.exception())
         self.audit.updated = timezone.now()
         self.audit.save(update_fields=["updated"])
         print("Done one step, continuing audit {}.".format(self.audit.id))
@@ -198,30 +199,58 @@ class Command(BaseCommand):
         acp.word_hits["error"] = response.status_code
         acp.save(update_fields=["clean", "processed", "word_hits"])
 
+    def get_uploads_playlist_ids(self, channel_ids):
+        """
+        Get uploads playlist ids of channels with a channels.list call per 50 channels
+        Channels missing from result are looked up again by get_videos_using_uploads_playlist
+        :param channel_ids: list -> Youtube channel ids
+        :return: dict -> channel_id: uploads playlist id
+        """
+        uploads_playlist_ids = {}
+        for chunk in chunks_generator(channel_ids, size=self.CHANNELS_API_BATCH_SIZE):
+            channels_url = self.YOUTUBE_CHANNELS_URL + '?' + urlencode({
+                'key': self.DATA_API_KEY,
+                'id': ','.join(chunk),
+                'part': 'contentDetails',
+            })
+            try:
+                channels_res = get_session().get(channels_url)
+                if channels_res.status_code != 200:
+                    continue
+                for item in channels_res.json().get('items', []):
+                    uploads_playlist_ids[item['id']] = item['contentDetails']['relatedPlaylists']['uploads']
+            # pylint: disable=broad-except
+            except Exception as e:
+            # pylint: enable=broad-except
+                logger.exception(e)
+        return uploads_playlist_ids
+
     def get_videos_using_uploads_playlist(self, num_videos, acp):
         """
         page through channel's uploads playlist. This is used if a channel
         has more than 500 uploads, since the videos endpoint only gets up
         to 500 video records
         """
-        # we want upload playlist id from this response
-        channels_url = self.YOUTUBE_CHANNELS_URL + '?' + urlencode({
-            'key': self.DATA_API_KEY,
-            'id': acp.channel.channel_id,
-            'part': ','.join(['contentDetails',]),
-        })
-        channels_res = requests.get(channels_url)
-        channels_json = channels_res.json()
-        if channels_res.status_code != 200:
-            self.handle_bad_response_code(channels_res, channels_json, acp)
-            return
-        items = channels_json.get('items', [])
-        if not len(items):
-            logger.info("could not get channel playlists for channel with id %s", acp.channel.channel_id)
-            self.handle_bad_response_code(channels_res, channels_json, acp)
-            return
-        channel_json = items[0]
-        uploads_playlist_id = channel_json['contentDetails']['relatedPlaylists']['uploads']
+        uploads_playlist_id = self.uploads_playlist_ids.get(acp.channel.channel_id)
+        if uploads_playlist_id is None:
+            # we want upload playlist id from this response
+            channels_url = self.YOUTUBE_CHANNELS_URL + '?' + urlencode({
+                'key': self.DATA_API_KEY,
+                'id': acp.channel.channel_id,
+                'part': ','.join(['contentDetails',]),
+            })
+            channels_res = get_session().get(channels_url)
+            channels_json = channels_res.json()
+            if channels_res.status_code != 200:
+                self.handle_bad_response_code(channels_res, channels_json, acp)
+                return
+            items = channels_json.get('items', [])
+            if not len(items):
+                logger.info("could not get channel playlists for channel with id %s", acp.channel.channel_id)
+                self.handle_bad_response_code(channels_res, channels_json, acp)
+                return
+            channel_json = items[0]
+            uploads_playlist_id = channel_json['contentDetails']['relatedPlaylists']['uploads']
         # page through uploads playlist and collect video ids
         count = 0
         previous_page_counts = []
@@ -236,14 +265,14 @@ class Command(BaseCommand):
             if next_page_token:
                 playlist_url_params['pageToken'] = next_page_token
             playlist_url = self.YOUTUBE_PLAYLISTITEMS_URL + '?' + urlencode(playlist_url_params)
-            playlist_res = requests.get(playlist_url)
+            playlist_res = get_session().get(playlist_url)
             playlist_json = playlist_res.json()
             if playlist_res.status_code != 200:
                 self.handle_bad_response_code(playlist_res, playlist_json, acp)
                 return
-            for item in playlist_json['items']:
-                self.update_or_create_video(item['snippet']['resourceId']['videoId'], acp)
-                count += 1
+            self.update_or_create_videos([item['snippet']['resourceId']['videoId']
+                                          for item in playlist_json['items']], acp)
+            count += len(playlist_json['items'])
             # prevent unnecessary quota usage if res is 200, but no items returned
             previous_page_counts.append(len(playlist_json['items']))
             if len(previous_page_counts) >= self.MAX_EMPTY_PLAYLIST_PAGES \
@@ -279,15 +308,14 @@ class Command(BaseCommand):
                 page_token=pt,
                 num_videos=per_page,
             )
-            r = requests.get(url)
+            r = get_session().get(url)
             data = r.json()
             if r.status_code != 200:
                 self.handle_bad_response_code(r, data, acp)
                 return
-            for item in data["items"]:
-                video_id = item['id']['videoId']
-                video_ids_set.add(video_id)
-                self.update_or_create_video(video_id, acp)
+            video_ids = [item['id']['videoId'] for item in data["items"]]
+            video_ids_set.update(video_ids)
+            self.update_or_create_videos(video_ids, acp)
             count = len(video_ids_set)
             page_token = data.get("nextPageToken")
             if not page_token \
@@ -297,32 +325,40 @@ class Command(BaseCommand):
                     or count >= num_videos:
                 has_more = False
 
-    def update_or_create_video(self, video_id, acp):
+    def update_or_create_videos(self, video_ids, acp):
         """
-        create or update AuditVideo and AuditVideoProcessor records,
-        given a video id
+        create or update AuditVideo and AuditVideoProcessor records
+        with bulk queries, given a page of video ids
         """
-        db_video = AuditVideo.get_or_create(video_id)
-        if not db_video.channel or db_video.channel != acp.channel:
-            db_video.channel = acp.channel
-            db_video.save(update_fields=["channel"])
-        AuditVideoProcessor.objects.get_or_create(
-            audit=self.audit,
-            video=db_video
-        )
+        if not video_ids:
+            return
+        db_videos = AuditVideo.get_or_create_many(video_ids, channel=acp.channel)
+        AuditVideoProcessor.objects.bulk_create([
+            AuditVideoProcessor(audit=self.audit, video=db_video) for db_video in db_videos.values()
+        ], ignore_conflicts=True)
 
-    def get_videos(self, acp):
+    def get_num_videos(self):
+        if not self.audit.params.get("do_videos"):
+            return 1
+        return self.num_videos
+
+    def uses_uploads_playlist(self, num_videos, acp):
         """
-        Updates or Creates a given Audit Channel's videos up to self.num_videos.
+        Channels with more uploads than the videos endpoint returns are paged through their uploads playlist
         """
-        num_videos = self.num_videos
-        if not self.audit.params.get("do_videos"):
-            num_videos = 1
         try:
             channel_video_count = acp.channel.auditchannelmeta.video_count
         except AuditChannelMeta.DoesNotExist:
             channel_video_count = None
-        if channel_video_count and channel_video_count > self.CHANNEL_VIDEOS_ENDPOINT_MAX_VIDEOS and num_videos > self.CHANNEL_VIDEOS_ENDPOINT_MAX_VIDEOS:
+        return bool(channel_video_count) and channel_video_count > self.CHANNEL_VIDEOS_ENDPOINT_MAX_VIDEOS \
+            and num_videos > self.CHANNEL_VIDEOS_ENDPOINT_MAX_VIDEOS
+
+    def get_videos(self, acp):
+        """
+        Updates or Creates a given Audit Channel's videos up to self.num_videos.
+        """
+        num_videos = self.get_num_videos()
+        if self.uses_uploads_playlist(num_videos, acp):
             self.get_videos_using_uploads_playlist(num_videos, acp)
             return
         self.get_videos_using_channel_videos(num_videos, acp)
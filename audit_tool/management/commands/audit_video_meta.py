@@ -2,7 +2,6 @@ import csv
 import logging
 import os
 import re
-import requests
 import tempfile
 
 from collections import defaultdict
@@ -23,9 +22,11 @@ from audit_tool.models import AuditChannelProcessor
 from audit_tool.models import AuditExporter
 from audit_tool.models import AuditLanguage
 from audit_tool.models import AuditProcessor
+from audit_tool.models import AuditVideo
 from audit_tool.models import AuditVideoMeta
 from audit_tool.models import AuditVideoProcessor
 from audit_tool.models import BlacklistItem
+from audit_tool.utils.data_api import get_session
 from audit_tool.utils.regex_trie import get_optimized_regex
 from segment.models import CustomSegment
 from segment.models.constants import Params
@@ -209,7 +210,8 @@ class Command(BaseCommand):
             self.inclusion_hit_count = 1
         else:
             self.inclusion_hit_count = int(self.inclusion_hit_count)
-        pending_videos = AuditVideoProcessor.objects.filter(audit=self.audit).filter(processed__isnull=True)
+        pending_videos = AuditVideoProcessor.objects.filter(audit=self.audit).filter(processed__isnull=True)\
+            .select_related("video__channel")
         if pending_videos.count() == 0:  # we've processed ALL of the items so we close the audit
             if self.thread_id == 0:
                 if self.audit.params.get("audit_type_original") and self.audit.params["audit_type_original"] == 2:
@@ -275,58 +277,121 @@ class Command(BaseCommand):
                 db_acp.save(update_fields=['word_hits'])
 
     def do_check_video(self, videos):
+        """
+        Check batch of up to 50 videos. Metadata of all videos to refresh is fetched with a single Data API call, and
+        missing AuditVideoMeta and AuditChannelMeta rows are created with bulk queries
+        :param videos: dict -> video_id: AuditVideoProcessor
+        """
+        db_video_metas = self.get_video_metas([avp.video for avp in videos.values()])
+        refresh_threshold = timezone.now() - timedelta(days=30)
+        refresh_ids = [
+            video_id for video_id, avp in videos.items()
+            if not avp.video.processed_time or self.force_data_refresh or avp.video.processed_time < refresh_threshold
+        ]
+        videos_data = self.get_videos_data(refresh_ids) if refresh_ids else {}
+        channel_ids = {}
+        refreshed_videos = []
         for video_id, avp in videos.items():
             db_video = avp.video
-            db_video_meta, _ = AuditVideoMeta.objects.get_or_create(video=db_video)
-            if not db_video.processed_time or self.force_data_refresh or db_video.processed_time < (timezone.now() - timedelta(days=30)):
-                channel_id = self.do_video_metadata_api_call(db_video_meta, video_id)
+            if video_id in videos_data:
+                channel_ids[video_id] = self.populate_video_meta(db_video_metas[db_video.id], videos_data[video_id])
                 db_video.processed_time = timezone.now()
-                db_video.save(update_fields=["processed_time"])
+                refreshed_videos.append(db_video)
             else:
-                channel_id = db_video.channel.channel_id if db_video.channel else None
+                channel_ids[video_id] = db_video.channel.channel_id if db_video.channel else None
+        AuditVideo.objects.bulk_update(refreshed_videos, fields=["processed_time"])
+
+        channels = {}
+        for video_id, avp in videos.items():
+            channel_id = channel_ids[video_id]
             if not channel_id:  # video does not exist or is private now
                 avp.clean = False
                 avp.processed = timezone.now()
                 avp.save(update_fields=["processed", "clean"])
-            else:
-                db_video.channel = AuditChannel.get_or_create(channel_id)
+                continue
+            if channel_id not in channels:
+                channels[channel_id] = AuditChannel.get_or_create(channel_id)
+            db_video = avp.video
+            db_video.channel = channels[channel_id]
+            db_video_meta = db_video_metas[db_video.id]
+            try:
+                db_video_meta.save()
+            except ValueError:
+                db_video_meta.keywords = ''
                 try:
                     db_video_meta.save()
                 except ValueError:
-                    db_video_meta.keywords = ''
+                    db_video_meta.description = ''
                     try:
                         db_video_meta.save()
                     except ValueError:
-                        db_video_meta.description = ''
-                        try:
-                            db_video_meta.save()
-                        except ValueError:
-                            db_video_meta.name = ''
-                            db_video_meta.save()
-                db_video.save()
-                db_channel_meta, _ = AuditChannelMeta.objects.get_or_create(
-                    channel=db_video.channel,
-                )
-                if self.placement_list and not db_channel_meta.monetised:
-                    db_channel_meta.monetised = True
-                    db_channel_meta.save(update_fields=["monetised"])
-                if db_video_meta.publish_date \
-                    and (not db_channel_meta.last_uploaded
-                         or db_channel_meta.last_uploaded < db_video_meta.publish_date):
-                    db_channel_meta.last_uploaded = db_video_meta.publish_date
-                    db_channel_meta.last_uploaded_view_count = db_video_meta.views
-                    db_channel_meta.last_uploaded_category = db_video_meta.category
-                    db_channel_meta.save(
-                        update_fields=["last_uploaded", "last_uploaded_view_count", "last_uploaded_category"])
-                avp.channel = db_video.channel
-                #if not self.audit.params.get("override_blocklist"):
-                blocklisted = self.check_video_is_blocklisted(db_video.video_id, channel_id, avp)
-                if not blocklisted:
-                    avp.clean = self.check_video_is_clean(db_video_meta, avp)
-                else:
-                    avp.clean = False
-                avp.processed = timezone.now()
-                avp.save()
+                        db_video_meta.name = ''
+                        db_video_meta.save()
+            db_video.save()
+
+        db_channel_metas = self.get_channel_metas(list(channels.values()))
+        for video_id, avp in videos.items():
+            channel_id = channel_ids[video_id]
+            if not channel_id:
+                continue
+            db_video = avp.video
+            db_video_meta = db_video_metas[db_video.id]
+            db_channel_meta = db_channel_metas[db_video.channel_id]
+            if self.placement_list and not db_channel_meta.monetised:
+                db_channel_meta.monetised = True
+                db_channel_meta.save(update_fields=["monetised"])
+            if db_video_meta.publish_date \
+                and (not db_channel_meta.last_uploaded
+                     or db_channel_meta.last_uploaded < db_video_meta.publish_date):
+                db_channel_meta.last_uploaded = db_video_meta.publish_date
+                db_channel_meta.last_uploaded_view_count = db_video_meta.views
+                db_channel_meta.last_uploaded_category = db_video_meta.category
+                db_channel_meta.save(
+                    update_fields=["last_uploaded", "last_uploaded_view_count", "last_uploaded_category"])
+            avp.channel = db_video.channel
+            #if not self.audit.params.get("override_blocklist"):
+            blocklisted = self.check_video_is_blocklisted(db_video.video_id, channel_id, avp)
+            if not blocklisted:
+                avp.clean = self.check_video_is_clean(db_video_meta, avp)
+            else:
+                avp.clean = False
+            avp.processed = timezone.now()
+            avp.save()
+
+    @staticmethod
+    def get_video_metas(db_videos):
+        """
+        Get AuditVideoMeta of videos, creating missing rows with a single bulk query
+        :param db_videos: list -> AuditVideo
+        :return: dict -> AuditVideo.id: AuditVideoMeta
+        """
+        db_video_metas = {meta.video_id: meta for meta in AuditVideoMeta.objects.filter(video__in=db_videos)}
+        missing = [AuditVideoMeta(video=db_video) for db_video in db_videos if db_video.id not in db_video_metas]
+        if missing:
+            AuditVideoMeta.objects.bulk_create(missing, ignore_conflicts=True)
+            db_video_metas.update({
+                meta.video_id: meta
+                for meta in AuditVideoMeta.objects.filter(video_id__in=[meta.video_id for meta in missing])
+            })
+        return db_video_metas
+
+    @staticmethod
+    def get_channel_metas(db_channels):
+        """
+        Get AuditChannelMeta of channels, creating missing rows with a single bulk query
+        :param db_channels: list -> AuditChannel
+        :return: dict -> AuditChannel.id: AuditChannelMeta
+        """
+        db_channel_metas = {meta.channel_id: meta for meta in AuditChannelMeta.objects.filter(channel__in=db_channels)}
+        missing = [AuditChannelMeta(channel=db_channel) for db_channel in db_channels
+                   if db_channel.id not in db_channel_metas]
+        if missing:
+            AuditChannelMeta.objects.bulk_create(missing, ignore_conflicts=True)
+            db_channel_metas.update({
+                meta.channel_id: meta
+                for meta in AuditChannelMeta.objects.filter(channel_id__in=[meta.channel_id for meta in missing])
+            })
+        return db_channel_metas
 
     def check_video_is_blocklisted(self, video_id, channel_id, avp):
         if BlacklistItem.get(channel_id, BlacklistItem.CHANNEL_ITEM):
@@ -468,25 +533,38 @@ class Command(BaseCommand):
                 return True
         return False
 
-    # pylint: disable=too-many-branches,too-many-statements
-    def do_video_metadata_api_call(self, db_video_meta, video_id):
+    def get_videos_data(self, video_ids):
+        """
+        Get Data API resources of up to 50 videos with a single videos.list call
+        Videos missing from result do not exist or are private now
+        :param video_ids: list -> Youtube video ids
+        :return: dict -> video_id: video resource
+        """
         try:
-            url = self.DATA_VIDEO_API_URL.format(key=self.DATA_API_KEY, id=video_id)
-            r = requests.get(url)
-            data = r.json()
+            url = self.DATA_VIDEO_API_URL.format(key=self.DATA_API_KEY, id=",".join(video_ids))
+            r = get_session().get(url)
             if r.status_code != 200:
-                logger.info("problem with api call for video %s", video_id)
-                return None
-            try:
-                total = data["pageInfo"]["totalResults"]
-                if total == 0:
-                    return None
-                i = data["items"][0]
-            # pylint: disable=broad-except
-            except Exception:
-            # pylint: enable=broad-except
-                print("problem getting video {}".format(video_id))
-                return None
+                logger.info("problem with api call for videos %s", video_ids)
+                return {video_id: None for video_id in video_ids}
+            items = {item["id"]: item for item in r.json().get("items", [])}
+        # pylint: disable=broad-except
+        except Exception as e:
+        # pylint: enable=broad-except
+            logger.exception(e)
+            return {video_id: None for video_id in video_ids}
+        return {video_id: items.get(video_id) for video_id in video_ids}
+
+    # pylint: disable=too-many-branches,too-many-statements
+    def populate_video_meta(self, db_video_meta, i):
+        """
+        Update AuditVideoMeta with video resource from Data API
+        :param db_video_meta: AuditVideoMeta
+        :param i: dict | None -> Video resource, None if video was not retrieved
+        :return: str | None -> Channel id of video, None if video was not retrieved
+        """
+        if i is None:
+            return None
+        try:
             db_video_meta.name = i["snippet"]["title"]
             db_video_meta.description = i["snippet"]["description"]
             try:
@@ -519,7 +597,7 @@ class Command(BaseCommand):
             if category_id:
                 if not category_id in self.categories:
                     self.categories[category_id], _ = AuditCategory.objects.get_or_create(category=category_id)
-            db_video_meta.category = self.categories[category_id]
+                db_video_meta.category = self.categories[category_id]
             try:
                 db_video_meta.views = int(i["statistics"]["viewCount"])
             # pylint: disable=broad-except
@@ -528,6 +528,33 @@ class AuditVideo(models.Model):
         except IntegrityError:
             return AuditVideo.objects.get(video_id=video_id)
 
+    @staticmethod
+    def get_or_create_many(video_ids, channel=None):
+        """
+        Get or create AuditVideo records for many video ids with bulk queries
+        :param video_ids: iterable -> Youtube video ids
+        :param channel: AuditChannel -> Channel to set on videos if provided
+        :return: dict -> video_id: AuditVideo
+        """
+        video_ids = set(video_ids)
+        db_videos = {db_video.video_id: db_video for db_video in AuditVideo.objects.filter(video_id__in=video_ids)}
+        missing = [
+            AuditVideo(video_id=video_id, video_id_hash=get_hash_name(video_id), channel=channel)
+            for video_id in video_ids - set(db_videos.keys())
+        ]
+        if missing:
+            AuditVideo.objects.bulk_create(missing, ignore_conflicts=True)
+            db_videos.update({
+                db_video.video_id: db_video
+                for db_video in AuditVideo.objects.filter(video_id__in=[db_video.video_id for db_video in missing])
+            })
+        if channel is not None:
+            to_update = [db_video for db_video in db_videos.values() if db_video.channel_id != channel.id]
+            for db_video in to_update:
+                db_video.channel = channel
+            AuditVideo.objects.bulk_update(to_update, fields=["channel"])
+        return db_videos
+
 
 class AuditVideoTranscript(models.Model):
     SOURCE_OPTIONS = {
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from audit_tool.management.commands.audit_channel_meta import Command
+from audit_tool.models import AuditChannel
+from audit_tool.models import AuditProcessor
+from audit_tool.models import AuditVideo
+from audit_tool.models import AuditVideoProcessor
+
+
+class AuditChannelMetaTestCase(TestCase):
+    databases = "__all__"
+
+    def test_update_or_create_videos(self):
+        """ Test videos and video processors of a page are created and updated with bulk queries """
+        audit = AuditProcessor.objects.create(audit_type=2, source=0, params=dict(do_videos=True))
+        channel = AuditChannel.get_or_create("channel_1")
+        existing = AuditVideo.get_or_create("video_0")
+        AuditVideoProcessor.objects.create(audit=audit, video=existing)
+        acp = MagicMock(channel=channel)
+
+        command = Command()
+        command.audit = audit
+        with self.assertNumQueries(5, using="audit"):
+            command.update_or_create_videos([f"video_{i}" for i in range(5)], acp)
+
+        db_videos = AuditVideo.objects.filter(video_id__in=[f"video_{i}" for i in range(5)])
+        self.assertEqual(db_videos.count(), 5)
+        self.assertTrue(all(db_video.channel_id == channel.id for db_video in db_videos))
+        self.assertEqual(AuditVideoProcessor.objects.filter(audit=audit).count(), 5)
+
+    def test_uploads_playlists_batched(self):
+        """ Test uploads playlists are resolved with a channels.list call per 50 channels """
+        channel_ids = [f"channel_{i}" for i in range(60)]
+
+        def get(url):
+            ids = url.split("id=")[1].split("&")[0].split("%2C")
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"items": [
+                {"id": channel_id, "contentDetails": {"relatedPlaylists": {"uploads": f"uploads_{channel_id}"}}}
+                for channel_id in ids
+            ]}
+            return response
+
+        session = MagicMock()
+        session.get.side_effect = get
+        with patch("audit_tool.management.commands.audit_channel_meta.get_session", return_value=session):
+            playlist_ids = Command().get_uploads_playlist_ids(channel_ids)
+
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(playlist_ids, {channel_id: f"uploads_{channel_id}" for channel_id in channel_ids})
@@ -0,0 +1,23 @@
+from django.test import TestCase
+
+from audit_tool.api.views.audit_export import AuditExportApiView
+from audit_tool.models import AuditCategory
+from audit_tool.models import AuditCountry
+from audit_tool.models import AuditLanguage
+
+
+class AuditExportLookupTestCase(TestCase):
+    databases = "__all__"
+
+    def test_lookup_tables(self):
+        """ Test languages, categories and countries are resolved from preloaded lookup tables """
+        language = AuditLanguage.from_string("en")
+        category = AuditCategory.objects.create(category="1", category_display_iab="Automotive")
+        country = AuditCountry.from_string("us")
+        view = AuditExportApiView()
+        with self.assertNumQueries(3, using="audit"):
+            view.load_lookup_tables()
+        with self.assertNumQueries(0, using="audit"):
+            self.assertEqual(view.get_lang(language.id), "en")
+            self.assertEqual(view.get_category(category.id), "Automotive")
+            self.assertEqual(view.get_country(country.id), "US")
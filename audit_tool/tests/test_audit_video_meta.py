@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from audit_tool.management.commands.audit_video_meta import Command
+from audit_tool.models import AuditChannelMeta
+from audit_tool.models import AuditProcessor
+from audit_tool.models import AuditVideo
+from audit_tool.models import AuditVideoMeta
+from audit_tool.models import AuditVideoProcessor
+
+
+class AuditVideoMetaTestCase(TestCase):
+    databases = "__all__"
+
+    def _get_video_resource(self, video_id, channel_id):
+        return {
+            "id": video_id,
+            "snippet": {
+                "title": f"title {video_id}",
+                "description": "description",
+                "channelId": channel_id,
+                "categoryId": "10",
+                "publishedAt": "2021-01-01T00:00:00Z",
+            },
+            "statistics": {"viewCount": "10"},
+        }
+
+    def test_videos_batched(self):
+        """ Test metadata of a batch of videos is fetched with a single Data API call """
+        audit = AuditProcessor.objects.create(audit_type=1, source=0, params=dict(audit_type_original=1))
+        db_videos = [AuditVideo.get_or_create(f"video_{i}") for i in range(3)]
+        avps = {
+            db_video.video_id: AuditVideoProcessor.objects.create(audit=audit, video=db_video)
+            for db_video in db_videos
+        }
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"items": [
+            self._get_video_resource("video_0", "channel_0"),
+            self._get_video_resource("video_1", "channel_0"),
+        ]}
+        session = MagicMock()
+        session.get.return_value = response
+
+        command = Command()
+        command.audit = audit
+        command.force_data_refresh = False
+        command.placement_list = False
+        command.db_languages = {}
+        with patch("audit_tool.management.commands.audit_video_meta.get_session", return_value=session):
+            command.do_check_video(avps)
+
+        session.get.assert_called_once()
+        self.assertIn("video_0,video_1,video_2", session.get.call_args[0][0])
+        self.assertEqual(AuditVideoMeta.objects.filter(video__in=db_videos).count(), 3)
+        self.assertEqual(AuditVideoMeta.objects.get(video=db_videos[0]).name, "title video_0")
+        self.assertEqual(AuditVideoMeta.objects.get(video=db_videos[0]).category.category, "10")
+        self.assertEqual(AuditChannelMeta.objects.filter(channel__channel_id="channel_0").count(), 1)
+        for avp in AuditVideoProcessor.objects.filter(audit=audit):
+            self.assertIsNotNone(avp.processed)
+            self.assertEqual(avp.clean, avp.video.video_id != "video_2")
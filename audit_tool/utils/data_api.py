@@ -0,0 +1,16 @@
+from threading import local
+
+import requests
+
+_thread_local = local()
+
+
+def get_session():
+    """
+    Get requests session of current thread, so that connections to the Youtube Data API are reused across calls
+    :return: requests.Session
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
@@ -1,26 +1,24 @@
 import logging
 
-import yaml
 from googleads import adwords
 from googleads import oauth2
 from googleads.common import ZeepServiceProxy
 from oauth2client.client import HttpAccessTokenRefreshError
 from suds import WebFault
 
+from utils.yaml_config import load_yaml_config
+
 logger = logging.getLogger(__name__)
 API_VERSION = "v201809"
 
 
 def load_settings():
-    with open("aw_reporting/google_ads.yaml", "r") as f:
-        conf = yaml.load(f, Loader=yaml.FullLoader)
+    conf = load_yaml_config("aw_reporting/google_ads.yaml")
     return conf.get("adwords", {})
 
 
 def load_web_app_settings():
-    with open("aw_reporting/ad_words_web.yaml", "r") as f:
-        conf = yaml.load(f, Loader=yaml.FullLoader)
-    return conf
+    return load_yaml_config("aw_reporting/ad_words_web.yaml")
 
 
 def get_customers(refresh_token, **kwargs):
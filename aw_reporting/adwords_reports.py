@@ -128,14 +128,16 @@ def _get_csv_reader(output):
 
 
 def _output_to_rows(output, fields):
+    return list(_iter_output_rows(output, fields))
+
+
+def _iter_output_rows(output, fields):
     if not output:
-        return []
+        return
     reader = _get_csv_reader(output)
     row = namedtuple("Row", fields)
-    rows = []
     for line in reader:
-        rows.append(row(*line))
-    return rows
+        yield row(*line)
 
 
 def account_performance(client, predicates=None, fields=None):
@@ -147,11 +149,12 @@ def account_performance(client, predicates=None, fields=None):
     return _output_to_rows(result, fields)
 
 
-def placement_performance_report(client, dates=None, fields=None, predicates=None):
+def placement_performance_report(client, dates=None, fields=None, predicates=None, stream=False):
     """
     Used for getting channels and managed videos
     :param client:
     :param dates:
+    :param stream: bool -> Return generator of rows read from the report stream instead of list
     :return:
     """
     fields = fields or ("AdGroupId", "Date", "Device", "Criteria", "DisplayName") \
@@ -167,6 +170,8 @@ def placement_performance_report(client, dates=None, fields=None, predicates=Non
 
     result = _get_report(client, "PLACEMENT_PERFORMANCE_REPORT", selector, date_range_type=date_range_type, )
 
+    if stream is True:
+        return _iter_output_rows(result, fields)
     return _output_to_rows(result, fields)
 
 
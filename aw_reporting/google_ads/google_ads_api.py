@@ -1,16 +1,15 @@
 import logging
 
-import yaml
 from google.ads.google_ads import oauth2
 from google.ads.google_ads.client import GoogleAdsClient
 
+from utils.yaml_config import load_yaml_config
+
 logger = logging.getLogger(__name__)
 
 
 def load_settings():
-    with open("aw_reporting/google_ads/google-ads.yaml", "r") as f:
-        conf = yaml.load(f, Loader=yaml.FullLoader)
-    return conf
+    return load_yaml_config("aw_reporting/google_ads/google-ads.yaml")
 
 
 def _get_client(*_, **settings) -> GoogleAdsClient:
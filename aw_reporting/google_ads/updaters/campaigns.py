@@ -11,6 +11,7 @@ from aw_reporting.adwords_reports import MAIN_STATISTICS_FILEDS
 from aw_reporting.adwords_reports import campaign_performance_report
 from aw_reporting.google_ads import constants
 from aw_reporting.google_ads.update_mixin import UpdateMixin
+from aw_reporting.google_ads.utils import date_to_refresh_statistic
 from aw_reporting.models import ACTION_STATUSES
 from aw_reporting.models import Account
 from aw_reporting.models import Campaign
@@ -22,6 +23,7 @@ from aw_reporting.models.ad_words.constants import get_device_id_by_name
 from aw_reporting.update.adwords_utils import format_click_types_report
 from aw_reporting.update.adwords_utils import get_base_stats
 from aw_reporting.update.adwords_utils import update_stats_with_click_type_data
+from aw_reporting.update.recalculate_de_norm_fields import refresh_flight_daily_statistics
 from utils.datetime import now_in_default_tz
 
 logger = logging.getLogger(__name__)
@@ -82,6 +84,7 @@ class CampaignUpdater(UpdateMixin):
             self.client, dates=(min_date, max_date), fields=click_type_fields, include_zero_impressions=False)
         click_type_data = format_click_types_report(click_type_report, "CampaignId", "CampaignId")
         insert_stat = []
+        campaigns_data = {}
         for row_obj in report:
             campaign_id = int(row_obj.CampaignId)
             try:
@@ -127,24 +130,46 @@ class CampaignUpdater(UpdateMixin):
                 statistic_data, click_type_data, row_obj, unique_field_name="CampaignId", ref_id_name="CampaignId")
 
             insert_stat.append(CampaignStatistic(**statistic_data))
+            # Report is segmented by device and date, keep the attributes of the latest row for each campaign
+            campaigns_data[campaign_id] = stats
 
-            try:
-                campaign = Campaign.objects.get(pk=campaign_id)
-
-                # Continue if the campaign's sync time is less than its update time, as it is pending to be synced
-                # with viewiq
-                if campaign.sync_time and campaign.sync_time < campaign.update_time:
-                    continue
-
-                for field, value in stats.items():
-                    setattr(campaign, field, value)
-                campaign.save()
-            except Campaign.DoesNotExist:
-                stats["id"] = campaign_id
-                Campaign.objects.create(**stats)
-
+        self._upsert_campaigns(campaigns_data)
         if insert_stat:
             CampaignStatistic.objects.safe_bulk_create(insert_stat)
+        # Statistics are only replaced from the earliest dropped or fetched date, so older materialized flight
+        # delivery is still valid
+        refresh_flight_daily_statistics(account_id=self.account.id,
+                                        min_date=min(min_date, date_to_refresh_statistic(today)))
+
+    def _upsert_campaigns(self, campaigns_data):
+        """
+        Create new campaigns and update existing campaigns in bulk
+        :param campaigns_data: dict -> Campaign id to Campaign field values
+        :return:
+        """
+        existing_campaigns = Campaign.objects.in_bulk(list(campaigns_data.keys()))
+        to_create = []
+        to_update = []
+        update_fields = set()
+        for campaign_id, stats in campaigns_data.items():
+            campaign = existing_campaigns.get(campaign_id)
+            if campaign is None:
+                to_create.append(Campaign(id=campaign_id, **stats))
+                continue
+            # Continue if the campaign's sync time is less than its update time, as it is pending to be synced
+            # with viewiq
+            if campaign.sync_time and campaign.sync_time < campaign.update_time:
+                continue
+            for field, value in stats.items():
+                setattr(campaign, field, value)
+            update_fields.update(stats.keys())
+            to_update.append(campaign)
+
+        with transaction.atomic():
+            if to_create:
+                Campaign.objects.bulk_create(to_create)
+            if to_update:
+                Campaign.objects.bulk_update(to_update, fields=list(update_fields), batch_size=1000)
 
     def update_hourly_campaigns(self):
         statistic_queryset = CampaignHourlyStatistic.objects.filter(
@@ -174,7 +199,7 @@ class CampaignUpdater(UpdateMixin):
         if not report:
             return
 
-        campaign_ids = list(
+        campaign_ids = set(
             self.account.campaigns.values_list("id", flat=True)
         )
         create_campaign = []
@@ -182,7 +207,7 @@ class CampaignUpdater(UpdateMixin):
         for row in report:
             campaign_id = int(row.CampaignId)
             if campaign_id not in campaign_ids:
-                campaign_ids.append(campaign_id)
+                campaign_ids.add(campaign_id)
                 try:
                     end_date = datetime.strptime(row.EndDate, constants.GET_DF)
                 except ValueError:
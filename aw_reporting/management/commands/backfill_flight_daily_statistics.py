@@ -0,0 +1,41 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from aw_reporting.models import Flight
+from aw_reporting.update.recalculate_de_norm_fields import refresh_flight_daily_statistics
+from utils.utils import chunks_generator
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Rebuild materialized FlightDailyStatistic rows in batches of flights"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--flight_ids",
+            dest="flight_ids",
+            help="Flight IDs to rebuild as a comma separated string. All flights are rebuilt if not set",
+            type=str,
+            default=None,
+        )
+        parser.add_argument(
+            "--flights_batch_size",
+            dest="flights_batch_size",
+            help="Number of flights rebuilt in each transaction",
+            type=int,
+            default=100,
+        )
+
+    def handle(self, *args, **options):
+        flight_ids_str = options.get("flight_ids")
+        queryset = Flight.objects.all()
+        if flight_ids_str is not None:
+            queryset = queryset.filter(id__in=flight_ids_str.split(","))
+        flight_ids = list(queryset.order_by("id").values_list("id", flat=True))
+        logger.info("Rebuilding daily statistics for %s flights", len(flight_ids))
+        created = 0
+        for batch in chunks_generator(flight_ids, size=options["flights_batch_size"]):
+            created += refresh_flight_daily_statistics(flight_ids=list(batch))
+        logger.info("Backfill complete. Created %s rows", created)
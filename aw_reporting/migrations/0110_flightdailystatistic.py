@@ -0,0 +1,29 @@
+# Generated by Django 3.1.7 on 2021-05-20 18:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aw_reporting', '0109_currencyexchangerate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FlightDailyStatistic',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('impressions', models.IntegerField(default=0)),
+                ('video_views', models.IntegerField(default=0)),
+                ('cost', models.FloatField(default=0)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='flight_daily_statistics', to='aw_reporting.campaign')),
+                ('flight', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_statistics', to='aw_reporting.flight')),
+            ],
+            options={
+                'unique_together': {('flight', 'campaign', 'date')},
+            },
+        ),
+    ]
@@ -582,6 +582,23 @@ class FlightStatistic(BaseModel):
     sum_cost = models.FloatField(default=0, db_index=True)
 
 
+class FlightDailyStatistic(BaseModel):
+    """
+    Materialized daily delivery of each campaign within its flight dates. Kept in sync with CampaignStatistic by
+        aw_reporting.update.recalculate_de_norm_fields so pacing reports do not have to aggregate the raw statistics
+    """
+    flight = models.ForeignKey(Flight, related_name="daily_statistics", on_delete=models.CASCADE)
+    campaign = models.ForeignKey("aw_reporting.Campaign", related_name="flight_daily_statistics",
+                                 on_delete=models.CASCADE)
+    date = models.DateField()
+    impressions = models.IntegerField(default=0)
+    video_views = models.IntegerField(default=0)
+    cost = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = (("flight", "campaign", "date"),)
+
+
 class Activity(BaseModel):
     id = models.CharField(max_length=20, primary_key=True)
     owner = models.ForeignKey(User, related_name="activities", on_delete=models.CASCADE, db_index=True)
@@ -3,3 +3,9 @@ import enum
 
 class PacingReportPeriod(enum.Enum):
     MONTH = "month"
+
+
+class PacingReportDailyStatsMode:
+    RAW = "raw"
+    MATERIALIZED = "materialized"
+    COMPARE = "compare"
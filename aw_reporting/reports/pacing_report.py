@@ -5,8 +5,10 @@ from datetime import date
 from datetime import timedelta
 from distutils.util import strtobool
 from math import ceil
+import logging
 import statistics
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db.models import Case
 from django.db.models import Count
@@ -19,14 +21,15 @@ from django.db.models import When
 from django.http import QueryDict
 from django.utils import timezone
 
+from .constants import PacingReportDailyStatsMode
 from .constants import PacingReportPeriod
 from aw_reporting.calculations.margin import get_margin_from_flights
 from aw_reporting.calculations.margin import get_minutes_run_and_total_minutes
 from aw_reporting.models import Account
 from aw_reporting.models import Alert
 from aw_reporting.models import Campaign
-from aw_reporting.models import CampaignStatistic
 from aw_reporting.models import Flight
+from aw_reporting.models import FlightDailyStatistic
 from aw_reporting.models import OpPlacement
 from aw_reporting.models import Opportunity
 from aw_reporting.models import dict_add_calculated_stats
@@ -46,8 +49,13 @@ from aw_reporting.models.salesforce_constants import FlightAlert
 from aw_reporting.models.salesforce_constants import OpportunityConfig
 from aw_reporting.models.salesforce_constants import PlacementAlert
 from aw_reporting.update.recalculate_de_norm_fields import FLIGHTS_DELIVERY_ANNOTATE
+from aw_reporting.update.recalculate_de_norm_fields import FLIGHT_DAILY_STATISTIC_FLIGHT_REF
+from aw_reporting.update.recalculate_de_norm_fields import aggregate_flight_daily_statistics
 from aw_reporting.utils import get_dates_range
 from utils.datetime import now_in_default_tz
+from utils.lang import almost_equal
+
+logger = logging.getLogger(__name__)
 
 
 class PacingReportChartId:
@@ -527,6 +535,10 @@ class PacingReport:
         for p in placements_data:
             all_placements[p[placement_opp_key]].append(p)
 
+        accounts_data = get_accounts_performance_data(
+            {aw_id for o in opportunities for aw_id in get_opportunity_account_ids(o)}
+        )
+
         # prepare response
         for o in opportunities:
             today = self.today
@@ -595,10 +607,10 @@ class PacingReport:
                 o["cpm_buffer"] = (self.goal_factor - 1) * 100 if o["cpm_buffer"] is None else o["cpm_buffer"]
                 o["cpv_buffer"] = (self.goal_factor - 1) * 100 if o["cpv_buffer"] is None else o["cpv_buffer"]
 
-            try:
-                o["timezone"] = Account.objects.filter(id__in=o["aw_cid"].split(",")).first().managers.first().timezone
-            except AttributeError:
-                o["timezone"] = None
+            # Get account performance with Opportunity.aw_cid
+            aw_ids = get_opportunity_account_ids(o)
+            accounts = [accounts_data[aw_id] for aw_id in sorted(aw_ids) if aw_id in accounts_data]
+            o["timezone"] = accounts[0]["timezone"] if accounts else None
 
             alerts = []
             margin = o["margin"]
@@ -616,17 +628,14 @@ class PacingReport:
             except TypeError:
                 pass
             o["alerts"] = alerts
-            # Get account performance with Opportunity.aw_cid
-            aw_ids = o["aw_cid"].split(",") if o["aw_cid"] else []
-            accounts = Account.objects.filter(id__in=aw_ids)
             try:
-                o["active_view_viewability"] = statistics.mean(a.active_view_viewability for a in accounts)
+                o["active_view_viewability"] = statistics.mean(a["active_view_viewability"] for a in accounts)
             except (statistics.StatisticsError, TypeError):
                 o["active_view_viewability"] = None
 
             try:
                 o["video_completion_rates"] = {
-                    f"completion_{rate}": statistics.mean(a.get_video_completion_rate(rate) for a in accounts)
+                    f"completion_{rate}": statistics.mean(a["completion_rates"][rate] for a in accounts)
                     for rate in {25, 50, 75, 100}
                 }
             except (statistics.StatisticsError, TypeError, IndexError):
@@ -888,19 +897,7 @@ class PacingReport:
         today = timezone.now().date()
         flights_data = self.get_flights_data(placement=placement)
         populate_daily_delivery_data(flights_data)
-
-        id_field = "campaign__salesforce_placement__flights__id"
-        campaign_stats_qs = CampaignStatistic.objects.filter(
-            date=self.yesterday - timedelta(days=1),
-            date__gte=F("campaign__salesforce_placement__flights__start"),
-            date__lte=F("campaign__salesforce_placement__flights__end"),
-            campaign__salesforce_placement=placement)
-        all_aw_before_yesterday_stats = campaign_stats_qs \
-            .values(id_field) \
-            .order_by(id_field) \
-            .annotate(**get_flight_delivery_annotate(("sum_video_views", "sum_impressions", "sum_cost"), ))
-        all_aw_before_yesterday_stats = {i[id_field]: i for i in
-                                         all_aw_before_yesterday_stats}
+        before_yesterday = self.yesterday - timedelta(days=1)
 
         flights = []
         for f in flights_data:
@@ -928,8 +925,7 @@ class PacingReport:
                                                             flight["current_cost_limit"])
 
             # chart data
-            before_yesterday_stats = all_aw_before_yesterday_stats.get(f["id"],
-                                                                       {})
+            before_yesterday_stats = get_day_delivery_stats(f["daily_delivery"], before_yesterday)
             chart_data = get_chart_data(
                 flights=[f],
                 today=self.today,
@@ -1098,6 +1094,53 @@ def get_stats_from_flight(flight, start=None, end=None, campaign_id=None):
     return delivery
 
 
+def get_opportunity_account_ids(opportunity: dict) -> set:
+    """
+    Get Account ids from Opportunity aw_cid value
+    :param opportunity: dict -> Opportunity values with cleaned aw_cid
+    :return: set
+    """
+    aw_cid = opportunity.get("aw_cid") or ""
+    aw_ids = {int(aw_id) for aw_id in aw_cid.split(",") if aw_id.strip().isdigit()}
+    return aw_ids
+
+
+def get_accounts_performance_data(account_ids: set) -> dict:
+    """
+    Get performance data for many Accounts with one query for accounts and one query for their managers
+    Each account timezone is the timezone of its first manager
+    :param account_ids: set
+    :return: dict -> Mapping of account id to account performance data
+    """
+    if not account_ids:
+        return {}
+    accounts_data = {}
+    accounts = Account.objects.filter(id__in=account_ids).values(
+        "id", "impressions", "active_view_viewability",
+        *(f"video_views_{rate}_quartile" for rate in (25, 50, 75, 100)),
+    )
+    for account in accounts:
+        impressions = account["impressions"]
+        accounts_data[account["id"]] = {
+            "timezone": None,
+            "active_view_viewability": account["active_view_viewability"],
+            "completion_rates": {
+                rate: account[f"video_views_{rate}_quartile"] / impressions if impressions else None
+                for rate in (25, 50, 75, 100)
+            },
+        }
+    managers = Account.managers.through.objects \
+        .filter(from_account_id__in=accounts_data.keys()) \
+        .order_by("from_account_id", "to_account_id") \
+        .values_list("from_account_id", "to_account__timezone")
+    seen = set()
+    for account_id, timezone_name in managers:
+        if account_id not in seen:
+            accounts_data[account_id]["timezone"] = timezone_name
+            seen.add(account_id)
+    return accounts_data
+
+
 def get_today_goal(goal_items, delivered_items, end, today):
     goal = 0
     days_left = (end - today).days + 1 if end else 0
@@ -1109,6 +1152,16 @@ def get_today_goal(goal_items, delivered_items, end, today):
 
 
 def get_yesterday_delivery(flights, today):
+    mode = settings.PACING_REPORT_DAILY_STATS_MODE
+    if mode == PacingReportDailyStatsMode.MATERIALIZED:
+        return _get_materialized_yesterday_delivery(flights, today)
+    yesterday_delivery = _get_raw_yesterday_delivery(flights, today)
+    if mode == PacingReportDailyStatsMode.COMPARE:
+        _compare_yesterday_delivery(yesterday_delivery, _get_materialized_yesterday_delivery(flights, today))
+    return yesterday_delivery
+
+
+def _get_raw_yesterday_delivery(flights, today):
     yesterday = today - timedelta(days=1)
     flight_ids = [flight["id"] for flight in flights]
     flights_yesterday_delivery = Flight.objects.filter(
@@ -1154,6 +1207,57 @@ def get_yesterday_delivery(flights, today):
     return {flight["id"]: flight for flight in flights_yesterday_delivery}
 
 
+def _get_materialized_yesterday_delivery(flights, today):
+    """
+    Get yesterday delivery from FlightDailyStatistic
+        Flights without delivery yesterday are omitted as they are only delivered zero values by the raw query
+    """
+    yesterday = today - timedelta(days=1)
+    flight_ids = [flight["id"] for flight in flights]
+    flights_yesterday_delivery = FlightDailyStatistic.objects.filter(
+        flight_id__in=flight_ids,
+        date=yesterday,
+    ).values("flight_id").order_by("flight_id").annotate(
+        yesterday_cost=Sum("cost"),
+        yesterday_delivery=Sum(
+            Case(
+                When(
+                    flight__placement__goal_type_id=Value(SalesForceGoalType.CPM),
+                    then=F("impressions"),
+                ),
+                When(
+                    flight__placement__goal_type_id=Value(SalesForceGoalType.CPV),
+                    then=F("video_views"),
+                ),
+                When(
+                    flight__placement__dynamic_placement__in=[
+                        DynamicPlacementType.BUDGET,
+                        DynamicPlacementType.RATE_AND_TECH_FEE],
+                    then=F("cost"),
+                ),
+                output_field=FloatField(),
+            ),
+        ),
+    )
+    return {
+        item["flight_id"]: dict(id=item["flight_id"], yesterday_cost=item["yesterday_cost"],
+                                yesterday_delivery=item["yesterday_delivery"])
+        for item in flights_yesterday_delivery
+    }
+
+
+def _compare_yesterday_delivery(raw_delivery, materialized_delivery):
+    keys = ("yesterday_cost", "yesterday_delivery")
+    mismatched_ids = [
+        flight_id for flight_id in set(raw_delivery) | set(materialized_delivery)
+        if any(not almost_equal(raw_delivery.get(flight_id, {}).get(key) or 0,
+                                materialized_delivery.get(flight_id, {}).get(key) or 0)
+               for key in keys)
+    ]
+    if mismatched_ids:
+        logger.warning("Materialized yesterday delivery mismatch for flights: %s", sorted(mismatched_ids))
+
+
 # pylint: disable=too-many-locals
 def get_chart_data(*_, flights, today, before_yesterday_stats=None,
                    allocation_ko=1, campaign_id=None, cpm_buffer=0, cpv_buffer=0):
@@ -1516,30 +1620,80 @@ def get_delivery_field_name(flight_dict):
 
 
 def populate_daily_delivery_data(flights):
+    mode = settings.PACING_REPORT_DAILY_STATS_MODE
+    if mode == PacingReportDailyStatsMode.MATERIALIZED:
+        daily_delivery = _get_materialized_daily_delivery(flights)
+    else:
+        daily_delivery = _get_raw_daily_delivery(flights)
+        if mode == PacingReportDailyStatsMode.COMPARE:
+            _compare_daily_delivery([fl["id"] for fl in flights], daily_delivery,
+                                    _get_materialized_daily_delivery(flights))
+    for fl in flights:
+        fl["daily_delivery"] = daily_delivery[fl["id"]]
+
+
+def get_day_delivery_stats(daily_delivery, date):
+    """
+    Sum flight daily delivery of all campaigns on date
+    :param daily_delivery: list -> Daily delivery rows set by populate_daily_delivery_data
+    :param date: date
+    :return: dict -> Empty if the flight has no delivery on date
+    """
+    rows = [row for row in daily_delivery if row["date"] == date]
+    if not rows:
+        return {}
+    stats = dict(
+        sum_video_views=sum(row["video_views"] or 0 for row in rows),
+        sum_impressions=sum(row["impressions"] or 0 for row in rows),
+        sum_cost=sum(row["cost"] or 0 for row in rows),
+    )
+    return stats
+
+
+def _get_raw_daily_delivery(flights):
     placement_ids = set(f["placement_id"] for f in flights)
-    campaign_stats_qs = CampaignStatistic.objects.filter(
-        date__gte=F("campaign__salesforce_placement__flights__start"),
-        date__lte=F("campaign__salesforce_placement__flights__end"),
-        campaign__salesforce_placement_id__in=placement_ids)
-    fl_id_field = "campaign__salesforce_placement__flights__id"
-    raw_aw_daily_stats = campaign_stats_qs \
-        .values(fl_id_field, "campaign_id", "date") \
-        .order_by(fl_id_field, "campaign_id", "date") \
-        .annotate(**{k: v for k, v in get_flight_delivery_annotate().items()
-                     if k in ("sum_video_views", "sum_impressions", "sum_cost")}
-                  )
+    raw_aw_daily_stats = aggregate_flight_daily_statistics(campaign__salesforce_placement_id__in=placement_ids)
     all_aw_daily_stats = defaultdict(list)
-    for row in raw_aw_daily_stats:
-        all_aw_daily_stats[row[fl_id_field]].append(row)
-
-    for fl in flights:
-        fl["daily_delivery"] = [
-            dict(
-                date=e["date"], campaign_id=e["campaign_id"],
-                cost=e["sum_cost"], impressions=e["sum_impressions"],
-                video_views=e["sum_video_views"],
-            ) for e in all_aw_daily_stats[fl["id"]]
-        ]
+    for e in raw_aw_daily_stats:
+        all_aw_daily_stats[e[FLIGHT_DAILY_STATISTIC_FLIGHT_REF]].append(dict(
+            date=e["date"], campaign_id=e["campaign_id"],
+            cost=e["sum_cost"], impressions=e["sum_impressions"],
+            video_views=e["sum_video_views"],
+        ))
+    return all_aw_daily_stats
+
+
+def _get_materialized_daily_delivery(flights):
+    flight_ids = [f["id"] for f in flights]
+    daily_stats = FlightDailyStatistic.objects \
+        .filter(flight_id__in=flight_ids) \
+        .order_by("flight_id", "campaign_id", "date") \
+        .values("flight_id", "date", "campaign_id", "cost", "impressions", "video_views")
+    all_daily_stats = defaultdict(list)
+    for e in daily_stats:
+        flight_id = e.pop("flight_id")
+        all_daily_stats[flight_id].append(e)
+    return all_daily_stats
+
+
+def _compare_daily_delivery(flight_ids, raw_delivery, materialized_delivery):
+    def is_equal(raw_rows, materialized_rows):
+        if len(raw_rows) != len(materialized_rows):
+            return False
+        for raw, materialized in zip(raw_rows, materialized_rows):
+            if (raw["date"], raw["campaign_id"]) != (materialized["date"], materialized["campaign_id"]):
+                return False
+            if any(not almost_equal(raw[key] or 0, materialized[key] or 0)
+                   for key in ("cost", "impressions", "video_views")):
+                return False
+        return True
+
+    mismatched_ids = [
+        flight_id for flight_id in flight_ids
+        if not is_equal(raw_delivery.get(flight_id, []), materialized_delivery.get(flight_id, []))
+    ]
+    if mismatched_ids:
+        logger.warning("Materialized daily delivery mismatch for flights: %s", sorted(mismatched_ids))
 
 
 def get_flight_delivery_annotate(fields=None):
@@ -3,19 +3,22 @@ import os
 from itertools import chain
 
 import requests
-import yaml
 from simple_salesforce import Salesforce
 
 from aw_reporting.models import SalesforceFields
 from aw_reporting.models.salesforce import Activity
 from utils.datetime import now_in_default_tz
+from utils.yaml_config import load_yaml_config
 
 logger = logging.getLogger(__name__)
 
 
+def load_settings():
+    return load_yaml_config("aw_reporting/salesforce.yaml")
+
+
 def sf_auth():
-    with open("aw_reporting/salesforce.yaml", "r") as f:
-        conf = yaml.load(f, Loader=yaml.FullLoader)
+    conf = load_settings()
     res = requests.post(
         "https://login.salesforce.com/services/oauth2/token",
         {
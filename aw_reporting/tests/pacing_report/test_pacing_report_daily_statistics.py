@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from aw_reporting.models import Account
+from aw_reporting.models import Campaign
+from aw_reporting.models import CampaignStatistic
+from aw_reporting.models import Flight
+from aw_reporting.models import FlightDailyStatistic
+from aw_reporting.models import OpPlacement
+from aw_reporting.models import Opportunity
+from aw_reporting.models import SalesForceGoalType
+from aw_reporting.reports.constants import PacingReportDailyStatsMode
+from aw_reporting.reports.pacing_report import get_yesterday_delivery
+from aw_reporting.reports.pacing_report import populate_daily_delivery_data
+from aw_reporting.update.recalculate_de_norm_fields import refresh_flight_daily_statistics
+from aw_reporting.update.update_salesforce_data import match_using_placement_numbers
+from utils.datetime import now_in_default_tz
+from utils.unittests.test_case import ExtendedAPITestCase
+
+
+class PacingReportDailyStatisticsTestCase(ExtendedAPITestCase):
+    def setUp(self):
+        self.today = now_in_default_tz().date()
+        opportunity = Opportunity.objects.create(id="1", name="", start=self.today - timedelta(days=10),
+                                                 end=self.today, probability=100)
+        placement = OpPlacement.objects.create(id="1", name="", opportunity=opportunity,
+                                               goal_type_id=SalesForceGoalType.CPM)
+        self.flight = Flight.objects.create(id="1", name="", placement=placement, ordered_units=1000,
+                                            start=self.today - timedelta(days=5), end=self.today - timedelta(days=1))
+        self.account = Account.objects.create(id=1)
+        self.campaign_1 = Campaign.objects.create(id=1, account=self.account, salesforce_placement=placement)
+        self.campaign_2 = Campaign.objects.create(id=2, account=self.account, salesforce_placement=placement)
+        # Stats outside of flight dates and multiple devices on the same day
+        for days_ago in range(7):
+            date = self.today - timedelta(days=days_ago)
+            for device_id in range(2):
+                CampaignStatistic.objects.create(campaign=self.campaign_1, date=date, device_id=device_id,
+                                                 impressions=days_ago + 10, video_views=days_ago, cost=days_ago * .3)
+            CampaignStatistic.objects.create(campaign=self.campaign_2, date=date, impressions=days_ago * 2,
+                                             video_views=1, cost=.1)
+
+    def _get_flights(self):
+        return [dict(id=self.flight.id, placement_id=self.flight.placement_id)]
+
+    def _get_daily_delivery(self, mode):
+        flights = self._get_flights()
+        with override_settings(PACING_REPORT_DAILY_STATS_MODE=mode):
+            populate_daily_delivery_data(flights)
+            yesterday_delivery = get_yesterday_delivery(flights, self.today)
+        return flights[0]["daily_delivery"], yesterday_delivery
+
+    def test_materialized_parity(self):
+        """ Test materialized daily delivery matches the raw CampaignStatistic aggregation """
+        refresh_flight_daily_statistics(account_id=self.account.id)
+        self.assertEqual(FlightDailyStatistic.objects.count(), 10)
+
+        raw_daily, raw_yesterday = self._get_daily_delivery(PacingReportDailyStatsMode.RAW)
+        materialized_daily, materialized_yesterday = self._get_daily_delivery(PacingReportDailyStatsMode.MATERIALIZED)
+        self.assertEqual(len(raw_daily), len(materialized_daily))
+        for raw, materialized in zip(raw_daily, materialized_daily):
+            self.assertEqual(raw["date"], materialized["date"])
+            self.assertEqual(raw["campaign_id"], materialized["campaign_id"])
+            self.assertEqual(raw["impressions"], materialized["impressions"])
+            self.assertEqual(raw["video_views"], materialized["video_views"])
+            self.assertAlmostEqual(raw["cost"], materialized["cost"])
+        self.assertEqual(raw_yesterday[self.flight.id]["yesterday_delivery"],
+                         materialized_yesterday[self.flight.id]["yesterday_delivery"])
+        self.assertAlmostEqual(raw_yesterday[self.flight.id]["yesterday_cost"],
+                               materialized_yesterday[self.flight.id]["yesterday_cost"])
+
+    def test_compare_mode_logs_mismatch(self):
+        """ Test compare mode serves raw data and logs stale materialized rows """
+        refresh_flight_daily_statistics(account_id=self.account.id)
+        FlightDailyStatistic.objects.filter(date=self.today - timedelta(days=1)).update(impressions=0)
+
+        with self.assertLogs("aw_reporting.reports.pacing_report", level="WARNING") as logs:
+            daily, _ = self._get_daily_delivery(PacingReportDailyStatsMode.COMPARE)
+        self.assertEqual(len(logs.output), 2)
+        self.assertTrue(all(row["impressions"] > 0 for row in daily))
+
+    def test_incremental_refresh(self):
+        """ Test refreshing from a date only replaces rows on or after the date """
+        refresh_flight_daily_statistics(account_id=self.account.id)
+        min_date = self.today - timedelta(days=2)
+        CampaignStatistic.objects.filter(campaign=self.campaign_2).update(impressions=100)
+
+        refresh_flight_daily_statistics(account_id=self.account.id, min_date=min_date)
+        campaign_2_rows = FlightDailyStatistic.objects.filter(campaign=self.campaign_2)
+        self.assertEqual(
+            set(campaign_2_rows.filter(date__gte=min_date).values_list("impressions", flat=True)), {100})
+        self.assertNotIn(100, set(campaign_2_rows.filter(date__lt=min_date).values_list("impressions", flat=True)))
+        self.assertEqual(FlightDailyStatistic.objects.count(), 10)
+
+    def test_flight_refresh_removes_unlinked_campaigns(self):
+        """ Test refreshing a flight removes rows of campaigns no longer in its placement """
+        refresh_flight_daily_statistics(account_id=self.account.id)
+        Campaign.objects.filter(id=self.campaign_2.id).update(salesforce_placement=None)
+
+        refresh_flight_daily_statistics(flight_ids=[self.flight.id])
+        self.assertEqual(
+            set(FlightDailyStatistic.objects.values_list("campaign_id", flat=True)), {self.campaign_1.id})
+
+    def test_backfill_command(self):
+        """ Test backfill command rebuilds rows of all flights """
+        FlightDailyStatistic.objects.create(flight=self.flight, campaign=self.campaign_1, date=self.today,
+                                            impressions=1)
+        call_command("backfill_flight_daily_statistics", flights_batch_size=1)
+        self.assertEqual(FlightDailyStatistic.objects.count(), 10)
+        self.assertFalse(FlightDailyStatistic.objects.filter(date=self.today).exists())
+
+    def test_placement_number_match_changes(self):
+        """ Test placements of campaigns linked or unlinked by placement numbers are returned """
+        OpPlacement.objects.filter(id=self.flight.placement_id).update(number="PL1")
+        Campaign.objects.filter(id=self.campaign_1.id).update(placement_code="PL1")
+        Campaign.objects.filter(id=self.campaign_2.id).update(placement_code="PL2")
+        self.assertEqual(match_using_placement_numbers(), {self.flight.placement_id})
+        self.assertEqual(match_using_placement_numbers(), set())
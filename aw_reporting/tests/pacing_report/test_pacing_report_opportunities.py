@@ -497,3 +497,37 @@ class PacingReportOpportunitiesTestCase(ExtendedAPITestCase):
         report = PacingReport()
         opportunities = report.get_opportunities({})
         self.assertAlmostEqual(opportunities[0]["margin_curr_month"], expected_margin)
+
+    def test_account_performance(self):
+        """ Test opportunity timezone and account metrics are calculated from aw_cid accounts """
+        today = now_in_default_tz().date()
+        manager = Account.objects.create(id=next(int_iterator), timezone="America/Los_Angeles")
+        account_1 = Account.objects.create(id=next(int_iterator), impressions=100, active_view_viewability=20,
+                                           video_views_25_quartile=80, video_views_50_quartile=60,
+                                           video_views_75_quartile=40, video_views_100_quartile=20)
+        account_2 = Account.objects.create(id=next(int_iterator), impressions=100, active_view_viewability=40,
+                                           video_views_25_quartile=60, video_views_50_quartile=40,
+                                           video_views_75_quartile=20, video_views_100_quartile=10)
+        account_1.managers.add(manager)
+        opportunity = Opportunity.objects.create(
+            id=next(int_iterator), name="", start=today, end=today, probability=100,
+            aw_cid=f"{account_1.id},{account_2.id}",
+        )
+        placement = OpPlacement.objects.create(id=next(int_iterator), opportunity=opportunity)
+        Campaign.objects.create(id=next(int_iterator), account=account_1, salesforce_placement=placement)
+
+        report = PacingReport()
+        opportunities = report.get_opportunities({})
+        self.assertEqual(len(opportunities), 1)
+        data = opportunities[0]
+        self.assertEqual(data["timezone"], manager.timezone)
+        self.assertAlmostEqual(data["active_view_viewability"], 30)
+        expected_completion_rates = {
+            "completion_25": .7,
+            "completion_50": .5,
+            "completion_75": .3,
+            "completion_100": .15,
+        }
+        self.assertEqual(set(data["video_completion_rates"].keys()), set(expected_completion_rates.keys()))
+        for key, value in expected_completion_rates.items():
+            self.assertAlmostEqual(data["video_completion_rates"][key], value)
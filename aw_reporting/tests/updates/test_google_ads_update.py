@@ -10,9 +10,11 @@ from unittest.mock import patch
 
 from django.core import mail
 from django.db import Error
+from django.db import connection
 from django.db.backends.utils import CursorWrapper
 from django.test import TestCase
 from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from google.auth.exceptions import RefreshError
 from googleads.errors import AdWordsReportBadRequestError
 from pytz import timezone
@@ -823,6 +825,24 @@ class UpdateAwAccountsTestCase(BaseUpdateAwTestCase, TestCase):
             self.assertFalse(getattr(campaign, field), "Campaign. {}".format(field))
             self.assertFalse(getattr(ad_group, field), "Ad Group. {}".format(field))
 
+    def test_de_norm_queries_do_not_scale_with_items(self):
+        now = datetime(2018, 1, 1, 15, tzinfo=utc)
+        yesterday = now.date() - timedelta(days=1)
+
+        def count_queries(campaigns_count):
+            account = self._create_account(now)
+            for _ in range(campaigns_count):
+                campaign = Campaign.objects.create(id=next(int_iterator), account=account)
+                for _ in range(2):
+                    ad_group = AdGroup.objects.create(id=next(int_iterator), campaign=campaign)
+                    YTVideoStatistic.objects.create(date=yesterday, ad_group=ad_group, yt_id="")
+            with CaptureQueriesContext(connection) as context:
+                recalculate_de_norm_fields_for_account(account.id, with_counts=False)
+            self.assertTrue(all(Campaign.objects.filter(account=account).values_list("has_videos", flat=True)))
+            return len(context.captured_queries)
+
+        self.assertEqual(count_queries(1), count_queries(5))
+
     def test_first_ad_group_update_requests_report_by_yesterday(self):
         now = datetime(2018, 1, 1, 15, tzinfo=utc)
         today = now.date()
@@ -1189,6 +1209,56 @@ class UpdateAwAccountsTestCase(BaseUpdateAwTestCase, TestCase):
         self.assertAlmostEqual(campaign.budget, test_budget)
         self.assertEqual(campaign.budget_type, BudgetType.TOTAL.value)
 
+    def test_upsert_campaigns_per_campaign(self):
+        now = datetime(2018, 1, 1, 15, tzinfo=utc)
+        today = now.date()
+        account = self._create_account(now)
+        synced_campaign = Campaign.objects.create(id=next(int_iterator), account=account, name="synced",
+                                                  sync_time=datetime.now(tz=utc) + timedelta(days=5))
+        pending_campaign = Campaign.objects.create(id=next(int_iterator), account=account, name="pending",
+                                                   sync_time=datetime.now(tz=utc) - timedelta(days=5))
+        new_campaign_id = next(int_iterator)
+        test_statistic_data = [
+            dict(
+                CampaignId=str(campaign_id),
+                CampaignName=f"{campaign_id} updated",
+                Cost=1 * 10 ** 6,
+                Date=str(today - timedelta(days=days_ago)),
+                StartDate=str(today - timedelta(days=5)),
+                EndDate=str(today + timedelta(days=5)),
+                Amount=1 * 10 ** 6,
+                TotalAmount="--",
+                Impressions=1,
+                VideoViews=1,
+                Clicks=1,
+                Device=device_str(device_id),
+                BiddingStrategyType="cpv",
+                ActiveViewViewability="0%",
+            )
+            for campaign_id in (synced_campaign.id, pending_campaign.id, new_campaign_id)
+            for days_ago in (1, 2)
+            for device_id in (Device.COMPUTER, Device.MOBILE)
+        ]
+        statistic_fields = CAMPAIGN_PERFORMANCE_REPORT_FIELDS + ("Device", "Date")
+        test_stream_statistic = build_csv_byte_stream(statistic_fields, test_statistic_data)
+        aw_client_mock = MagicMock()
+        downloader_mock = aw_client_mock.GetReportDownloader()
+
+        downloader_mock.DownloadReportAsStream.return_value = test_stream_statistic
+        with patch_now(now), \
+             patch("aw_reporting.google_ads.google_ads_updater.get_web_app_client", return_value=aw_client_mock), \
+             patch.object(BaseQueryset, "safe_bulk_create", wraps=patch_safe_bulk_create), \
+             patch.object(Campaign, "save") as save_mock:
+            GoogleAdsUpdater(account).update_campaigns()
+
+        save_mock.assert_not_called()
+        synced_campaign.refresh_from_db()
+        pending_campaign.refresh_from_db()
+        self.assertEqual(synced_campaign.name, f"{synced_campaign.id} updated")
+        self.assertEqual(pending_campaign.name, "pending")
+        self.assertEqual(Campaign.objects.get(id=new_campaign_id).name, f"{new_campaign_id} updated")
+        self.assertEqual(CampaignStatistic.objects.filter(campaign__account=account).count(), 12)
+
     def test_account_name_limit(self):
         """
         Ticket: https://channelfactory.atlassian.net/browse/VIQ-1163
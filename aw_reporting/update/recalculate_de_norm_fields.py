@@ -3,6 +3,7 @@ from collections import defaultdict
 from functools import reduce
 
 from django.conf import settings
+from django.db import transaction
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.db.models import Avg
 from django.db.models import Case
@@ -26,7 +27,9 @@ from aw_reporting.models import Account
 from aw_reporting.models import AdGroup
 from aw_reporting.models import AudienceStatistic
 from aw_reporting.models import Campaign
+from aw_reporting.models import CampaignStatistic
 from aw_reporting.models import Flight
+from aw_reporting.models import FlightDailyStatistic
 from aw_reporting.models import FlightStatistic
 from aw_reporting.models import KeywordStatistic
 from aw_reporting.models import RemarkStatistic
@@ -38,6 +41,7 @@ from aw_reporting.models.salesforce_constants import DynamicPlacementType
 from aw_reporting.models.salesforce_constants import SalesForceGoalType
 from utils.lang import flatten
 from utils.lang import pick_dict
+from utils.utils import chunks_generator
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +49,15 @@ MODELS_WITH_ACCOUNT_ID_REF = (
     (Campaign, "account_id"),
     (AdGroup, "campaign__account_id"),
 )
+HAS_STATISTICS_MODELS = (
+    ("has_interests", AudienceStatistic),
+    ("has_keywords", KeywordStatistic),
+    ("has_channels", YTChannelStatistic),
+    ("has_videos", YTVideoStatistic),
+    ("has_remarketing", RemarkStatistic),
+    ("has_topics", TopicStatistic),
+)
+FLIGHT_DAILY_STATISTIC_FLIGHT_REF = "campaign__salesforce_placement__flights__id"
 
 
 def recalculate_de_norm_fields_for_account(account_id: Account.id, with_counts=True):
@@ -104,25 +117,7 @@ def _recalculate_de_norm_fields_for_account_campaigns_and_groups(account_id):
             defaultdict(dict)
         )
 
-        if model is Campaign:
-            ad_group_ids_map = AdGroup.objects.filter(campaign_id__in=items_ids) \
-                .values("campaign_id").order_by("campaign_id").annotate(ids=ArrayAgg("id"))
-            ad_group_ids_map = {item.get("campaign_id"): item.get("ids") for item in ad_group_ids_map}
-        else:
-            ad_group_ids_map = {_id: [_id] for _id in items_ids}
-
-        aggregated_data = {}
-
-        for key, ids in ad_group_ids_map.items():
-            _item_filter = {"ad_group_id__in": ids}
-            aggregated_data[key] = {}
-
-            aggregated_data[key]["has_interests"] = AudienceStatistic.objects.filter(**_item_filter).exists()
-            aggregated_data[key]["has_keywords"] = KeywordStatistic.objects.filter(**_item_filter).exists()
-            aggregated_data[key]["has_channels"] = YTChannelStatistic.objects.filter(**_item_filter).exists()
-            aggregated_data[key]["has_videos"] = YTVideoStatistic.objects.filter(**_item_filter).exists()
-            aggregated_data[key]["has_remarketing"] = RemarkStatistic.objects.filter(**_item_filter).exists()
-            aggregated_data[key]["has_topics"] = TopicStatistic.objects.filter(**_item_filter).exists()
+        has_statistics_map = _get_has_statistics_map(model, items_ids)
 
         update = {}
         for i in data:
@@ -137,11 +132,37 @@ def _recalculate_de_norm_fields_for_account_campaigns_and_groups(account_id):
                 **sum_statistic_map.get(uid, {}),
                 **avg_statistic_map.get(uid, {}),
                 **stats_by_id[uid],
-                **aggregated_data.get(uid, {}),
+                **has_statistics_map.get(uid, {}),
             )
 
-        for uid, updates in update.items():
-            model.objects.filter(id=uid).update(**updates)
+        update_fields = set(field for updates in update.values() for field in updates)
+        update_fields.discard("id")
+        to_update = [model(id=uid, **pick_dict(updates, update_fields)) for uid, updates in update.items()]
+        if to_update:
+            model.objects.bulk_update(to_update, fields=list(update_fields), batch_size=1000)
+
+
+def _get_has_statistics_map(model, items_ids):
+    """
+    Get has_* flags for all items with a single grouped query per statistics table
+    :param model: Campaign or AdGroup
+    :param items_ids: list -> Ids of model items
+    :return: dict -> Item id to has_* flags
+    """
+    item_ref = "ad_group__campaign_id" if model is Campaign else "ad_group_id"
+    has_statistics_map = {
+        uid: {field: False for field, _ in HAS_STATISTICS_MODELS}
+        for uid in items_ids
+    }
+    for field, statistic_model in HAS_STATISTICS_MODELS:
+        ids_with_statistics = statistic_model.objects \
+            .filter(**{f"{item_ref}__in": items_ids}) \
+            .order_by() \
+            .values_list(item_ref, flat=True) \
+            .distinct()
+        for uid in ids_with_statistics:
+            has_statistics_map[uid][field] = True
+    return has_statistics_map
 
 
 def _recalculate_de_norm_fields_for_account_statistics(account_id):
@@ -336,3 +357,66 @@ def _recalculate_de_norm_fields_for_account_flights(account_id):
             flight_id=flight["id"],
             defaults=defaults
         )
+
+
+def aggregate_flight_daily_statistics(*args, **kwargs):
+    """
+    Aggregate CampaignStatistic into daily delivery of each campaign within its flight dates
+    :param args: Q filters applied to CampaignStatistic
+    :param kwargs: filters applied to CampaignStatistic
+    :return: QuerySet of dicts ordered by flight, campaign, date
+    """
+    # Flight filters must be applied in the same filter call as the flight dates to share the flights join
+    stats = CampaignStatistic.objects.filter(
+        *args,
+        date__gte=F("campaign__salesforce_placement__flights__start"),
+        date__lte=F("campaign__salesforce_placement__flights__end"),
+        **kwargs,
+    )
+    return stats \
+        .values(FLIGHT_DAILY_STATISTIC_FLIGHT_REF, "campaign_id", "date") \
+        .order_by(FLIGHT_DAILY_STATISTIC_FLIGHT_REF, "campaign_id", "date") \
+        .annotate(
+            sum_video_views=Sum("video_views"),
+            sum_cost=Sum("cost"),
+            sum_impressions=Sum("impressions"),
+        )
+
+
+def refresh_flight_daily_statistics(flight_ids=None, account_id=None, min_date=None, batch_size=1000):
+    """
+    Rebuild materialized FlightDailyStatistic rows from CampaignStatistic
+    :param flight_ids: list -> Rebuild rows of flights
+    :param account_id: Account.id -> Rebuild rows of account campaigns
+    :param min_date: date -> Only rebuild rows on or after date. All dates are rebuilt if None
+    :param batch_size: int
+    :return: int -> Number of rows created
+    """
+    stale_filter = Q()
+    stats_filter = Q()
+    if flight_ids is not None:
+        stale_filter &= Q(flight_id__in=flight_ids)
+        stats_filter &= Q(**{f"{FLIGHT_DAILY_STATISTIC_FLIGHT_REF}__in": flight_ids})
+    if account_id is not None:
+        stale_filter &= Q(campaign__account_id=account_id)
+        stats_filter &= Q(campaign__account_id=account_id)
+    if min_date is not None:
+        stale_filter &= Q(date__gte=min_date)
+        stats_filter &= Q(date__gte=min_date)
+    rows = (
+        FlightDailyStatistic(
+            flight_id=row[FLIGHT_DAILY_STATISTIC_FLIGHT_REF],
+            campaign_id=row["campaign_id"],
+            date=row["date"],
+            impressions=row["sum_impressions"] or 0,
+            video_views=row["sum_video_views"] or 0,
+            cost=row["sum_cost"] or 0,
+        )
+        for row in aggregate_flight_daily_statistics(stats_filter).iterator()
+    )
+    created = 0
+    with transaction.atomic():
+        FlightDailyStatistic.objects.filter(stale_filter).delete()
+        for chunk in chunks_generator(rows, size=batch_size):
+            created += len(FlightDailyStatistic.objects.bulk_create(list(chunk)))
+    return created
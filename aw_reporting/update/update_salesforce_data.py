@@ -27,6 +27,7 @@ from aw_reporting.models.salesforce_constants import SalesForceGoalType
 from aw_reporting.reports.pacing_report import PacingReport
 from aw_reporting.reports.pacing_report import get_pacing_from_flights
 from aw_reporting.salesforce import Connection as SConnection
+from aw_reporting.update.recalculate_de_norm_fields import refresh_flight_daily_statistics
 from saas import celery_app
 from saas.configs.celery import TaskExpiration
 from saas.configs.celery import TaskTimeout
@@ -39,6 +40,7 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 WRITE_START = datetime(2016, 9, 1).date()
+FLIGHT_DELIVERY_FIELDS = ("placement_id", "start", "end")
 
 
 @celery_app.task(expires=TaskExpiration.FULL_SF_UPDATE, soft_time_limit=TaskTimeout.FULL_SF_UPDATE)
@@ -49,6 +51,8 @@ def update_salesforce_data(do_delete=True, do_get=True, do_update=True, debug_up
     logger.info("Salesforce update started")
     start = time.time()
     today = now_in_default_tz().date()
+    # Flights with changed dates, placements or campaigns must have their materialized daily delivery rebuilt
+    changed_flight_ids = set()
     sc = None
     if do_delete:
         sc = SConnection()
@@ -56,7 +60,7 @@ def update_salesforce_data(do_delete=True, do_get=True, do_update=True, debug_up
 
     if do_get:
         sc = sc or SConnection()
-        perform_get(sc=sc, get_from_days=get_from_days)
+        changed_flight_ids |= perform_get(sc=sc, get_from_days=get_from_days)
 
     if do_update:
         sc = sc or SConnection()
@@ -66,7 +70,13 @@ def update_salesforce_data(do_delete=True, do_get=True, do_update=True, debug_up
                        skip_placements=skip_placements, skip_opportunities=skip_opportunities,
                        debug_update=debug_update, skip_flights=skip_flights)
 
-    match_using_placement_numbers()
+    changed_placement_ids = match_using_placement_numbers()
+    if changed_placement_ids:
+        changed_flight_ids |= set(
+            Flight.objects.filter(placement_id__in=changed_placement_ids).values_list("id", flat=True)
+        )
+    if changed_flight_ids:
+        refresh_flight_daily_statistics(flight_ids=list(changed_flight_ids))
     logger.info("Salesforce update finished. Took: %s", time.time() - start)
 
 
@@ -89,6 +99,11 @@ def perform_delete(sc, delete_from_days):
 
 # pylint: disable=too-many-branches
 def perform_get(sc, get_from_days):
+    """
+    Create and update Salesforce items
+    :return: set -> Ids of created flights and flights with changed delivery fields
+    """
+    changed_flight_ids = set()
     opportunity_ids = set()
     placement_ids = set()
     end_date_threshold = datetime.today().date() - timedelta(days=get_from_days)
@@ -128,6 +143,8 @@ def perform_get(sc, get_from_days):
             existing = existing_items.get(item_id)
             if existing is None:
                 to_create.append(model(**data))
+                if model is Flight:
+                    changed_flight_ids.add(item_id)
                 continue
             # Compare values since Contact and SFAccount models are easily compared and contain many entries
             if method in ("get_contacts", "get_accounts"):
@@ -140,6 +157,8 @@ def perform_get(sc, get_from_days):
                 except IntegrityError:
                     to_create.append(Category(**data))
             else:
+                if model is Flight and is_flight_delivery_changed(existing, data):
+                    changed_flight_ids.add(item_id)
                 to_update.append(model(**data))
         if to_create:
             model.objects.safe_bulk_create(to_create)
@@ -156,10 +175,22 @@ def perform_get(sc, get_from_days):
             opportunity_ids = set(Opportunity.objects.all().values_list("id", flat=True))
         elif method == "get_placements":
             placement_ids = set(OpPlacement.objects.all().values_list("id", flat=True))
+    return changed_flight_ids
 
 
 # pylint: enable=too-many-branches
 
+def is_flight_delivery_changed(flight, data):
+    """
+    Check if Salesforce data changes the campaign statistics aggregated into a flight's daily delivery
+    :param flight: Flight
+    :param data: dict -> Flight.get_data result
+    :return: bool
+    """
+    # Salesforce dates are iso formatted strings
+    return any(str(getattr(flight, key)) != str(data[key]) for key in FLIGHT_DELIVERY_FIELDS)
+
+
 def perform_update(sc, today, opportunity_ids, force_update, skip_placements, skip_opportunities,
                    skip_flights, debug_update):
     if not skip_placements:
@@ -344,12 +375,26 @@ def flights_to_update_qs(force_update, today):
 
 
 def match_using_placement_numbers():
+    """
+    Link campaigns to placements by placement code
+    :return: set -> Ids of placements with linked or unlinked campaigns
+    """
     placements = OpPlacement.objects \
                      .filter(number=OuterRef("placement_code")) \
                      .values("pk")[:1]
     campaigns = Campaign.objects \
         .filter(placement_code__isnull=False) \
         .annotate(placement_id=Subquery(placements))
+    changed_links = campaigns \
+        .filter(~Q(salesforce_placement_id=F("placement_id"))
+                | Q(salesforce_placement_id__isnull=True)
+                | Q(placement_id__isnull=True)) \
+        .values_list("salesforce_placement_id", "placement_id")
+    changed_placement_ids = set()
+    for old_placement_id, new_placement_id in changed_links:
+        if old_placement_id != new_placement_id:
+            changed_placement_ids.update({old_placement_id, new_placement_id} - {None})
     count = campaigns.update(salesforce_placement_id=F("placement_id"))
     if not settings.IS_TEST:
         logger.debug("Matched %d Campaigns", count)
+    return changed_placement_ids
@@ -16,7 +16,7 @@ class BrandSafetyChannelAudit(object):
         "transcript": 1
     }
 
-    def __init__(self, channel, audit_utils):
+    def __init__(self, channel, audit_utils, language=None):
         self.video_audits = channel.video_audits
         self.doc = channel
         self.audit_utils = audit_utils
@@ -27,25 +27,42 @@ class BrandSafetyChannelAudit(object):
         self.default_category_scores = audit_utils.default_zero_score if len(
             self.video_audits) > 0 else audit_utils.default_full_score
         self.language_processors = audit_utils.bad_word_processors_by_language
-        self.audit_metadata = self._get_metadata(channel)
+        self.audit_metadata = self._get_metadata(channel, language=language)
 
-    def _get_metadata(self, channel: Channel) -> dict:
+    def _get_metadata(self, channel: Channel, language=None) -> dict:
         """
         Get audit metadata to be used during scoring
         :param channel: Channel
+        :param language: str -> Language already detected for channel, e.g. by ChannelAuditor for a batch of channels
         :return:
         """
+        text_mapping = self._get_text_mapping(channel)
+        if language is None:
+            language = self.audit_utils.get_language(self.get_language_text(channel))
+        audit_data = {
+            "language": language,
+            **text_mapping
+        }
+        return audit_data
+
+    @staticmethod
+    def _get_text_mapping(channel: Channel) -> dict:
         text_mapping = {
             "title": channel.general_data.title or "",
             "description": channel.general_data.description or "",
             "video_tags": channel.video_tags or "",
         }
-        text = ",".join(text_mapping.keys())
-        audit_data = {
-            "language": self.audit_utils.get_language(text),
-            **text_mapping
-        }
-        return audit_data
+        return text_mapping
+
+    @classmethod
+    def get_language_text(cls, channel: Channel) -> str:
+        """
+        Get text of channel used for language detection
+        :param channel: Channel
+        :return: str
+        """
+        text = ", ".join(cls._get_text_mapping(channel).values())
+        return text
 
     def run(self):
         """
@@ -62,25 +79,17 @@ class BrandSafetyChannelAudit(object):
         If no valid language detected, then defaults to "all" which also includes universal language processor
         :return:
         """
-        # Try to get channel language processor
+        # Try to get channel language processor and universal language processor
         try:
-            keyword_processor = self.language_processors[self.audit_metadata["language"]]
-            universal_processor = self.language_processors["un"]
+            keyword_matcher = self.audit_utils.get_keyword_matcher(self.audit_metadata["language"])
         except KeyError:
             # Set the language the audit uses
             self.audit_metadata["language"] = "all"
-            keyword_processor = self.language_processors["all"]
-            universal_processor = False
-        title_hits = self.audit_utils.audit(self.audit_metadata["title"], constants.TITLE, keyword_processor)
-        description_hits = self.audit_utils.audit(self.audit_metadata["description"], constants.DESCRIPTION,
-                                                  keyword_processor)
-        all_hits = title_hits + description_hits
-        # Universal keywords hits
-        if universal_processor:
-            universal_title_hits = self.audit_utils.audit(self.audit_metadata["title"], constants.TITLE, universal_processor)
-            universal_description_hits = self.audit_utils.audit(self.audit_metadata["description"], constants.DESCRIPTION,
-                                                                universal_processor)
-            all_hits += universal_title_hits + universal_description_hits
+            keyword_matcher = self.audit_utils.get_keyword_matcher("all", universal=False)
+        all_hits = self.audit_utils.audit_fields({
+            constants.TITLE: self.audit_metadata["title"],
+            constants.DESCRIPTION: self.audit_metadata["description"],
+        }, keyword_matcher)
 
         score = self.calculate_brand_safety_score(*all_hits)
         setattr(self, constants.BRAND_SAFETY_SCORE, score)
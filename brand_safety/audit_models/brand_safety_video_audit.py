@@ -19,37 +19,52 @@ class BrandSafetyVideoAudit(object):
         "transcript": 1
     }
 
-    def __init__(self, video: Video, audit_utils: AuditUtils):
+    def __init__(self, video: Video, audit_utils: AuditUtils, languages: dict = None):
         self.audit_utils = audit_utils
         self.score_mapping = audit_utils.score_mapping
         self.default_category_scores = audit_utils.default_full_score
         self.language_processors = audit_utils.bad_word_processors_by_language
-        self.audit_metadata = self._set_metadata(video)
+        self.audit_metadata = self._set_metadata(video, languages=languages)
         self.doc = video
 
-    def _set_metadata(self, video):
+    def _set_metadata(self, video, languages=None):
         """
         Set audit metadata with language
         This detects the language of the Video using all text metadata
         :param video -> es_components Video obj
+        :param languages: dict -> Languages already detected for texts of get_language_texts, e.g. by VideoAuditor
+            for a batch of videos
         :return:
         """
-        text = ", ".join([
-            video.general_data.title or "",
-            video.general_data.description or "",
-            video.tags or "",
-        ])
-        transcript_text = video.transcript or ""
+        languages = languages or {}
+        language_texts = self.get_language_texts(video)
         audit_metadata = {}
-        if not video.general_data.lang_code:
-            audit_metadata["language"] = self.audit_utils.get_language(text)
-        else:
+        if "language" not in language_texts:
             audit_metadata["language"] = video.general_data.lang_code
+        for key, text in language_texts.items():
+            audit_metadata[key] = languages[key] if key in languages else self.audit_utils.get_language(text)
+        return audit_metadata
 
-        # if transcript_text and not data.get("transcript_language"):
+    @staticmethod
+    def get_language_texts(video) -> dict:
+        """
+        Get texts of video that require language detection
+        Language is only detected if video does not have a lang_code and transcript language is only detected
+            if video has a transcript without a language
+        :param video: es_components Video obj
+        :return: dict -> Mapping of audit metadata language key to text to detect
+        """
+        language_texts = {}
+        if not video.general_data.lang_code:
+            language_texts["language"] = ", ".join([
+                video.general_data.title or "",
+                video.general_data.description or "",
+                video.tags or "",
+            ])
+        transcript_text = video.transcript or ""
         if transcript_text and not video.transcript_language:
-            audit_metadata["transcript_language"] = self.audit_utils.get_language(transcript_text)
-        return audit_metadata
+            language_texts["transcript_language"] = transcript_text
+        return language_texts
 
     def run(self):
         """
@@ -67,41 +82,28 @@ class BrandSafetyVideoAudit(object):
         If no valid language detected, then defaults to "all" which also includes universal language processor
         :return: None
         """
-        # Try to get video language processor
+        # Try to get video language processor and universal language processor
         try:
-            keyword_processor = self.language_processors[self.audit_metadata.get("language")]
-            universal_processor = self.language_processors["un"]
+            keyword_matcher = self.audit_utils.get_keyword_matcher(self.audit_metadata.get("language"))
+            universal = True
         except KeyError:
             # Set the language the audit uses
             self.audit_metadata["language"] = "all"
-            keyword_processor = self.language_processors["all"]
-            universal_processor = False
+            keyword_matcher = self.audit_utils.get_keyword_matcher("all", universal=False)
+            universal = False
         try:
-            transcript_processor = self.language_processors[self.audit_metadata["transcript_language"]]
+            transcript_matcher = self.audit_utils.get_keyword_matcher(self.audit_metadata["transcript_language"],
+                                                                      universal=universal)
         except KeyError:
-            transcript_processor = keyword_processor
+            transcript_matcher = keyword_matcher
 
         # Detect hits in each metadata section, saving hit location and location weight
-        tag_hits = self.audit_utils.audit(self.doc.tags, constants.TAGS, keyword_processor)
-        title_hits = self.audit_utils.audit(self.doc.general_data.title, constants.TITLE, keyword_processor)
-        description_hits = self.audit_utils.audit(self.doc.general_data.description, constants.DESCRIPTION, keyword_processor)
-        transcript_hits = self.audit_utils.audit(self.doc.transcript, constants.TRANSCRIPT, transcript_processor)
-        all_hits = tag_hits + title_hits + description_hits + transcript_hits
-
-        # Calculate Universal keywords hits, if not all processor
-        if universal_processor:
-            universal_tag_hits = self.audit_utils.audit(self.doc.tags, constants.TAGS,
-                                                        universal_processor)
-            universal_title_hits = self.audit_utils.audit(self.doc.general_data.title, constants.TITLE,
-                                                          universal_processor)
-            universal_description_hits = self.audit_utils.audit(self.doc.general_data.description,
-                                                                constants.DESCRIPTION,
-                                                                universal_processor)
-            universal_transcript_hits = self.audit_utils.audit(self.doc.transcript,
-                                                               constants.TRANSCRIPT,
-                                                               universal_processor)
-            all_hits += universal_tag_hits + universal_title_hits + universal_description_hits + \
-                        universal_transcript_hits
+        all_hits = self.audit_utils.audit_fields({
+            constants.TAGS: self.doc.tags,
+            constants.TITLE: self.doc.general_data.title,
+            constants.DESCRIPTION: self.doc.general_data.description,
+        }, keyword_matcher)
+        all_hits += self.audit_utils.audit_fields({constants.TRANSCRIPT: self.doc.transcript}, transcript_matcher)
 
         score = self.calculate_brand_safety_score(*all_hits)
         setattr(self, constants.BRAND_SAFETY_SCORE, score)
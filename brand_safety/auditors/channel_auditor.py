@@ -1,3 +1,4 @@
+from collections import defaultdict
 import logging
 
 from .base_auditor import BaseAuditor
@@ -37,6 +38,16 @@ class ChannelAuditor(BaseAuditor):
         with_data = BrandSafetyChannel(channel).to_representation()
         return with_data
 
+    def get_data_many(self, channel_ids: list) -> list:
+        """
+        Retrieve many Channels with a single mget and add data to instances using BrandSafetyChannelSerializer
+        :param channel_ids: list [str, ...]
+        :return: list
+        """
+        channels = self.channel_manager.get(channel_ids, skip_none=True, source=CHANNEL_SOURCE)
+        with_data = [BrandSafetyChannel(channel).to_representation() for channel in channels]
+        return with_data
+
     def process(self, channel_id, index=True) -> Channel:
         """
         Process audit with handler depending on document data
@@ -58,6 +69,39 @@ class ChannelAuditor(BaseAuditor):
                     self.index_audit_results(self.channel_manager, [result])
                 return result
 
+    def process_many(self, channel_ids: list, index=True) -> list:
+        """
+        Process audits for many channels at once
+        Channels are retrieved in a single mget and videos for all channels are retrieved with a single terms query.
+            Video and channel results are each indexed in a single bulk upsert
+        :param channel_ids: list [str, ...]
+        :param index: bool
+        :return: list -> Channels instantiated with brand safety data
+        """
+        results = []
+        to_audit = []
+        for channel in self.get_data_many(channel_ids):
+            blocklisted = self._blocklist_handler(channel)
+            if blocklisted:
+                results.append(blocklisted)
+            else:
+                to_audit.append(channel)
+        if to_audit:
+            languages = self.audit_utils.get_languages([BrandSafetyChannelAudit.get_language_text(channel)
+                                                        for channel in to_audit])
+            videos_by_channel = self._query_channels_videos([channel.main.id for channel in to_audit])
+            video_audits_by_channel = self.video_auditor.process_for_channels(to_audit, videos_by_channel,
+                                                                              index=index)
+            for channel, language in zip(to_audit, languages):
+                channel.videos = videos_by_channel.get(channel.main.id, [])
+                channel.video_audits = video_audits_by_channel.get(channel.main.id, [])
+                channel_audit = BrandSafetyChannelAudit(channel, self.audit_utils, language=language)
+                channel_audit.run()
+                results.append(channel_audit.add_brand_safety_data())
+        if index is True and results:
+            self.index_audit_results(self.channel_manager, results)
+        return results
+
     def _query_channel_videos(self, channel_id: str) -> list:
         """
         Target for channel video query thread pool
@@ -71,6 +115,20 @@ class ChannelAuditor(BaseAuditor):
             results.extend(batch)
         return results
 
+    def _query_channels_videos(self, channel_ids: list) -> dict:
+        """
+        Retrieve videos for many channels with a single terms query
+        :param channel_ids: list [str, ...]
+        :return: dict -> Mapping of channel id to list of channel videos
+        """
+        query = QueryBuilder().build().must().terms().field(VIDEO_CHANNEL_ID_FIELD).value(channel_ids).get() \
+                & QueryBuilder().build().must().exists().field(Sections.GENERAL_DATA).get()
+        videos_by_channel = defaultdict(list)
+        for batch in search_after(query, self.video_manager, source=VIDEO_SOURCE):
+            for video in batch:
+                videos_by_channel[video.channel.id].append(video)
+        return videos_by_channel
+
     def audit(self, channel: Channel, index=True) -> Channel:
         """
         Audit single channel
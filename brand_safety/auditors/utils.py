@@ -1,13 +1,14 @@
 import csv
+import fcntl
+import glob
+import hashlib
 import re
 from collections import defaultdict
 from collections import namedtuple
 import functools
 import os
 import pickle
-import time
 
-from billiard.process import current_process
 from django.conf import settings
 from emoji import UNICODE_EMOJI
 
@@ -17,6 +18,7 @@ from es_components.constants import MAIN_ID_FIELD
 from es_components.constants import Sections
 from es_components.query_builder import QueryBuilder
 from utils.lang import fasttext_lang
+from utils.lang import fasttext_lang_many
 from utils.lang import remove_mentions_hashes_urls
 from utils.utils import remove_tags_punctuation
 
@@ -26,29 +28,95 @@ from .bad_word_processors_by_language import get_bad_word_processors_by_language
 KeywordHit = namedtuple("KeywordHit", "name location")
 
 
-def pickled_data(fp, expires):
-    """ Decorator to get / save pickled data for expensive operations """
-    def decorator_get_pickled(func):
+def get_bad_words_version() -> str:
+    """
+    Get revision stamp of BadWord and BadWordCategory rows
+    Every column used to build bad word data is part of the revision, so any BadWord create, edit, soft delete or
+        recovery, including queryset updates that write no BadWordHistory, and any BadWordCategory change results
+        in a new version
+    :return: str
+    """
+    words = list(BadWord.objects.order_by("id").values_list(
+        "id", "name", "category_id", "language_id", "negative_score", "meta_scoring", "comment_scoring",
+    ))
+    categories = list(BadWordCategory.objects.order_by("id").values_list("id", "name", "vettable"))
+    revision = f"{words}{categories}"
+    version = hashlib.md5(revision.encode("utf-8")).hexdigest()
+    return version
+
+
+# In process copies of shared bad word data by name, keyed by the version they were loaded with
+_shared_bad_word_data = {}
+
+
+def shared_bad_word_data(name):
+    """
+    Decorator to get / save expensive data derived from BadWord rows in a file shared by all worker processes
+    Data is stored once per BadWord revision and is built by a single process under a file lock. Other processes
+        wait for the lock and load the stored file instead of rebuilding. Each process unpickles its own copy, as
+        flashtext keyword processors are plain Python dicts, and keeps it until the BadWord revision changes
+    Decorated functions accept a bad_words_version keyword argument to reuse a version already retrieved with
+        get_bad_words_version instead of querying it on every call
+    :param name: str -> Name of data used as file name prefix
+    """
+    def decorator_get_shared(func):
         @functools.wraps(func)
-        def wrapper(*_, **__):
-            should_save = False
-            try:
-                created_at = os.path.getctime(fp)
-                if time.time() - created_at <= expires:
-                    with open(fp, mode="rb") as file:
-                        data = pickle.load(file)
-                else:
-                    data = func(*_, **__)
-                    should_save = True
-            except (OSError, EOFError, pickle.UnpicklingError):
-                data = func(*_, **__)
-                should_save = True
-            if should_save:
-                with open(fp, mode="wb") as file:
-                    pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        def wrapper(*_, bad_words_version=None, **__):
+            version = bad_words_version or get_bad_words_version()
+            cached = _shared_bad_word_data.get(name)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            fp = f"{settings.TEMPDIR}/{name}_{version}"
+            data = _load_shared(fp)
+            if data is None:
+                with open(f"{fp}.lock", mode="w") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        # Another process may have built data while waiting for lock
+                        data = _load_shared(fp)
+                        if data is None:
+                            data = func(*_, **__)
+                            _save_shared(fp, data)
+                            _remove_stale(name, version)
+                    finally:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+            _shared_bad_word_data[name] = (version, data)
             return data
         return wrapper
-    return decorator_get_pickled
+    return decorator_get_shared
+
+
+def _load_shared(fp):
+    """
+    Load pickled data stored by _save_shared
+    :param fp: str
+    :return: Unpickled data or None if file is missing or invalid
+    """
+    try:
+        with open(fp, mode="rb") as file:
+            data = pickle.load(file)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        data = None
+    return data
+
+
+def _save_shared(fp, data):
+    """ Write pickled data to temporary file and atomically move into place so readers never see partial data """
+    tmp_fp = f"{fp}.{os.getpid()}.tmp"
+    with open(tmp_fp, mode="wb") as file:
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_fp, fp)
+    os.chmod(fp, 0o444)
+
+
+def _remove_stale(name, version):
+    """ Remove files stored for previous BadWord revisions """
+    for fp in glob.glob(f"{settings.TEMPDIR}/{name}_*"):
+        if version not in fp:
+            try:
+                os.remove(fp)
+            except OSError:
+                pass
 
 
 class AuditUtils(object):
@@ -58,6 +126,8 @@ class AuditUtils(object):
         initialize these values once and use as reference values to copy from
         """
         self.bad_word_categories = BadWordCategory.objects.values_list("id", flat=True)
+        # Retrieve version once for all shared bad word data used by this instance
+        bad_words_version = get_bad_words_version()
         # Initial category brand safety scores for videos and channels, since ignoring certain categories (e.g.
         # Kid's Content)
         self._default_zero_score = {
@@ -68,10 +138,10 @@ class AuditUtils(object):
             str(category_id): 100
             for category_id in self.bad_word_categories
         }
-        self._default_severity_counts = self._get_default_severity_counts()
-        self._bad_word_processors_by_language = self.get_language_processors()
+        self._default_severity_counts = self._get_default_severity_counts(bad_words_version=bad_words_version)
+        self._bad_word_processors_by_language = self.get_language_processors(bad_words_version=bad_words_version)
         self._emoji_regex = self.compile_emoji_regexp()
-        self._score_mapping = self.get_brand_safety_score_mapping()
+        self._score_mapping = self.get_brand_safety_score_mapping(bad_words_version=bad_words_version)
 
     # properties copying single underscore attributes are used by many audits and must be copied
     # as to not mutate each other's values
@@ -118,19 +188,54 @@ class AuditUtils(object):
             ]
         return hits
 
-    @pickled_data(f"{settings.TEMPDIR}/pickled_language_processors_{current_process().pid}", 1800)
+    @staticmethod
+    def audit_fields(fields: dict, keyword_processors: tuple) -> list:
+        """
+        Finds all matches of keyword processors in many text fields, normalizing each field once
+            Each processor scans with its own word boundaries, so a keyword of many processors is a hit for each
+        :param fields: dict -> Mapping of text location e.g. title, description, etc. to text to parse
+        :param keyword_processors: tuple -> flashtext module KeywordProcessor instances, usually from
+            get_keyword_matcher
+        :return: list -> KeywordHit
+        """
+        hits = []
+        for location, text in fields.items():
+            text = remove_tags_punctuation(str(text).lower())
+            if len(text) > 0:
+                for keyword_processor in keyword_processors:
+                    hits.extend(
+                        KeywordHit(name=hit, location=location)
+                        for hit in keyword_processor.extract_keywords(text)
+                    )
+        return hits
+
+    def get_keyword_matcher(self, language, universal=True):
+        """
+        Get keyword processors for language followed by the universal "un" language processor, to be scanned by
+            audit_fields on text normalized once
+        :param language: str -> Language code of bad_word_processors_by_language
+        :param universal: bool -> Include universal language keywords
+        :return: tuple -> flashtext module KeywordProcessor instances
+        :raises KeyError: If there is no keyword processor for language, or for universal language if requested
+        """
+        processors = (self._bad_word_processors_by_language[language],)
+        if universal is True:
+            processors += (self._bad_word_processors_by_language["un"],)
+        return processors
+
+    @shared_bad_word_data("shared_language_processors")
     def get_language_processors(self) -> dict:
         """
-        Get language processors with pickling
+        Get language processors shared by all worker processes
         :return: dict
         """
         language_processors = get_bad_word_processors_by_language()
         return language_processors
     
-    @pickled_data(f"{settings.TEMPDIR}/pickled_severity_counts_{current_process().pid}", 1800)
+    @shared_bad_word_data("shared_severity_counts")
     def _get_default_severity_counts(self) -> dict:
         """
-        Get severity counts with pickling
+        Get severity counts shared by all worker processes
         :return: dict
         """
         default_severity_counts = {
@@ -220,7 +325,7 @@ class AuditUtils(object):
         return keyword_regexp
 
     @staticmethod
-    @pickled_data(f"{settings.TEMPDIR}/pickled_bs_score_mapping", 1800)
+    @shared_bad_word_data("shared_bs_score_mapping")
     def get_brand_safety_score_mapping():
         """
         Map brand safety BadWord rows to their score
@@ -253,6 +358,18 @@ class AuditUtils(object):
         language = fasttext_lang(text)
         return language
 
+    @staticmethod
+    def get_languages(texts: list) -> list:
+        """
+        Analyzes many metadata texts for language using a single fastText module call
+        Results are memoized, so following get_language calls with the same texts do not detect again
+        :param texts: list -> texts to analyze
+        :return: list -> Language codes in the same order as texts
+        """
+        texts = [remove_mentions_hashes_urls(" ".join(text.split("\n"))) for text in texts]
+        languages = fasttext_lang_many(texts)
+        return languages
+
     @staticmethod
     def get_items(item_ids, manager=None):
         """
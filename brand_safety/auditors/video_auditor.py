@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from .base_auditor import BaseAuditor
 from .constants import CHANNEL_SOURCE
 from .constants import VIDEO_SOURCE
@@ -50,16 +52,17 @@ class VideoAuditor(BaseAuditor):
         audit.run()
         return audit
 
-    def audit_video(self, video: Video) -> BrandSafetyVideoAudit:
+    def audit_video(self, video: Video, languages: dict = None) -> BrandSafetyVideoAudit:
         """
         Audit single Video
         Video should be an instance of BrandSafetyVideo as it adds additional attributes required for audit
         :param video: Video object
+        :param languages: dict -> Languages detected for video by _detect_languages
         :return:
         """
         if isinstance(video, str):
             video = self.get_data([video])
-        audit = BrandSafetyVideoAudit(video, self.audit_utils)
+        audit = BrandSafetyVideoAudit(video, self.audit_utils, languages=languages)
         audit.run()
         return audit
 
@@ -93,13 +96,37 @@ class VideoAuditor(BaseAuditor):
             transcripts_mapping = self._get_transcript_mapping(video_ids=video_ids)
             context["transcripts"] = transcripts_mapping
             with_data = BrandSafetyVideo(batch, many=True, context=context).data
-            video_audits = [self.audit_video(video) for video in with_data]
+            video_audits = self._audit_videos(with_data)
             all_audits.extend(video_audits)
             if index:
                 to_index = [audit.add_brand_safety_data() for audit in video_audits]
                 self.index_audit_results(self.video_manager, to_index)
         return all_audits
 
+    def process_for_channels(self, channels: list, videos_by_channel: dict, index=True) -> dict:
+        """
+        Method to handle video scoring for many channels at once
+        Videos of all channels are processed and indexed together in batches of VIDEO_BATCH_SIZE
+        :param channels: list [Channel, ...]
+        :param videos_by_channel: dict -> Mapping of channel id to list of Video instances in the channel
+        :param index: bool -> Determines whether to index video audit results or not
+        :return: dict -> Mapping of channel id to list of video audits
+        """
+        audits_by_channel = defaultdict(list)
+        videos = [video for channel_videos in videos_by_channel.values() for video in channel_videos]
+        context = {"channels": {channel.main.id: channel for channel in channels}}
+        for batch in self.audit_utils.batch(videos, self.VIDEO_BATCH_SIZE):
+            video_ids = [video.main.id for video in batch]
+            context["transcripts"] = self._get_transcript_mapping(video_ids=video_ids)
+            with_data = BrandSafetyVideo(batch, many=True, context=context).data
+            video_audits = self._audit_videos(with_data)
+            for audit in video_audits:
+                audits_by_channel[audit.doc.channel.id].append(audit)
+            if index and video_audits:
+                to_index = [audit.add_brand_safety_data() for audit in video_audits]
+                self.index_audit_results(self.video_manager, to_index)
+        return audits_by_channel
+
     def process(self, video_ids: list, index=True, channel_mapping=None, as_rescore=False) -> list:
         """
         Audit videos ids with indexing
@@ -113,7 +140,7 @@ class VideoAuditor(BaseAuditor):
         scored = []
         for batch in self.audit_utils.batch(video_ids, self.VIDEO_BATCH_SIZE):
             videos, channel_mapping = self.get_data(batch, channel_mapping)
-            video_audits = [self.audit_video(video) for video in videos]
+            video_audits = self._audit_videos(videos)
             # For videos with low scores, check if their channel should be rescored
             check_rescore_channels = [
                 channel_mapping.get(audit.doc.channel.id) for audit in video_audits
@@ -148,6 +175,34 @@ class VideoAuditor(BaseAuditor):
         transcripts = self.transcripts_manager.get_by_video_ids(video_ids=video_ids)
         return self.audit_utils.map_transcripts_by_video_id(transcripts=transcripts)
 
+    def _audit_videos(self, videos: list) -> list:
+        """
+        Audit many videos, detecting languages of all videos with a single batched call
+        :param videos: list [Video, ...] -> Videos with data added by BrandSafetyVideo
+        :return: list -> Video audits
+        """
+        languages_by_video = self._detect_languages(videos)
+        video_audits = [self.audit_video(video, languages=languages_by_video.get(video.main.id)) for video in videos]
+        return video_audits
+
+    def _detect_languages(self, videos: list) -> dict:
+        """
+        Detect languages of all videos that require detection with a single batched call
+        :param videos: list [Video, ...] -> Videos with data added by BrandSafetyVideo
+        :return: dict -> Mapping of video id to languages by audit metadata key
+        """
+        keys = []
+        texts = []
+        for video in videos:
+            for key, text in BrandSafetyVideoAudit.get_language_texts(video).items():
+                keys.append((video.main.id, key))
+                texts.append(text)
+        languages_by_video = defaultdict(dict)
+        if texts:
+            for (video_id, key), language in zip(keys, self.audit_utils.get_languages(texts)):
+                languages_by_video[video_id][key] = language
+        return languages_by_video
+
     def _check_rescore_channels(self, channels: list) -> None:
         """
         Checks whether a new video channel should be rescored
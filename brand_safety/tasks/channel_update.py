@@ -8,5 +8,4 @@ def channel_update(channel_ids):
         auditor = ChannelAuditor()
         if isinstance(channel_ids, str):
             channel_ids = [channel_ids]
-        for channel_id in channel_ids:
-            auditor.process(channel_id)
+        auditor.process_many(channel_ids)
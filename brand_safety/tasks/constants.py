@@ -37,7 +37,8 @@ class Schedulers:
     class ChannelDiscovery(BaseScheduler):
         NAME = "brand_safety_channel_discovery"
         MAX_QUEUE_SIZE = int(os.getenv("BRAND_SAFETY_CHANNEL_PRIORITY_QUEUE_SIZE", BaseScheduler.MAX_QUEUE_SIZE))
-        TASK_BATCH_SIZE = int(os.getenv("BRAND_SAFETY_CHANNEL_PRIORITY_TASK_BATCH_SIZE", BaseScheduler.TASK_BATCH_SIZE))
+        # Channels are audited with ChannelAuditor.process_many, so larger batches share ES round trips
+        TASK_BATCH_SIZE = int(os.getenv("BRAND_SAFETY_CHANNEL_PRIORITY_TASK_BATCH_SIZE", 10))
 
     class ChannelOutdated(BaseScheduler):
         NAME = "brand_safety_channel_outdated"
@@ -8,6 +8,7 @@ from django.utils import timezone
 from elasticsearch_dsl import Index
 
 from audit_tool.models import AuditLanguage
+from brand_safety.audit_models.brand_safety_channel_audit import BrandSafetyChannelAudit
 from brand_safety.auditors.channel_auditor import ChannelAuditor
 from brand_safety.auditors.utils import AuditUtils
 from brand_safety.languages import TRANSCRIPTS_LANGUAGE_PRIORITY
@@ -50,6 +51,16 @@ class BrandSafetyTestCase(ExtendedAPITestCase, ESTestCase):
     def tearDownClass(cls):
         super().tearDownClass()
 
+    def test_language_text(self, *_):
+        """ Test channel language is detected from channel text instead of text field names """
+        channel = Channel(**dict(
+            main=dict(id=f"channel_{next(int_iterator)}"),
+            general_data=dict(title="channel title", description="channel description"),
+        ))
+        channel.video_tags = "video tags"
+        self.assertEqual(BrandSafetyChannelAudit.get_language_text(channel),
+                         "channel title, channel description, video tags")
+
     def test_special_characters(self, *_):
         en_lang = AuditLanguage.objects.get_or_create(language="en")[0]
         sv_lang = AuditLanguage.objects.get_or_create(language="sv")[0]
@@ -188,3 +199,31 @@ class BrandSafetyTestCase(ExtendedAPITestCase, ESTestCase):
         channel_auditor.process([channel.main.id])
         audited = self.channel_manager.get([channel.main.id])[0]
         self.assertLess(audited.main.created_at, audited.brand_safety.updated_at)
+
+    def test_process_many(self, *_):
+        """ Test batch audit scores every channel and indexes channel videos """
+        channel_auditor = ChannelAuditor()
+        blocklisted = Channel(f"channel_{next(int_iterator)}")
+        blocklisted.populate_custom_properties(blocklist=True)
+        channels = [Channel(f"channel_{next(int_iterator)}") for _ in range(2)]
+        videos = []
+        for channel in channels:
+            for word in self.BS_WORDS:
+                video = Video(f"v_{next(int_iterator)}")
+                video.populate_general_data(description=word)
+                video.populate_channel(id=channel.main.id)
+                videos.append(video)
+        self.channel_manager.upsert(channels + [blocklisted])
+        self.video_manager.upsert(videos)
+
+        results = channel_auditor.process_many([c.main.id for c in channels + [blocklisted]])
+        Index(Channel._index._name).refresh()
+        Index(Video._index._name).refresh()
+        self.assertEqual(len(results), 3)
+        updated_channels = {c.main.id: c for c in self.channel_manager.get([c.main.id for c in channels])}
+        for channel in channels:
+            self.assertTrue(0 < updated_channels[channel.main.id].brand_safety.overall_score < 100)
+        updated_blocklisted = self.channel_manager.get([blocklisted.main.id])[0]
+        self.assertEqual(updated_blocklisted.brand_safety.overall_score, 0)
+        updated_videos = self.video_manager.get([v.main.id for v in videos])
+        self.assertTrue(all(video.brand_safety.overall_score is not None for video in updated_videos))
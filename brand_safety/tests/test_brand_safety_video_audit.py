@@ -164,6 +164,39 @@ class BrandSafetyVideoTestCase(ExtendedAPITestCase, ESTestCase):
         self.assertEqual(english_video_description, "test                            mma test@test$test#test*test")
         self.assertEqual(english_hits, ["mma"])
 
+    def test_keyword_matcher(self, *_):
+        """ Test keyword matcher detects language and universal keywords with the hit counts of separate scans """
+        en_lang = AuditLanguage.objects.get_or_create(language="en")[0]
+        un_lang = AuditLanguage.objects.get_or_create(language="un")[0]
+        bs_category = BadWordCategory.objects.get_or_create(name="test")[0]
+        BadWord.objects.bulk_create([
+            BadWord(name="english", language=en_lang, category=bs_category),
+            BadWord(name="universal", language=un_lang, category=bs_category),
+            BadWord(name="shared", language=en_lang, category=bs_category),
+            BadWord(name="shared", language=un_lang, category=bs_category),
+        ])
+        audit_utils = AuditUtils()
+        fields = {
+            "title": "An English, title",
+            "description": "A UNIVERSAL and shared description",
+        }
+        hits = audit_utils.audit_fields(fields, audit_utils.get_keyword_matcher("en"))
+        # Keywords of both language and universal processors are a hit for each processor
+        self.assertEqual(sorted((hit.name, hit.location) for hit in hits), [
+            ("english", "title"), ("shared", "description"), ("shared", "description"), ("universal", "description"),
+        ])
+        un_hits = audit_utils.audit_fields(fields, audit_utils.get_keyword_matcher("un"))
+        self.assertEqual(sorted((hit.name, hit.location) for hit in un_hits), [
+            ("shared", "description"), ("shared", "description"),
+            ("universal", "description"), ("universal", "description"),
+        ])
+        all_hits = audit_utils.audit_fields(fields, audit_utils.get_keyword_matcher("all", universal=False))
+        self.assertEqual(sorted((hit.name, hit.location) for hit in all_hits), [
+            ("english", "title"), ("shared", "description"), ("universal", "description"),
+        ])
+        with self.assertRaises(KeyError):
+            audit_utils.get_keyword_matcher("invalid")
+
     def test_audit_serialized(self, *_):
         """ Test audit_serialized method functions properly and without errors """
         bad_words = ", ".join(self.BS_WORDS)
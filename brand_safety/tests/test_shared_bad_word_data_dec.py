@@ -0,0 +1,73 @@
+from unittest import mock
+
+from audit_tool.models import AuditLanguage
+from brand_safety.auditors import utils
+from brand_safety.auditors.utils import get_bad_words_version
+from brand_safety.auditors.utils import shared_bad_word_data
+from brand_safety.models import BadWord
+from brand_safety.models import BadWordCategory
+from utils.unittests.test_case import ExtendedAPITestCase
+
+
+class SharedBadWordDataDecoratorTestCase(ExtendedAPITestCase):
+    def setUp(self):
+        utils._shared_bad_word_data.clear()
+        self.category = BadWordCategory.objects.create(name="test")
+        self.language = AuditLanguage.objects.get_or_create(language="en")[0]
+
+    def test_version_changes(self):
+        """ Test that BadWord create, edit and delete and BadWordCategory edits change the version """
+        versions = [get_bad_words_version()]
+        word = BadWord.objects.create(name="test", category=self.category, language=self.language)
+        versions.append(get_bad_words_version())
+        word.negative_score = 4
+        word.save()
+        versions.append(get_bad_words_version())
+        # Queryset updates write no BadWordHistory
+        BadWord.objects.filter(id=word.id).update(meta_scoring=False)
+        versions.append(get_bad_words_version())
+        BadWord.objects.filter(id=word.id).update(comment_scoring=True)
+        versions.append(get_bad_words_version())
+        word.delete()
+        versions.append(get_bad_words_version())
+        self.category.name = "renamed"
+        self.category.save()
+        versions.append(get_bad_words_version())
+        self.category.vettable = False
+        self.category.save()
+        versions.append(get_bad_words_version())
+        self.assertEqual(len(set(versions)), len(versions))
+
+    def test_audit_utils_version_once(self):
+        """ Test that AuditUtils retrieves version once for all of its shared bad word data """
+        with mock.patch.object(utils, "get_bad_words_version", wraps=get_bad_words_version) as mock_version:
+            utils.AuditUtils()
+        self.assertEqual(mock_version.call_count, 1)
+
+    def test_builds_once_per_version(self):
+        """ Test that data is built once per version and rebuilt when BadWord rows change """
+        build = mock.Mock(side_effect=lambda: list(BadWord.objects.values_list("name", flat=True)))
+
+        @shared_bad_word_data("test_shared_data")
+        def test_func():
+            return build()
+
+        self.assertEqual(test_func(), [])
+        self.assertEqual(test_func(), [])
+        self.assertEqual(build.call_count, 1)
+
+        BadWord.objects.create(name="test", category=self.category, language=self.language)
+        self.assertEqual(test_func(), ["test"])
+        self.assertEqual(build.call_count, 2)
+
+    def test_loads_from_shared_file(self):
+        """ Test that data stored by another process is loaded instead of rebuilt """
+        @shared_bad_word_data("test_shared_file")
+        def test_func():
+            return {"built": True}
+
+        test_func()
+        utils._shared_bad_word_data.clear()
+        with mock.patch.object(utils.pickle, "dump") as mock_dump:
+            self.assertEqual(test_func(), {"built": True})
+            mock_dump.assert_not_called()
@@ -4,6 +4,7 @@ from audit_tool.models import IASHistory
 from cache.constants import ADMIN_CHANNEL_AGGREGATIONS_KEY
 from cache.constants import CHANNEL_AGGREGATIONS_KEY
 from cache.models import CacheItem
+from cache.utils import invalidate_cache_item
 from channel.models import AuthChannel
 from es_components.constants import Sections
 from es_components.managers.channel import ChannelManager
@@ -50,6 +51,7 @@ def cache_channel_aggregations():
             logger.info(f"Saving channel aggregations for key, '{key}'.")
             cached_channel_aggregations.value = aggregations
             cached_channel_aggregations.save()
+            invalidate_cache_item(key)
 
         logger.info("Finished channel aggregations caching.")
         unlock(LOCK_NAME)
@@ -25,7 +25,7 @@ def update_cache(obj, part, options=None, timeout=TIMEOUT):
         options = options or ((0, 50), {})
         start = options[0][0]
         end = options[0][1]
-        data = obj.uncached_get_data(start, end)
+        data = obj.get_hits_body(start, end)
     else:
         return
     set_to_cache(obj, part, options, data, timeout)
@@ -1,31 +1,32 @@
 from collections import namedtuple
-import pickle
+import json
 
 from django.conf import settings
 from redis.exceptions import ConnectionError
 
 from cache.constants import RESEARCH_CHANNELS_DEFAULT_CACHE_KEY
 from cache.constants import RESEARCH_VIDEOS_DEFAULT_CACHE_KEY
-from channel.constants import RESEARCH_CHANNELS_DEFAULT_SORT
+from cache.utils import get_research_cache_page_key
+from channel.constants import RESEARCH_CHANNELS_CACHED_SORTS
 from es_components.managers import ChannelManager
 from es_components.managers import VideoManager
 from saas import celery_app
 from utils.redis import get_redis_client
 from utils.celery.tasks import celery_lock
-from video.constants import RESEARCH_VIDEOS_DEFAULT_SORT
+from video.constants import RESEARCH_VIDEOS_CACHED_SORTS
 
 CACHE_TTL = 14400
 CACHE_LOCK_KEY = "cache_research_defaults"
 
 
-CacheConfig = namedtuple("CacheConfig", ("manager", "cache_key", "sort"))
+CacheConfig = namedtuple("CacheConfig", ("manager", "cache_key", "sorts"))
 
 
 @celery_app.task(bind=True)
 @celery_lock(CACHE_LOCK_KEY, expire=60 * 10, max_retries=0)
 def cache_research_defaults_task():
     """
-    Cache Research first pages
+    Cache Research first pages for popular sort orders
     :return:
     """
     try:
@@ -34,15 +35,31 @@ def cache_research_defaults_task():
         return
 
     configs = (
-        CacheConfig(ChannelManager, RESEARCH_CHANNELS_DEFAULT_CACHE_KEY, RESEARCH_CHANNELS_DEFAULT_SORT),
-        CacheConfig(VideoManager, RESEARCH_VIDEOS_DEFAULT_CACHE_KEY, RESEARCH_VIDEOS_DEFAULT_SORT)
+        CacheConfig(ChannelManager, RESEARCH_CHANNELS_DEFAULT_CACHE_KEY, RESEARCH_CHANNELS_CACHED_SORTS),
+        CacheConfig(VideoManager, RESEARCH_VIDEOS_DEFAULT_CACHE_KEY, RESEARCH_VIDEOS_CACHED_SORTS)
     )
     for config in configs:
         _cache(redis, config)
 
 
 def _cache(redis, config):
+    """
+    Cache raw hits of each sort split into pages of CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE
+        Each page holds the hits total so any requested slice can be built from the pages it overlaps
+    """
     manager = config.manager(sections=config.manager.allowed_sections, upsert_sections=())
-    data = manager.search(manager.forced_filters(), limit=settings.CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE)\
-        .sort(*config.sort).execute()
-    redis.set(config.cache_key, pickle.dumps(data), ex=CACHE_TTL)
+    page_size = settings.CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE
+    for sort in config.sorts:
+        response = manager.search(manager.forced_filters(), limit=page_size * settings.CACHE_RESEARCH_DEFAULT_PAGES) \
+            .sort(*sort).execute()
+        hits = response.to_dict()["hits"]
+        pipeline = redis.pipeline()
+        for page in range(settings.CACHE_RESEARCH_DEFAULT_PAGES):
+            page_data = dict(
+                total=hits["total"],
+                max_score=hits["max_score"],
+                hits=hits["hits"][page * page_size:(page + 1) * page_size],
+            )
+            key = get_research_cache_page_key(config.cache_key, sort, page)
+            pipeline.set(key, json.dumps(page_data, separators=(",", ":")), ex=CACHE_TTL)
+        pipeline.execute()
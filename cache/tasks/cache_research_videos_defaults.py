@@ -25,7 +25,7 @@ def update_cache(obj, part, options=None, timeout=TIMEOUT):
         data = obj.uncached_count()
     elif part == "get_data":
         options = options or ((0, 50), {})
-        data = obj.uncached_get_data(0, 50)
+        data = obj.get_hits_body(0, 50)
     else:
         return
     set_to_cache(obj, part, options, data, timeout)
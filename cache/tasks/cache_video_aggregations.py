@@ -3,6 +3,7 @@ import logging
 from cache.constants import ADMIN_VIDEO_AGGREGATIONS_KEY
 from cache.constants import VIDEO_AGGREGATIONS_KEY
 from cache.models import CacheItem
+from cache.utils import invalidate_cache_item
 from es_components.constants import Sections
 from es_components.managers.video import VettingAdminVideoManager
 from es_components.managers.video import VideoManager
@@ -45,6 +46,7 @@ def cache_video_aggregations():
             logger.info(f"Saving video aggregations for key, '{key}'.")
             cached_video_aggregations.value = aggregations
             cached_video_aggregations.save()
+            invalidate_cache_item(key)
 
         logger.info("Finished video aggregations caching.")
         unlock(LOCK_NAME)
@@ -0,0 +1,63 @@
+import time
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test import override_settings
+
+from cache.models import CacheItem
+from cache.utils import get_cache_item_value
+from cache.utils import invalidate_cache_item
+from utils import tiered_cache
+from utils.unittests.redis_mock import FakeRedis
+
+
+@override_settings(TIERED_CACHE_ENABLED=True)
+class TieredCacheTestCase(TestCase):
+    def setUp(self):
+        tiered_cache.clear_local()
+        self.redis = FakeRedis()
+        self.patcher = patch.object(tiered_cache, "redis", self.redis)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        tiered_cache.clear_local()
+
+    def test_missing_item(self):
+        self.assertIsNone(get_cache_item_value("missing"))
+
+    def test_cached_until_invalidated(self):
+        """ Test values are cached in process and in redis until the item version is bumped """
+        item = CacheItem.objects.create(key="aggregations", value=dict(val=1))
+        self.assertEqual(get_cache_item_value("aggregations"), dict(val=1))
+
+        item.value = dict(val=2)
+        item.save()
+        with patch.object(CacheItem.objects, "get") as mock_get:
+            self.assertEqual(get_cache_item_value("aggregations"), dict(val=1))
+        mock_get.assert_not_called()
+
+        invalidate_cache_item("aggregations")
+        self.assertEqual(get_cache_item_value("aggregations"), dict(val=2))
+
+    def test_redis_tier(self):
+        """ Test values cached in redis are used by processes with an empty local cache """
+        CacheItem.objects.create(key="aggregations", value=dict(val=1))
+        get_cache_item_value("aggregations")
+        tiered_cache.clear_local()
+        CacheItem.objects.all().delete()
+        self.assertEqual(get_cache_item_value("aggregations"), dict(val=1))
+
+    def test_version_check_interval(self):
+        """ Test version stamps are read from redis at most once per interval """
+        CacheItem.objects.create(key="aggregations", value=dict(val=1))
+        get_cache_item_value("aggregations")
+        # Version bumped by another process
+        self.redis.set(tiered_cache.get_version_key("aggregations"), "other")
+        CacheItem.objects.filter(key="aggregations").update(value=dict(val=2))
+        with patch.object(self.redis, "get") as mock_get:
+            self.assertEqual(get_cache_item_value("aggregations"), dict(val=1))
+        mock_get.assert_not_called()
+
+        tiered_cache._local_versions.expire(time.monotonic() + tiered_cache.VERSION_CHECK_INTERVAL + 1)
+        self.assertEqual(get_cache_item_value("aggregations"), dict(val=2))
@@ -1,3 +1,76 @@
+import json
+
+from redis.exceptions import ConnectionError
+
+from cache.models import CacheItem
+from utils import tiered_cache
+
+CACHE_ITEM_REDIS_TIMEOUT = 86400
+
+
 class RequestParamsMock:
     def __init__(self, query_params):
         self.query_params = query_params
+
+
+def get_cache_item_value(key):
+    """
+    Get CacheItem value from the in process cache, then redis, then Postgres
+        Cached values are keyed by the version stamp bumped with invalidate_cache_item when the item is updated
+    :param key: str -> CacheItem key
+    :return: CacheItem value or None if the item does not exist
+    """
+    if not tiered_cache.is_enabled():
+        return _get_db_value(key)
+    try:
+        version = tiered_cache.get_version(key)
+    except ConnectionError:
+        return _get_db_value(key)
+    value = tiered_cache.get_local(key, version)
+    if value is not None:
+        return value
+
+    redis_key = f"cache_item.{key}.{version}"
+    try:
+        cached = tiered_cache.redis.get(redis_key)
+    except ConnectionError:
+        cached = None
+    if cached:
+        value = json.loads(cached)
+    else:
+        value = _get_db_value(key)
+        if value is None:
+            return None
+        try:
+            tiered_cache.redis.set(redis_key, json.dumps(value), CACHE_ITEM_REDIS_TIMEOUT)
+        except ConnectionError:
+            pass
+    tiered_cache.set_local(key, version, value)
+    return value
+
+
+def invalidate_cache_item(key):
+    """
+    Invalidate cached values of CacheItem in all processes after it has been updated
+    :param key: str -> CacheItem key
+    """
+    tiered_cache.bump_version(key)
+
+
+def _get_db_value(key):
+    try:
+        return CacheItem.objects.get(key=key).value
+    except CacheItem.DoesNotExist:
+        return None
+
+
+def get_research_cache_page_key(cache_key, sort, page):
+    """
+    Get redis key of a cached Research page
+    :param cache_key: str -> Research default cache key
+    :param sort: list[dict] -> Elasticsearch sort of cached page
+    :param page: int -> Zero based page index
+    :return: str
+    """
+    sort_key = ",".join(f"{field}:{options['order']}" for item in sort for field, options in item.items())
+    return f"{cache_key}.{sort_key}.{page}"
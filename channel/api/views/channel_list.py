@@ -5,7 +5,6 @@ from rest_framework.generics import ListAPIView
 from audit_tool.models import IASHistory
 from cache.constants import ADMIN_CHANNEL_AGGREGATIONS_KEY
 from cache.constants import CHANNEL_AGGREGATIONS_KEY
-from cache.models import CacheItem
 from channel.api.serializers.channel import ChannelSerializer
 from channel.constants import EXISTS_FILTER
 from channel.constants import MATCH_PHRASE_FILTER
@@ -138,8 +137,6 @@ class ChannelListApiView(BrandSuitabilityFiltersMixin, VettingAdminAggregationsM
     admin_manager_class = VettingAdminChannelManager
     serializer_class = ChannelSerializer
 
-    cache_class = CacheItem
-
     allowed_percentiles = (
         "ads_stats.average_cpv:percentiles",
         "ads_stats.average_cpm:percentiles",
@@ -206,7 +203,8 @@ class ChannelListApiView(BrandSuitabilityFiltersMixin, VettingAdminAggregationsM
         self.add_fields()
         return ResearchESQuerysetAdapter(self.get_manager_class()(sections, context=self._get_manager_context()),
                                          cached_aggregations=self.get_cached_aggregations(),
-                                         query_params=self.request.query_params)
+                                         query_params=self.request.query_params,
+                                         filter_names=self.get_filter_names())
 
     @staticmethod
     def get_own_channel_ids(user, query_params):
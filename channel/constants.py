@@ -43,3 +43,19 @@ RESEARCH_CHANNELS_DEFAULT_SORT = [
     {"stats.subscribers": {"order": "desc"}},
     {"main.id": {"order": "asc"}}
 ]
+# Popular Research channels sort orders to warm the cache for
+RESEARCH_CHANNELS_CACHED_SORTS = [
+    RESEARCH_CHANNELS_DEFAULT_SORT,
+    [
+        {"stats.last_30day_subscribers": {"order": "desc"}},
+        {"main.id": {"order": "asc"}}
+    ],
+    [
+        {"stats.views": {"order": "desc"}},
+        {"main.id": {"order": "asc"}}
+    ],
+    [
+        {"stats.last_30day_views": {"order": "desc"}},
+        {"main.id": {"order": "asc"}}
+    ],
+]
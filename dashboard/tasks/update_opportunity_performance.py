@@ -1,6 +1,8 @@
 from datetime import timedelta
 import json
 
+from django.utils import timezone
+
 from aw_reporting.reports.pacing_report import PacingReport
 from aw_reporting.models import Opportunity
 from dashboard.models import OpportunityPerformance
@@ -24,8 +26,17 @@ def update_opportunity_performance_task():
         "ids": Opportunity.objects.filter(end__gte=end_date_threshold, probability=100).values_list("id", flat=True)
     }
     opportunities = report.get_opportunities(filters)
+    existing = OpportunityPerformance.objects.in_bulk(
+        [op["id"] for op in opportunities], field_name="opportunity_id"
+    )
+    to_create = []
+    to_update = []
+    now = timezone.now()
     for op in opportunities:
-        perform_obj, _ = OpportunityPerformance.objects.get_or_create(opportunity_id=op["id"])
+        perform_obj = existing.get(op["id"])
+        if perform_obj is None:
+            perform_obj = OpportunityPerformance(opportunity_id=op["id"])
+            to_create.append(perform_obj)
         history = perform_obj.history
         # If saving performance for first time or today's performance has not been saved, add to history
         if not history or (history and today_str != history[-1].get("date")):
@@ -36,7 +47,11 @@ def update_opportunity_performance_task():
             history += [today_data]
             history = history[-MAX_HISTORY:]
             perform_obj.performance = json.dumps(history)
-            perform_obj.save()
+            if perform_obj.pk is not None:
+                perform_obj.updated_at = now
+                to_update.append(perform_obj)
+    OpportunityPerformance.objects.bulk_create(to_create, batch_size=1000)
+    OpportunityPerformance.objects.bulk_update(to_update, fields=["performance", "updated_at"], batch_size=1000)
 
 
 def aggregate_account_statistics():
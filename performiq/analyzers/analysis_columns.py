@@ -0,0 +1,126 @@
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from .base_analyzer import ChannelAnalysis
+
+
+class AnalysisColumns:
+    """
+    Columnar view of ChannelAnalysis data used by analyzers to analyze placements in bulk
+    Each column is loaded once on first access. Numeric columns are float arrays with a mask of rows that have
+        numeric values, and categorical columns are encoded as integer codes into lists of distinct values ordered
+        by first occurrence
+    """
+    def __init__(self, channel_analyses: List[ChannelAnalysis]):
+        self.channel_analyses = channel_analyses
+        self.size = len(channel_analyses)
+        self._values = {}
+        self._numeric = {}
+        self._categorical = {}
+        self._multi_categorical = {}
+
+    def values(self, field: str, none_value=None) -> list:
+        """
+        Get raw values of field for each row
+        :param field: str -> ChannelAnalysis data key
+        :param none_value: Value to replace missing values with
+        :return: list
+        """
+        key = (field, none_value)
+        if key not in self._values:
+            values = [analysis.get(field) for analysis in self.channel_analyses]
+            if none_value is not None:
+                values = [none_value if value is None else value for value in values]
+            self._values[key] = values
+        return self._values[key]
+
+    def numeric(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get float column of field with mask of rows that have numeric values
+        :param field: str -> ChannelAnalysis data key
+        :return: tuple -> (float values, present mask)
+        """
+        if field not in self._numeric:
+            values = self.values(field)
+            present = np.fromiter((isinstance(value, (int, float)) for value in values), dtype=bool, count=self.size)
+            column = np.fromiter((value if is_present else np.nan for value, is_present in zip(values, present)),
+                                 dtype=np.float64, count=self.size)
+            self._numeric[field] = column, present
+        return self._numeric[field]
+
+    def categorical(self, field: str, none_value=None) -> Tuple[np.ndarray, list]:
+        """
+        Encode single value field as codes into distinct values
+        :param field: str -> ChannelAnalysis data key
+        :param none_value: Value to replace missing values with
+        :return: tuple -> (codes for each row, distinct values)
+        """
+        key = (field, none_value)
+        if key not in self._categorical:
+            categories = {}
+            codes = np.fromiter((categories.setdefault(value, len(categories))
+                                 for value in self.values(field, none_value=none_value)),
+                                dtype=np.int64, count=self.size)
+            self._categorical[key] = codes, list(categories)
+        return self._categorical[key]
+
+    def multi_categorical(self, field: str) -> Tuple[np.ndarray, np.ndarray, list, np.ndarray]:
+        """
+        Encode multi value field as flattened codes into distinct values. Single string values are treated as
+            a single member and rows with missing or non iterable values are not present
+        :param field: str -> ChannelAnalysis data key
+        :return: tuple -> (flattened codes, row of each code, distinct values, present mask)
+        """
+        if field not in self._multi_categorical:
+            categories = {}
+            codes = []
+            rows = []
+            present = np.zeros(self.size, dtype=bool)
+            for row, value in enumerate(self.values(field)):
+                if value is None:
+                    continue
+                try:
+                    members = {value} if isinstance(value, str) else set(value)
+                except TypeError:
+                    continue
+                present[row] = True
+                for member in members:
+                    codes.append(categories.setdefault(member, len(categories)))
+                    rows.append(row)
+            self._multi_categorical[field] = (
+                np.array(codes, dtype=np.int64), np.array(rows, dtype=np.int64), list(categories), present
+            )
+        return self._multi_categorical[field]
+
+    def any_by_row(self, rows: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Reduce mask of flattened multi categorical codes to mask of rows with any True value
+        :param rows: np.ndarray -> Row of each flattened code
+        :param mask: np.ndarray -> Mask of flattened codes
+        :return: np.ndarray
+        """
+        result = np.zeros(self.size, dtype=bool)
+        result[rows[mask]] = True
+        return result
+
+    def select(self, mask: np.ndarray) -> List[ChannelAnalysis]:
+        """
+        Get ChannelAnalysis objects of rows in mask
+        :param mask: np.ndarray
+        :return: list
+        """
+        return [self.channel_analyses[row] for row in np.flatnonzero(mask)]
+
+    def mark_failed(self, mask: np.ndarray) -> None:
+        """
+        Set ChannelAnalysis objects of rows in mask as not clean
+        :param mask: np.ndarray
+        """
+        for analysis in self.select(mask):
+            analysis.clean = False
+
+    @property
+    def clean(self) -> np.ndarray:
+        return np.fromiter((analysis.clean for analysis in self.channel_analyses), dtype=bool, count=self.size)
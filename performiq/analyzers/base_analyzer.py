@@ -2,6 +2,9 @@ class BaseAnalyzer:
     def analyze(self, *args, **kwargs):
         raise NotImplementedError
 
+    def analyze_columns(self, *args, **kwargs):
+        raise NotImplementedError
+
     def get_results(self, *args, **kwargs):
         raise NotImplementedError
 
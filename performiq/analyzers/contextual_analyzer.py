@@ -1,5 +1,9 @@
 from collections import defaultdict
+from typing import List
 
+import numpy as np
+
+from .analysis_columns import AnalysisColumns
 from .base_analyzer import BaseAnalyzer
 from .base_analyzer import ChannelAnalysis
 from .constants import AnalysisFields
@@ -47,6 +51,12 @@ class ContextualAnalyzer(BaseAnalyzer):
             AnalysisFields.CONTENT_QUALITY: self._analyze_attribute,
             AnalysisFields.LANGUAGES: self._analyze_attribute,
         }
+        self._column_analyzers = {
+            AnalysisFields.CONTENT_CATEGORIES: self._analyze_content_categories_columns,
+            AnalysisFields.CONTENT_TYPE: self._analyze_attribute_columns,
+            AnalysisFields.CONTENT_QUALITY: self._analyze_attribute_columns,
+            AnalysisFields.LANGUAGES: self._analyze_attribute_columns,
+        }
         # Sections that should be used to calculate overall score
         self._analyzed_sections = {}
 
@@ -169,6 +179,79 @@ class ContextualAnalyzer(BaseAnalyzer):
             self._total_analyzed += 1
         return curr_channel_result
 
+    def analyze_columns(self, columns: AnalysisColumns) -> List[dict]:
+        """
+        Analyzes all rows in columns for attributes defined in self.ANALYSIS_FIELDS
+        Produces the same results and counts as calling self.analyze for each row
+        :return: list -> Results for each row
+        """
+        analyzed = False
+        failed = np.zeros(columns.size, dtype=bool)
+        field_values = {}
+        for params_field, analyze_func in self._column_analyzers.items():
+            # content_quality and content_type param of -1 indicates we should check for None values
+            none_value = -1 if params_field in {AnalysisFields.CONTENT_TYPE, AnalysisFields.CONTENT_QUALITY} else None
+            count_field = params_field + "_counts"
+            curr_failed = analyze_func(columns, count_field, params_field, none_value)
+            field_values[params_field] = columns.values(params_field, none_value=none_value)
+            if self.params.get(params_field):
+                analyzed = True
+                failed |= curr_failed
+
+        columns.mark_failed(failed)
+        self._failed_channels.update(analysis.channel_id for analysis in columns.select(failed))
+        self._total_count += columns.size
+        if analyzed is True:
+            self._total_analyzed += columns.size
+        fields = list(field_values.keys())
+        results = [
+            {"passed": not row_failed, **dict(zip(fields, row_values))}
+            for row_failed, *row_values in zip(failed.tolist(), *field_values.values())
+        ]
+        return results
+
+    def _analyze_attribute_columns(self, columns: AnalysisColumns, count_field: str, params_field: str,
+                                   none_value=None) -> np.ndarray:
+        """
+        Analyze single value attribute of all rows by comparing encoded values to self.params
+        :return: np.ndarray -> Mask of failed rows
+        """
+        codes, values = columns.categorical(params_field, none_value=none_value)
+        counts = np.bincount(codes, minlength=len(values))
+        for value, count in zip(values, counts.tolist()):
+            self._total_result_counts[count_field][value] += count
+        if not self.params.get(params_field):
+            return np.zeros(columns.size, dtype=bool)
+        # value == -1, then value being analyzed is None and should not fail analysis
+        failed_values = np.array([value != -1 and value not in self.params[params_field] for value in values],
+                                 dtype=bool)
+        return failed_values[codes]
+
+    def _analyze_content_categories_columns(self, columns: AnalysisColumns, count_field: str, *_, **__) \
+            -> np.ndarray:
+        """
+        Analyze content categories of all rows against targeted content categories in self.params
+        :return: np.ndarray -> Mask of failed rows
+        """
+        codes, rows, categories, present = columns.multi_categorical(AnalysisFields.CONTENT_CATEGORIES)
+        ignored = np.array([(category or "").lower() in IGNORE_CONTENT_CATEGORIES for category in categories],
+                           dtype=bool)
+        counted = ~ignored[codes]
+        codes, rows = codes[counted], rows[counted]
+        # Categories are encoded in order of first occurrence, matching the order counts are added by
+        # self._analyze_content_categories. Ignored categories are never counted
+        counts = np.bincount(codes, minlength=len(categories))
+        for category, count in zip(categories, counts.tolist()):
+            if count > 0:
+                self._total_result_counts[count_field][category] += count
+        targeted = np.array([
+            category in self.params[AnalysisFields.CONTENT_CATEGORIES] for category in categories
+        ], dtype=bool)
+        # Passes if at least one category matches
+        matched = columns.any_by_row(rows, targeted[codes])
+        self._total_result_counts["matched_content_categories"] += int(np.count_nonzero(matched))
+        return present & ~matched
+
     def _analyze_multi(self, values: list, count_field: str, params_field: str) -> bool:
         """
         Wrapper method to call _analyze_attribute for attributes that contain multiple values
@@ -1,15 +1,17 @@
-from operator import attrgetter
+from itertools import compress
 from typing import List
 
-from elasticsearch_dsl import AttrList
+import numpy as np
+from django.conf import settings
 
+from .analysis_columns import AnalysisColumns
 from .base_analyzer import BaseAnalyzer
 from .constants import COERCE_FIELD_FUNCS
 from .base_analyzer import ChannelAnalysis
 from .constants import DataSourceType
 from .constants import ESFieldMapping
-from es_components.managers import ChannelManager
-from es_components.constants import Sections
+from es_components.constants import MAIN_ID_FIELD
+from es_components.models import Channel
 from oauth.models import OAuthAccount
 from performiq.analyzers import PerformanceAnalyzer
 from performiq.analyzers import SuitabilityAnalyzer
@@ -21,8 +23,15 @@ from performiq.tasks.utils.get_csv_data import get_csv_data
 from performiq.tasks.utils.get_google_ads_data import get_google_ads_data
 from performiq.tasks.utils.get_dv360_data import get_dv360_data
 from utils.db.functions import safe_bulk_create
+from utils.es_enrichment import compile_field_paths
+from utils.es_enrichment import get_path_value
+from utils.es_enrichment import mget_sources
 from utils.utils import chunks_generator
 
+# Document fields required to merge Elasticsearch data with ESFieldMapping
+ES_SOURCE_FIELDS = [MAIN_ID_FIELD, *ESFieldMapping.PRIMARY.keys(), *ESFieldMapping.SECONDARY.values()]
+ES_FIELD_PATHS = compile_field_paths(ES_SOURCE_FIELDS)
+
 
 class ExecutorAnalyzer(BaseAnalyzer):
     """
@@ -31,34 +40,57 @@ class ExecutorAnalyzer(BaseAnalyzer):
 
     Usage:
         1. Instantiate ExecutorAnalyzer which will prepare data
-        2. Call analyze method
+        2. Call analyze method, which streams data through analysis in batches of BATCH_SIZE placements
         3. Call get_results method to get formatted results from all analyzers
     """
+    BATCH_SIZE = 5000
+
     def __init__(self, iq_campaign: IQCampaign):
         self.iq_campaign = iq_campaign
-        # Prepare results for each analyzer to add results to
+        # Prepare results for each analyzer to add results to. Data is consumed once by the analyze method
         self.channel_analyses = self._prepare_data()
         self._analyzers = [
             PerformanceAnalyzer(iq_campaign.params),
             ContextualAnalyzer(iq_campaign.params),
             SuitabilityAnalyzer(iq_campaign.params),
         ]
-        self.channel_manager = ChannelManager(
-            sections=(Sections.GENERAL_DATA, Sections.TASK_US_DATA, Sections.BRAND_SAFETY),
-            upsert_sections=None
-        )
+        # Running totals of all batches analyzed used by calculate_wastage_statistics
+        self.placements_count = 0
+        self._wastage_count = 0
+        self._total_spend = 0
+        self._wastage_spend = 0
 
     def analyze(self, *args, **kwargs):
         """
         Main method to call analyze method for each analyzer used in PerformIQ analysis
-        Saves results of IQCampaignChannels with _save_results method
+        Each batch is enriched, analyzed and saved as IQCampaignChannels with _save_results method before the next
+            batch is read so that only running totals of analyzers are kept in memory
+        If PERFORMIQ_COLUMNAR_ANALYSIS is set, each batch is analyzed in bulk using AnalysisColumns
+        """
+        for batch in chunks_generator(self.channel_analyses, size=self.BATCH_SIZE):
+            batch = list(batch)
+            channel_data = self._merge_es_data(batch)
+            if settings.PERFORMIQ_COLUMNAR_ANALYSIS:
+                self._analyze_columns(channel_data)
+            else:
+                for channel in channel_data:
+                    for analyzer in self._analyzers:
+                        result = analyzer.analyze(channel)
+                        channel.add_result(analyzer.RESULT_KEY, result)
+            self._add_wastage_statistics(batch)
+            self._save_results(batch)
+            self.placements_count += len(batch)
+
+    def _analyze_columns(self, channel_data: List[ChannelAnalysis]) -> None:
         """
-        for batch in chunks_generator(self.channel_analyses, size=5000):
-            channel_data = self._merge_es_data(list(batch))
-            for channel in channel_data:
-                for analyzer in self._analyzers:
-                    result = analyzer.analyze(channel)
-                    channel.add_result(analyzer.RESULT_KEY, result)
+        Analyze batch of ChannelAnalysis objects with analyze_columns method of each analyzer
+        :param channel_data: list -> ChannelAnalysis instantiations
+        """
+        columns = AnalysisColumns(channel_data)
+        for analyzer in self._analyzers:
+            results = analyzer.analyze_columns(columns)
+            for channel, result in zip(channel_data, results):
+                channel.add_result(analyzer.RESULT_KEY, result)
 
     def _merge_es_data(self, channel_data: List[ChannelAnalysis]) -> List[ChannelAnalysis]:
         """
@@ -66,6 +98,7 @@ class ExecutorAnalyzer(BaseAnalyzer):
         First attempt to extract a value using a ESFieldMapping.PRIMARY field. If the document also as a SECONDARY
             field, it is implied the final value should be a list with the combined values of the
             PRIMARY and SECONDARY fields
+        Documents are retrieved concurrently as raw _source dicts with only the fields in ES_SOURCE_FIELDS
         :param channel_data: list -> ChannelAnalysis instantiations
         :return: list
         """
@@ -73,41 +106,42 @@ class ExecutorAnalyzer(BaseAnalyzer):
             c.channel_id: c for c in channel_data
             if len(str(c.channel_id)) == 24
         }
-        for batch in chunks_generator(by_id.keys(), size=2000):
-            es_data = self.channel_manager.get(batch, skip_none=True)
-            for channel in es_data:
-                if not channel.main.id:
-                    continue
-                mapped = {}
-                for es_field, mapped_key in ESFieldMapping.PRIMARY.items():
-                    # Map multi dot attribute fields to single keys
-                    attr_value = attrgetter(es_field)(channel)
-                    coercer = COERCE_FIELD_FUNCS.get(mapped_key)
-                    try:
-                        # ESFieldMapping.PRIMARY value may be either a single or list value
-                        combined = []
-                        if isinstance(attr_value, (list, AttrList)):
-                            combined.extend(attr_value)
-                        elif attr_value is not None:
-                            combined.append(attr_value)
-                        # If has secondary field, it is implied that the final attr_value should be a list
-                        secondary_field = ESFieldMapping.SECONDARY[es_field]
-                        second_attr_value = attrgetter(secondary_field)(channel) or []
-                        combined.extend(second_attr_value)
-                        attr_value = combined
-                    except (KeyError, AttributeError):
-                        pass
-                    # Not all fields will need to be coerced
-                    mapped[mapped_key] = coercer(attr_value) if coercer and attr_value is not None else attr_value
-                by_id[channel.main.id].add_data(mapped)
+        for _, source in mget_sources(Channel, by_id.keys(), ES_SOURCE_FIELDS, batch_size=2000):
+            channel_id = get_path_value(source, ES_FIELD_PATHS[MAIN_ID_FIELD])
+            if not channel_id:
+                continue
+            mapped = {}
+            for es_field, mapped_key in ESFieldMapping.PRIMARY.items():
+                # Map multi dot attribute fields to single keys
+                attr_value = get_path_value(source, ES_FIELD_PATHS[es_field])
+                coercer = COERCE_FIELD_FUNCS.get(mapped_key)
+                try:
+                    # ESFieldMapping.PRIMARY value may be either a single or list value
+                    combined = []
+                    if isinstance(attr_value, list):
+                        combined.extend(attr_value)
+                    elif attr_value is not None:
+                        combined.append(attr_value)
+                    # If has secondary field, it is implied that the final attr_value should be a list
+                    secondary_field = ESFieldMapping.SECONDARY[es_field]
+                    second_attr_value = get_path_value(source, ES_FIELD_PATHS[secondary_field]) or []
+                    if isinstance(second_attr_value, str):
+                        second_attr_value = [second_attr_value]
+                    combined.extend(second_attr_value)
+                    attr_value = combined
+                except KeyError:
+                    pass
+                # Not all fields will need to be coerced
+                mapped[mapped_key] = coercer(attr_value) if coercer and attr_value is not None else attr_value
+            by_id[channel_id].add_data(mapped)
         return list(by_id.values())
 
     def get_results(self):
         """
-        Gather and format results from each analyzer
+        Gather and format results from each analyzer. This should be called only after the self.analyze method has
+            been called
         :return:
         """
-        self._save_results()
         all_results = {
             analyzer.RESULT_KEY: analyzer.get_results()
             for analyzer in self._analyzers
@@ -132,24 +166,43 @@ class ExecutorAnalyzer(BaseAnalyzer):
         Calculates statistics for channels that do not pass analysis. This should be called only after the self.analyze
             method has been called
         """
-        wastage = [analysis for analysis in self.channel_analyses if analysis.clean is False]
-        total_spend = sum(analysis.get(AnalysisFields.COST, 0) or 0 for analysis in self.channel_analyses)
-        wastage_spend = sum(analysis.get(AnalysisFields.COST, 0) or 0 for analysis in wastage)
         statistics = {
-            "wastage_channels_percent": self.get_score(len(wastage), len(self.channel_analyses)),
-            "wastage_spend": wastage_spend,
-            "wastage_percent": wastage_spend / (total_spend or 1) * 100,
+            "wastage_channels_percent": self.get_score(self._wastage_count, self.placements_count),
+            "wastage_spend": self._wastage_spend,
+            "wastage_percent": self._wastage_spend / (self._total_spend or 1) * 100,
         }
         return statistics
 
+    def _add_wastage_statistics(self, channel_analyses: List[ChannelAnalysis]) -> None:
+        """
+        Add wastage counts and spend of analyzed batch to running totals
+        :param channel_analyses: list -> ChannelAnalysis instantiations
+        """
+        if settings.PERFORMIQ_COLUMNAR_ANALYSIS:
+            columns = AnalysisColumns(channel_analyses)
+            wastage_mask = ~columns.clean
+            costs = [cost or 0 for cost in columns.values(AnalysisFields.COST)]
+            self._wastage_count += int(np.count_nonzero(wastage_mask))
+            self._total_spend = sum(costs, self._total_spend)
+            self._wastage_spend = sum(compress(costs, wastage_mask), self._wastage_spend)
+        else:
+            wastage = [analysis for analysis in channel_analyses if analysis.clean is False]
+            self._wastage_count += len(wastage)
+            self._total_spend = sum((analysis.get(AnalysisFields.COST, 0) or 0 for analysis in channel_analyses),
+                                    self._total_spend)
+            self._wastage_spend = sum((analysis.get(AnalysisFields.COST, 0) or 0 for analysis in wastage),
+                                      self._wastage_spend)
+
     def _prepare_data(self) -> iter:
         """
         Retrieve data to create ChannelAnalysis objects to track results throughout analysis processes
-        :return: dict
+        Data is retrieved immediately so that data fetch errors are raised during instantiation, but ChannelAnalysis
+            objects are created lazily as data is consumed
+        :return: iter
         """
         raw_data = self._get_data()
-        channel_data = [ChannelAnalysis(data[AnalysisFields.CHANNEL_ID], data=data) for data in raw_data
-                        if data.get(AnalysisFields.CHANNEL_ID)]
+        channel_data = (ChannelAnalysis(data[AnalysisFields.CHANNEL_ID], data=data) for data in raw_data
+                        if data.get(AnalysisFields.CHANNEL_ID))
         return channel_data
 
     def _get_data(self):
@@ -187,14 +240,14 @@ class ExecutorAnalyzer(BaseAnalyzer):
                                                  user=self.iq_campaign.user)
         return oauth_account
 
-    def _save_results(self) -> None:
+    def _save_results(self, channel_analyses: List[ChannelAnalysis]) -> None:
         """
         Save final results stored in ChannelAnalysis objects
-        :return: list
+        :param channel_analyses: list -> ChannelAnalysis instantiations of analyzed batch
         """
         to_create = (
             IQCampaignChannel(
                 iq_campaign=self.iq_campaign, clean=analysis.clean, meta_data=analysis.meta_data,
-                channel_id=analysis.channel_id, results=analysis.results) for analysis in self.channel_analyses
+                channel_id=analysis.channel_id, results=analysis.results) for analysis in channel_analyses
         )
         safe_bulk_create(IQCampaignChannel, to_create)
@@ -1,5 +1,10 @@
+from itertools import compress
 from typing import Dict
+from typing import List
 
+import numpy as np
+
+from .analysis_columns import AnalysisColumns
 from .base_analyzer import BaseAnalyzer
 from .base_analyzer import ChannelAnalysis
 from .constants import AnalysisResultSection
@@ -88,6 +93,47 @@ class PerformanceAnalyzer(BaseAnalyzer):
             self._failed_channels_count += 1
         return curr_result
 
+    def analyze_columns(self, columns: AnalysisColumns) -> List[dict]:
+        """
+        Compare performance metrics of all rows in columns with self.params
+        Produces the same results and counts as calling self.analyze for each row
+        :return: list -> Results for each row
+        """
+        analyzed = np.zeros(columns.size, dtype=bool)
+        failed = np.zeros(columns.size, dtype=bool)
+        metric_results = {}
+        for metric_name in self.ANALYSIS_FIELDS:
+            threshold = self.params.get(metric_name)
+            if not threshold:
+                metric_results[metric_name] = [None] * columns.size
+                continue
+            values, present = columns.numeric(metric_name)
+            raw_values = columns.values(metric_name)
+            passes_direction = self.ANALYSIS_COMPARISON.get(metric_name, "+")
+            metric_failed = present & ~self.passes(values, threshold, passes_direction)
+            failed_count = int(np.count_nonzero(metric_failed))
+            self._total_results[metric_name]["passed"] += int(np.count_nonzero(present)) - failed_count
+            self._total_results[metric_name]["failed"] += failed_count
+            if metric_name in self._averages:
+                # Sum sequentially to match totals of self._add_averages
+                self._averages[metric_name] = sum(compress(raw_values, present), self._averages[metric_name])
+            metric_results[metric_name] = [value if is_present else None
+                                           for value, is_present in zip(raw_values, present.tolist())]
+            analyzed |= present
+            failed |= metric_failed
+        self._seen += int(np.count_nonzero(analyzed))
+        self._failed_channels_count += int(np.count_nonzero(failed))
+        columns.mark_failed(failed)
+
+        passed = [(not is_failed) if is_analyzed else None
+                  for is_analyzed, is_failed in zip(analyzed.tolist(), failed.tolist())]
+        metric_names = list(metric_results.keys())
+        results = [
+            {"passed": row_passed, **dict(zip(metric_names, row_values))}
+            for row_passed, *row_values in zip(passed, *metric_results.values())
+        ]
+        return results
+
     def get_results(self) -> dict:
         """
         Gather and format results for all channels analyzed in self.analyze method
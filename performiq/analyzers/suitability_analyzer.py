@@ -1,5 +1,11 @@
+from typing import List
+
+import numpy as np
+
+from .analysis_columns import AnalysisColumns
 from .base_analyzer import BaseAnalyzer
 from .base_analyzer import ChannelAnalysis
+from .constants import AnalysisFields
 from .constants import AnalysisResultSection
 from utils.brand_safety import map_score_threshold
 
@@ -73,6 +79,70 @@ class SuitabilityAnalyzer(BaseAnalyzer):
             })
         return curr_channel_result
 
+    def analyze_columns(self, columns: AnalysisColumns) -> List[dict]:
+        """
+        Analyze brand safety score and content categories of all rows in columns
+        Produces the same results and counts as calling self.analyze for each row
+        :return: list -> Results for each row
+        """
+        scores, scored = columns.numeric(AnalysisFields.OVERALL_SCORE)
+        threshold = self.params["score_threshold"]
+        if isinstance(threshold, (int, float)):
+            suitable = ~scored | (scores >= threshold)
+        else:
+            scored = np.zeros(columns.size, dtype=bool)
+            suitable = np.ones(columns.size, dtype=bool)
+        matched_excluded_categories = self._analyze_categories_columns(columns)
+        categorized = np.fromiter((matched is not None for matched in matched_excluded_categories), dtype=bool,
+                                  count=columns.size)
+        suitable &= ~np.fromiter((bool(matched) for matched in matched_excluded_categories), dtype=bool,
+                                 count=columns.size)
+        analyzed = scored | categorized
+        failed = analyzed & ~suitable
+        failed_count = int(np.count_nonzero(failed))
+        self._result_counts["passed"] += int(np.count_nonzero(analyzed)) - failed_count
+        self._result_counts["failed"] += failed_count
+        self._failed_channels.update(analysis.channel_id for analysis in columns.select(failed))
+        columns.mark_failed(failed)
+
+        results = []
+        rows = zip(scored.tolist(), columns.values(AnalysisFields.OVERALL_SCORE), matched_excluded_categories,
+                   analyzed.tolist(), failed.tolist())
+        for is_scored, score, matched, is_analyzed, is_failed in rows:
+            curr_channel_result = {
+                "passed": True
+            }
+            if is_scored:
+                curr_channel_result["overall_score"] = score
+            if matched is not None:
+                curr_channel_result["exclude_content_categories"] = matched
+            if is_analyzed is False:
+                curr_channel_result.update({
+                    "overall_score": None,
+                    "excluded_categories": [],
+                    "passed": None,
+                })
+            elif is_failed is True:
+                curr_channel_result["passed"] = False
+            results.append(curr_channel_result)
+        return results
+
+    def _analyze_categories_columns(self, columns: AnalysisColumns) -> list:
+        """
+        Match content categories of all rows with excluded content categories params. Only rows that contain an
+            excluded category or have a single string value are intersected individually
+        :return: list -> Matched excluded categories for each row, None if the row was not analyzed
+        """
+        excluded = self.params["exclude_content_categories"]
+        codes, rows, categories, present = columns.multi_categorical(AnalysisFields.CONTENT_CATEGORIES)
+        values = columns.values(AnalysisFields.CONTENT_CATEGORIES)
+        excluded_categories = np.array([category in excluded for category in categories], dtype=bool)
+        is_str = np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=columns.size)
+        matched_excluded_categories = [[] if is_present else None for is_present in present.tolist()]
+        for row in np.flatnonzero(columns.any_by_row(rows, excluded_categories[codes]) | is_str):
+            matched_excluded_categories[row] = list(excluded.intersection(set(values[row])))
+        return matched_excluded_categories
+
     def _analyze_score(self, channel_analysis: ChannelAnalysis, channel_result: dict):
         analyzed = False
         suitable = True
@@ -27,8 +27,8 @@ def start_analysis_task(iq_campaign_id: int, email: str, completion_link: str):
             "error": "Unable to fetch data for analysis. Please re-OAuth."
         }
     else:
-        if executor_analyzer.channel_analyses:
-            executor_analyzer.analyze()
+        executor_analyzer.analyze()
+        if executor_analyzer.placements_count:
             all_results = executor_analyzer.get_results()
 
             export_results = generate_exports(iq_campaign)
@@ -1,8 +1,8 @@
-import io
-
+import csv
 import logging
 import os
 import tempfile
+from itertools import islice
 
 from django.conf import settings
 
@@ -10,13 +10,16 @@ from performiq.analyzers.constants import COERCE_FIELD_FUNCS
 from performiq.models.constants import AnalysisFields
 from performiq.utils.constants import CSVFieldTypeEnum
 from performiq.utils.map_csv_fields import CSVHeaderUtil
-from performiq.utils.map_csv_fields import decode_to_string
-from performiq.utils.map_csv_fields import get_reader
+from performiq.utils.map_csv_fields import get_file_encoding
+from performiq.utils.map_csv_fields import get_reader_from_io_string
 from performiq.utils.s3_exporter import PerformS3Exporter
 
 
 logger = logging.getLogger(__name__)
 
+# Number of rows used by CSVHeaderUtil to determine the index of the first data row
+CSV_HEADER_ROW_DEPTH = 4
+
 # Mapping of CSV data column names to AnalysisFields that is uniform for all data sources
 CSV_HEADER_MAPPING = {
     CSVFieldTypeEnum.AVERAGE_CPV.value: AnalysisFields.CPV,
@@ -79,12 +82,25 @@ def get_csv_data(iq_campaign):
 
 
 def _get_rows(filepath: str):
-    with open(filepath, mode="rb") as file:
-        all_bytes = b"".join(file.readlines())
-        decoded = decode_to_string(all_bytes)
-    reader = get_reader(decoded)
-    rows = [r for r in reader]
-    csv_util = CSVHeaderUtil(rows=rows)
-    start_index = csv_util.get_first_data_row_index()
-    for i in range(start_index, len(rows)):
-        yield rows[i]
+    """
+    Yield data rows of csv file without reading the entire file into memory
+    The file is decoded with the same encoding and newline detection as decode_to_string and get_reader
+    :param filepath: str
+    """
+    encoding = get_file_encoding(filepath)
+    for newline in ["\n", None, "\r", "\r\n"]:
+        with open(filepath, mode="r", encoding=encoding, newline=newline) as file:
+            try:
+                reader = get_reader_from_io_string(file)
+            except csv.Error as e:
+                if str(e) == ("new-line character seen in unquoted field - do you need to open the file in "
+                              "universal-newline mode?"):
+                    continue
+                raise e
+            # Only the first rows are required to determine where data rows start
+            head = list(islice(reader, CSV_HEADER_ROW_DEPTH))
+            csv_util = CSVHeaderUtil(rows=head, row_depth=CSV_HEADER_ROW_DEPTH)
+            start_index = csv_util.get_first_data_row_index()
+            yield from head[start_index:]
+            yield from reader
+        return
@@ -55,32 +55,50 @@ def get_google_ads_data(iq_campaign: IQCampaign, **_):
               "ActiveViewMeasurableImpressions", "ActiveViewImpressions",
               "ActiveViewViewability") + MAIN_STATISTICS_FILEDS + COMPLETED_FIELDS
     try:
-        report = placement_performance_report(client, predicates=predicates, fields=fields)
+        report = placement_performance_report(client, predicates=predicates, fields=fields, stream=True)
     except Exception:
         logger.exception(f"PerformIQ: Error retrieving Adwords Placement report for IQCampaign id: {iq_campaign.id}")
         raise PerformIQDataFetchError
-    all_rows = []
-    for row in report:
-        if "channel" not in row.DisplayName:
-            continue
-        formatted = {}
-        # Create new dictionary of mapped keys to mapped API data values
-        for report_field, mapped_key in ADWORDS_API_FIELD_MAPPING.items():
-            coercer = ADWORDS_COERCE_FIELD_FUNCS.get(mapped_key)
-            api_value = getattr(row, report_field, None)
-            formatted[mapped_key] = coercer(api_value) if coercer is not None else api_value
-        all_rows.append(formatted)
-    aggregated = _aggregate_rows(all_rows)
+    # Rows are aggregated by placement as the report is read
+    rows = (_format_row(row) for row in _read_report(report, iq_campaign) if "channel" in row.DisplayName)
+    aggregated = _aggregate_rows(rows)
     return aggregated
 
 
-def _aggregate_rows(rows: list) -> list:
+def _read_report(report, iq_campaign: IQCampaign):
+    """
+    Yield rows of report stream, raising PerformIQDataFetchError if the stream can not be read
+    :param report: iter -> Placement Performance Report rows
+    :param iq_campaign: IQCampaign
+    """
+    try:
+        yield from report
+    except Exception:
+        logger.exception(f"PerformIQ: Error retrieving Adwords Placement report for IQCampaign id: {iq_campaign.id}")
+        raise PerformIQDataFetchError
+
+
+def _format_row(row) -> dict:
+    """
+    Create new dictionary of mapped keys to mapped API data values
+    :param row: Placement Performance Report row
+    :return: dict -> Mapped data row with AnalysisFields keys
+    """
+    formatted = {}
+    for report_field, mapped_key in ADWORDS_API_FIELD_MAPPING.items():
+        coercer = ADWORDS_COERCE_FIELD_FUNCS.get(mapped_key)
+        api_value = getattr(row, report_field, None)
+        formatted[mapped_key] = coercer(api_value) if coercer is not None else api_value
+    return formatted
+
+
+def _aggregate_rows(rows: iter) -> list:
     """
     Add additional data to rows, combine rows with same placement ids, and calculate percentages
     Adwords Placement Performance Report returns multiple line items since placement performance is segmented by
     adgroup. To correctly calculate percentages, we must combine all statistics that are used to calculate percentages
     across all line items that have same placement ids
-    :param rows: list
+    :param rows: iter -> Mapped data rows. Only one aggregated row per placement is kept in memory
     :return: list-> Mapped data rows with AnalysisFields keys
     """
     by_channel_id = {}
@@ -0,0 +1,82 @@
+from django.test import SimpleTestCase
+
+from .utils import get_params
+from performiq.analyzers import ChannelAnalysis
+from performiq.analyzers import ContextualAnalyzer
+from performiq.analyzers import PerformanceAnalyzer
+from performiq.analyzers import SuitabilityAnalyzer
+from performiq.analyzers.analysis_columns import AnalysisColumns
+from performiq.models.constants import AnalysisFields
+from utils.unittests.int_iterator import int_iterator
+
+
+class AnalysisColumnsTestCase(SimpleTestCase):
+    def _get_data(self):
+        data = [
+            dict(average_cpm=2.5, average_cpv=0.02, ctr=1.5, video_view_rate=40, active_view_viewability=80,
+                 video_quartile_100_rate=30, content_categories=["Music", "Pop Music"], languages="en",
+                 content_type=0, content_quality=2, overall_score=95, cost=10.5),
+            dict(average_cpm=7, average_cpv=None, ctr="invalid", video_view_rate=10, content_categories=["Sports"],
+                 languages="es", content_type=None, content_quality=1, overall_score=50, cost=3),
+            dict(average_cpm=4.0, content_categories=["Content Channel", "Music"], languages=None, content_type=1,
+                 overall_score=None),
+            dict(content_categories="Video Games", languages="en", content_type=2, content_quality=None,
+                 overall_score=80, cost=None),
+            dict(content_categories=None, overall_score=float("nan"), average_cpv=0.1),
+            dict(),
+        ]
+        return data
+
+    def _get_params(self):
+        params = get_params(dict(
+            average_cpm=5,
+            average_cpv=0.05,
+            ctr=1,
+            video_view_rate=20,
+            content_categories=["Music", "Video Games"],
+            languages=["en"],
+            content_type=[0, 2],
+            exclude_content_categories=["Sports"],
+            score_threshold=2,
+        ))
+        return params
+
+    def _get_analyses(self, data=None):
+        """ Analyses share value objects such as nan scores if created from the same data """
+        data = data if data is not None else self._get_data()
+        return [ChannelAnalysis(f"channel_id_{next(int_iterator)}".zfill(24), data=dict(item)) for item in data]
+
+    def test_columns_match_rows(self):
+        """ Test that analyzing columns produces the same results as analyzing each channel """
+        params = self._get_params()
+        data = self._get_data()
+        row_analyses = self._get_analyses(data)
+        column_analyses = self._get_analyses(data)
+        columns = AnalysisColumns(column_analyses)
+        for analyzer_class in [PerformanceAnalyzer, ContextualAnalyzer, SuitabilityAnalyzer]:
+            with self.subTest(analyzer_class.__name__):
+                row_analyzer = analyzer_class(params)
+                column_analyzer = analyzer_class(params)
+                row_results = [row_analyzer.analyze(analysis) for analysis in row_analyses]
+                column_results = column_analyzer.analyze_columns(columns)
+                self.assertEqual(row_results, column_results)
+                self.assertEqual(
+                    [list(result.keys()) for result in row_results],
+                    [list(result.keys()) for result in column_results]
+                )
+                self.assertEqual(row_analyzer.get_results(), column_analyzer.get_results())
+        self.assertEqual([analysis.clean for analysis in row_analyses],
+                         [analysis.clean for analysis in column_analyses])
+
+    def test_categorical_encoding(self):
+        """ Test that categorical values are encoded in order of first occurrence """
+        columns = AnalysisColumns(self._get_analyses())
+        codes, values = columns.categorical(AnalysisFields.LANGUAGES)
+        self.assertEqual(values, ["en", "es", None])
+        self.assertEqual(codes.tolist(), [0, 1, 2, 0, 2, 2])
+
+        codes, rows, categories, present = columns.multi_categorical(AnalysisFields.CONTENT_CATEGORIES)
+        self.assertEqual(present.tolist(), [True, True, True, True, False, False])
+        self.assertEqual(set(categories), {"Music", "Pop Music", "Sports", "Content Channel", "Video Games"})
+        self.assertEqual(sorted(categories[code] for code, row in zip(codes, rows) if row == 2),
+                         ["Content Channel", "Music"])
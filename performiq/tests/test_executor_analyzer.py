@@ -2,13 +2,15 @@ from unittest.mock import patch
 
 from .utils import get_params
 from .utils import get_test_analyses
-from es_components.managers import ChannelManager
+from .utils import patch_es_sources
 from es_components.models import Channel
 from performiq.models import IQCampaign
+from performiq.models import IQCampaignChannel
 from performiq.analyzers.base_analyzer import ChannelAnalysis
 from performiq.analyzers.executor_analyzer import ExecutorAnalyzer
 from utils.unittests.test_case import ExtendedAPITestCase
 from utils.unittests.int_iterator import int_iterator
+from utils.unittests.patch_bulk_create import patch_bulk_create
 
 
 class ExecutorAnalyzerTestCase(ExtendedAPITestCase):
@@ -52,7 +54,7 @@ class ExecutorAnalyzerTestCase(ExtendedAPITestCase):
         ]
         iq_campaign = IQCampaign.objects.create(params=params)
         with patch.object(ExecutorAnalyzer, "_prepare_data", return_value=[]),\
-                patch.object(ChannelManager, "get", return_value=channel_docs):
+                patch_es_sources(channel_docs):
             executor_analyzer = ExecutorAnalyzer(iq_campaign)
             merged = executor_analyzer._merge_es_data(channel_analyses)
         with self.subTest("Document has no primary category or iab categories"):
@@ -74,3 +76,29 @@ class ExecutorAnalyzerTestCase(ExtendedAPITestCase):
             expected = [val for val in [doc4.general_data.primary_category, *(doc4.general_data.iab_categories or [])]
                         if val is not None]
             self.assertEqual(set(expected), set(merged[3].get("content_categories")))
+
+    def test_analyze_batches(self):
+        """ Test that data is analyzed and saved in batches while keeping wastage totals for all batches """
+        params = get_params(dict(average_cpm=5))
+        iq_campaign = IQCampaign.objects.create(params=params)
+        data = [
+            dict(average_cpm=1, cost=10),
+            dict(average_cpm=10, cost=5),
+            dict(average_cpm=2, cost=2.5),
+            dict(average_cpm=20, cost=None),
+            dict(average_cpm=3, cost=1),
+        ]
+        analyses = (ChannelAnalysis(f"channel_id_{next(int_iterator)}".zfill(24), data=d) for d in data)
+        with patch.object(ExecutorAnalyzer, "_prepare_data", return_value=analyses),\
+                patch.object(ExecutorAnalyzer, "_merge_es_data", side_effect=lambda batch: batch),\
+                patch.object(ExecutorAnalyzer, "BATCH_SIZE", 2),\
+                patch("performiq.analyzers.executor_analyzer.safe_bulk_create", new=patch_bulk_create):
+            executor_analyzer = ExecutorAnalyzer(iq_campaign)
+            executor_analyzer.analyze()
+        self.assertEqual(executor_analyzer.placements_count, 5)
+        self.assertEqual(IQCampaignChannel.objects.filter(iq_campaign=iq_campaign).count(), 5)
+        self.assertEqual(IQCampaignChannel.objects.filter(iq_campaign=iq_campaign, clean=False).count(), 2)
+        statistics = executor_analyzer.calculate_wastage_statistics()
+        self.assertEqual(statistics["wastage_channels_percent"], 40)
+        self.assertEqual(statistics["wastage_spend"], 5)
+        self.assertEqual(statistics["wastage_percent"], 5 / 18.5 * 100)
@@ -5,7 +5,6 @@ from typing import List
 from performiq.api.serializers import IQCampaignSerializer
 from performiq.analyzers.executor_analyzer import ExecutorAnalyzer
 from performiq.analyzers import ChannelAnalysis
-from es_components.managers import ChannelManager
 from es_components.models import Channel
 
 
@@ -38,10 +37,18 @@ def get_test_analyses(channel_docs: List[Channel]):
         for c in channel_docs
     ]
 
-    with mock.patch.object(ChannelManager, "get", return_value=channel_docs),\
+    with patch_es_sources(channel_docs),\
             mock.patch.object(ExecutorAnalyzer, "_prepare_data"):
         mock_campaign = SimpleNamespace()
         mock_campaign.params = {}
         executor = ExecutorAnalyzer(mock_campaign)
         data = executor._merge_es_data(analyses)
     return data
+
+
+def patch_es_sources(channel_docs: List[Channel]):
+    """
+    Patch Elasticsearch enrichment of ExecutorAnalyzer to retrieve _source of channel_docs
+    """
+    sources = [(doc.main.id, doc.to_dict()) for doc in channel_docs]
+    return mock.patch("performiq.analyzers.executor_analyzer.mget_sources", return_value=sources)
@@ -1,3 +1,4 @@
+import codecs
 import csv
 import operator
 import string
@@ -12,6 +13,8 @@ from django.core.validators import URLValidator
 
 from performiq.utils.constants import CSVFieldTypeEnum
 
+CSV_ENCODINGS = ["utf-8", "utf-8-sig", "utf-16", "utf-32"]
+
 
 # TODO if this is not good enough for detection, we can pull in a package to get all iso 4217 codes and symbols
 CURRENCY_STRINGS = ["USD", "EUR", "JPY", "GBP", "AUD", "CAD", "CHF", "CNY", "HKD", "NZD", "SEK", "KRW"]
@@ -140,7 +143,7 @@ def decode_to_string(data: bytes) -> str:
     :param data:
     :return: str
     """
-    for encoding in ["utf-8", "utf-8-sig", "utf-16", "utf-32"]:
+    for encoding in CSV_ENCODINGS:
         try:
             return data.decode(encoding)
         except UnicodeDecodeError:
@@ -148,6 +151,27 @@ def decode_to_string(data: bytes) -> str:
     raise ValidationError("Could not find the right character encoding!")
 
 
+def get_file_encoding(filepath: str, chunk_size: int = 2 ** 20) -> str:
+    """
+    Get the first encoding in CSV_ENCODINGS that decodes the entire file. Chooses the same encoding as
+        decode_to_string without reading the entire file into memory
+    :param filepath: str
+    :param chunk_size: int -> Bytes to decode at a time
+    :return: str
+    """
+    for encoding in CSV_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(filepath, mode="rb") as file:
+                for chunk in iter(lambda: file.read(chunk_size), b""):
+                    decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    raise ValidationError("Could not find the right character encoding!")
+
+
 class AbstractCSVType(ABC):
     """
     Abstract class for validation with CSVHeaderUtil
@@ -440,6 +440,10 @@ AMAZON_S3_UI_ASSETS_BUCKET_NAME = "viewiq-ui-assets"
 AMAZON_S3_IAS_BUCKET_NAME = "cf-ias"
 AMAZON_S3_PERFORMIQ_CUSTOM_CAMPAIGN_UPLOADS_BUCKET_NAME = "performiq-custom-campaign-uploads"
 AMAZON_S3_DATORAMA_TAG_SHEET_BUCKET_NAME = "datorama-tag-sheet"
+# Reuse boto3 clients within a process instead of creating a client for every request
+AWS_CLIENT_POOL_ENABLED = True
+# Read CTL export ids from packed ids indexes stored next to csv exports
+CTL_IDS_INDEX_ENABLED = True
 
 MAX_AVATAR_SIZE_MB = 10.
 
@@ -471,6 +475,20 @@ MAX_SEGMENT_TO_AGGREGATE = 10000
 USE_LEGACY_BRAND_SAFETY = True
 
 ES_CACHE_ENABLED = False
+# In process cache in front of redis for research aggregations and percentiles
+TIERED_CACHE_ENABLED = True
+
+# Modules and read only resources loaded by saas.wsgi before uWSGI forks workers
+WARMUP_ENABLED = True
+WARMUP_RESOURCES = (
+    "utils.lang.get_fast_text_model",
+    "aw_reporting.adwords_api.load_settings",
+    "aw_reporting.adwords_api.load_web_app_settings",
+    "aw_reporting.google_ads.google_ads_api.load_settings",
+    "aw_reporting.salesforce.load_settings",
+)
+# Seconds, modules and resources loading longer are logged as warnings
+WARMUP_SLOW_THRESHOLD = 1
 
 # pylint: disable=wrong-import-position,wrong-import-order
 from es_components.config import *
@@ -487,6 +505,9 @@ REPORT_VISIBLE_PERIOD = 90  # in days
 SHOW_CAMPAIGNS_FOR_LAST_YEARS = 1
 
 AUTH_TOKEN_EXPIRES = 30
+# Resolved auth tokens and their users are cached in redis for AUTH_TOKEN_CACHE_TTL seconds
+AUTH_TOKEN_CACHE_ENABLED = True
+AUTH_TOKEN_CACHE_TTL = 60
 COGNITO_USER_POOL_ID = ""
 COGNITO_CLIENT_ID = ""
 
@@ -514,6 +535,8 @@ TRANSCRIPTS_NUM_VIDEOS = 1000
 TRANSCRIPTS_BATCH_SIZE = 100
 TRANSCRIPTS_NUM_THREADS = 100
 TRANSCRIPTS_TIMEOUT = 4
+# Scrape transcripts with aiohttp instead of threads
+TRANSCRIPTS_ASYNC_SCRAPER = True
 PROXY_API_TOKEN = ""
 PROXY_HOST = ""
 PROXY_PORT = ""
@@ -528,6 +551,8 @@ ARCHIVE_IAS = False
 PERFORMIQ_OAUTH_USER_AGENT = "Web application"
 PERFORMIQ_OAUTH_CLIENT_ID = "832846444492-s0tktc1j0klmt16pdemo9s8hf73t3cie.apps.googleusercontent.com"
 PERFORMIQ_OAUTH_CLIENT_SECRET = "CuLTRo8NoeKZpakATPHbCkai"
+# Analyze PerformIQ placements in bulk with NumPy columns instead of one ChannelAnalysis at a time
+PERFORMIQ_COLUMNAR_ANALYSIS = True
 
 TTS_URL_TRANSCRIPTS_MONITOR_EMAIL_ADDRESSES = [
     "andrew.vonpelt@channelfactory.com",
@@ -536,6 +561,9 @@ TTS_URL_TRANSCRIPTS_MONITOR_EMAIL_ADDRESSES = [
 ]
 
 PACING_NOTIFICATIONS = os.getenv("PACING_NOTIFICATIONS", "100,80").split(",")
+# Source of pacing report daily delivery: "raw" aggregates CampaignStatistic, "materialized" reads
+# FlightDailyStatistic, "compare" reads both, logs any mismatch and serves the raw data
+PACING_REPORT_DAILY_STATS_MODE = os.getenv("PACING_REPORT_DAILY_STATS_MODE", "raw")
 
 DEBUG_EMAIL_ADDRESSES = [
     "alex.peace@channelfactory.com",
@@ -595,7 +623,9 @@ DOMAIN_MANAGEMENT_PERMISSIONS = (
 PRICING_TOOL_AD_GROUP_STATS_SIZE = 10
 # Hours that an AuditProcessor is valid for after auditing a CTL for DV360 SDF generation
 AUDIT_SDF_VALID_TIME = os.getenv("AUDIT_SDF_VALID_TIME", 24)
-CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE = os.getenv("CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE", 50)
+CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE = int(os.getenv("CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE", 50))
+# Number of pages of CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE to cache for each Research cached sort
+CACHE_RESEARCH_DEFAULT_PAGES = int(os.getenv("CACHE_RESEARCH_DEFAULT_PAGES", 5))
 
 try:
     from .local_settings import *
@@ -4,6 +4,10 @@ except ImportError:
     pass
 
 IS_TEST = True
+TIERED_CACHE_ENABLED = False
+AUTH_TOKEN_CACHE_ENABLED = False
+AWS_CLIENT_POOL_ENABLED = False
+CTL_IDS_INDEX_ENABLED = False
 
 try:
     from teamcity import is_running_under_teamcity
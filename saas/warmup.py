@@ -0,0 +1,80 @@
+"""
+Application warm up run once before uWSGI forks workers
+    Application modules are imported and read only resources are loaded in the master process, so workers share them
+    as copy-on-write pages instead of loading them while handling their first requests. Import time of each module is
+    logged to make startup regressions visible
+"""
+import importlib
+import importlib.util
+import logging
+import time
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+WARMUP_APP_MODULES = ("models", "api.urls", "urls", "tasks")
+
+
+def warm_up():
+    """
+    Import application modules and load WARMUP_RESOURCES
+    :return: dict -> Seconds spent on each module and resource
+    """
+    start = time.perf_counter()
+    timings = {}
+    for module in get_warmup_modules():
+        timings[module] = _timed(importlib.import_module, module)
+    for path in settings.WARMUP_RESOURCES:
+        timings[path] = _timed(_load_resource, path)
+    # Connections opened while warming up must not be shared by forked workers
+    connections.close_all()
+
+    # Failed loads are timed as None and were already logged
+    loaded = ((name, elapsed) for name, elapsed in timings.items() if elapsed is not None)
+    for name, elapsed in sorted(loaded, key=lambda item: item[1], reverse=True):
+        log = logger.warning if elapsed >= settings.WARMUP_SLOW_THRESHOLD else logger.info
+        log("Warm up: %s loaded in %.3fs", name, elapsed)
+    logger.info("Warm up finished in %.3fs", time.perf_counter() - start)
+    return timings
+
+
+def get_warmup_modules():
+    """
+    Get existing modules of project apps to import, followed by url configuration importing all views
+    :return: list
+    """
+    modules = []
+    for app in settings.PROJECT_APPS:
+        for name in WARMUP_APP_MODULES:
+            module = f"{app}.{name}"
+            try:
+                spec = importlib.util.find_spec(module)
+            except ModuleNotFoundError:
+                spec = None
+            if spec is not None:
+                modules.append(module)
+    modules.append(settings.ROOT_URLCONF)
+    return modules
+
+
+def _load_resource(path):
+    module_name, func_name = path.rsplit(".", 1)
+    getattr(importlib.import_module(module_name), func_name)()
+
+
+def _timed(func, *args):
+    """
+    Call func and measure duration, logging failures as warm up must not prevent application from starting
+    :return: float | None -> Seconds spent, None if func failed
+    """
+    start = time.perf_counter()
+    try:
+        func(*args)
+    # pylint: disable=broad-except
+    except Exception:
+        # pylint: enable=broad-except
+        logger.exception("Warm up: unable to load %s", args[0])
+        return None
+    return time.perf_counter() - start
@@ -9,8 +9,25 @@ https://docs.djangoproject.com/en/1.11/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saas.settings")
 
 application = get_wsgi_application()
+
+try:
+    # Only importable in processes started by uWSGI
+    # pylint: disable=unused-import
+    import uwsgi
+    # pylint: enable=unused-import
+except ImportError:
+    uwsgi = None
+
+# Warm up only in the uWSGI master so that tools and tests importing this module are not affected
+if uwsgi is not None and settings.WARMUP_ENABLED:
+    # pylint: disable=wrong-import-position
+    from saas.warmup import warm_up
+    # pylint: enable=wrong-import-position
+
+    warm_up()
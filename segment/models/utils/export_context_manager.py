@@ -19,13 +19,20 @@ class ExportContextManager(object):
         _, self.filename = tempfile.mkstemp(dir=settings.TEMPDIR)
 
         with open(self.filename, mode="w+", newline="") as export_file:
-            field_names = self.segment.user_export_serializer.columns
-            writer = csv.DictWriter(export_file, fieldnames=field_names)
-            writer.writeheader()
-            for item in self.queryset:
-                row = self.segment.user_export_serializer(item).data
-                writer.writerow(row)
+            self.write(export_file)
         return self.filename
 
+    def write(self, export_file):
+        """
+        Write csv export to file object e.g. file opened with newline="" or S3MultipartUpload
+        :param export_file: Object with write method
+        """
+        field_names = self.segment.user_export_serializer.columns
+        writer = csv.DictWriter(export_file, fieldnames=field_names)
+        writer.writeheader()
+        for item in self.queryset:
+            row = self.segment.user_export_serializer(item).data
+            writer.writerow(row)
+
     def __exit__(self, *args):
         os.remove(self.filename)
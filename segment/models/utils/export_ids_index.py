@@ -0,0 +1,112 @@
+"""
+Compact index of placement ids in CTL exports
+    Ids are packed as fixed width ascii records in export order, so the first n ids of an export can be read with a
+    single range request instead of downloading and parsing the entire csv export. Indexes are stored next to their
+    export and record the ETag of the export they were built from, so indexes of re-exported CTLs are rebuilt.
+    Exports with ids that can not be packed get an empty index marked as not indexable, so they are read from the
+    csv export without rebuilding the index. Indexes read in this process are kept in a size bounded local cache
+"""
+import threading
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from cachetools import LRUCache
+
+from segment.models.constants import SegmentTypeEnum
+
+INDEX_KEY_SUFFIX = ".ids"
+SOURCE_ETAG_METADATA = "source-etag"
+NOT_INDEXABLE_METADATA = "not-indexable"
+# Maximum bytes of index data held in the local cache
+LOCAL_CACHE_SIZE = 64 * 1024 ** 2
+ID_WIDTHS = {
+    int(SegmentTypeEnum.VIDEO): 11,
+    int(SegmentTypeEnum.CHANNEL): 24,
+}
+
+# Values are tuples of (index data, whether data is the complete index). Exports that are not indexable are cached
+# with None instead of whether data is complete
+_local_cache = LRUCache(maxsize=LOCAL_CACHE_SIZE, getsizeof=lambda value: len(value[0]) or 1)
+_local_cache_lock = threading.Lock()
+
+
+def get_index_key(s3_key: str) -> str:
+    return f"{s3_key}{INDEX_KEY_SUFFIX}"
+
+
+def pack_ids(ids: Iterable[str], width: int) -> bytes:
+    """
+    Pack ids into fixed width records
+    :param ids: list -> Youtube ids
+    :param width: int -> Width of each id
+    :return: bytes
+    """
+    data = bytearray()
+    for item_id in ids:
+        encoded = item_id.encode("ascii")
+        if len(encoded) != width:
+            raise ValueError(f"Id {item_id} does not have width {width}")
+        data.extend(encoded)
+    return bytes(data)
+
+
+def unpack_ids(data: bytes, width: int, limit: int = None) -> List[str]:
+    """
+    Unpack ids from fixed width records
+    :param data: bytes -> Packed ids
+    :param width: int -> Width of each id
+    :param limit: int -> Maximum number of ids to unpack
+    :return: list
+    """
+    end = len(data) - len(data) % width
+    if limit is not None:
+        end = min(end, limit * width)
+    ids = [data[i:i + width].decode("ascii") for i in range(0, end, width)]
+    return ids
+
+
+def get_local(key: tuple, width: int, limit: int = None) -> Optional[bytes]:
+    """
+    Get cached index data if it contains the requested number of ids
+    :param key: tuple -> Cache key of index
+    :param width: int -> Width of each id
+    :param limit: int -> Number of ids requested, None for all ids
+    :return: bytes | None
+    """
+    with _local_cache_lock:
+        cached = _local_cache.get(key)
+    if cached is None:
+        return None
+    data, complete = cached
+    if complete is None:
+        return None
+    if complete or (limit is not None and len(data) >= limit * width):
+        return data
+    return None
+
+
+def set_local(key: tuple, data: bytes, complete: bool) -> None:
+    if len(data) > _local_cache.maxsize:
+        return
+    with _local_cache_lock:
+        cached = _local_cache.get(key)
+        # Do not replace longer data read by previous requests
+        if cached is None or (cached[1] is False and (complete or len(data) > len(cached[0]))):
+            _local_cache[key] = (data, complete)
+
+
+def set_local_not_indexable(key: tuple) -> None:
+    with _local_cache_lock:
+        _local_cache[key] = (b"", None)
+
+
+def is_local_not_indexable(key: tuple) -> bool:
+    with _local_cache_lock:
+        cached = _local_cache.get(key)
+    return cached is not None and cached[1] is None
+
+
+def clear_local():
+    with _local_cache_lock:
+        _local_cache.clear()
@@ -29,6 +29,47 @@ from utils.brand_safety import map_brand_safety_score
 from utils.utils import chunks_generator
 
 
+def get_export_writer(file, export_serializer):
+    writer = csv.DictWriter(file, fieldnames=export_serializer.columns, extrasaction="ignore", quotechar='"',
+                            quoting=csv.QUOTE_MINIMAL)
+    return writer
+
+
+class ExportFileWriter:
+    """
+    Csv export writer that keeps the export file open to write many batches
+    Header is written with the first batch
+    """
+    def __init__(self, filename, export_serializer, keep_ids=False):
+        """
+        :param keep_ids: bool -> Keep ids of written items in export order in ids
+        """
+        self.export_serializer = export_serializer
+        self.ids = [] if keep_ids is True else None
+        self._file = open(filename, mode="w", newline="")
+        self._writer = get_export_writer(self._file, export_serializer)
+        self._write_header = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def write(self, items, serializer_context):
+        """ Serialize and write batch of items """
+        rows = GenerateSegmentUtils.serialize_rows(items, self.export_serializer, serializer_context)
+        if self.ids is not None:
+            self.ids.extend(item.main.id for item in items if GenerateSegmentUtils.is_exported(item))
+        if self._write_header is True:
+            self._writer.writeheader()
+            self._write_header = False
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
 class GenerateSegmentUtils:
     _default_context = None
     segment = None
@@ -115,21 +156,28 @@ class GenerateSegmentUtils:
 
     def write_to_file(self, items, filename, export_serializer, serializer_context, write_header=False, mode="a"):
         """ Write data to csv file """
-        fieldnames = export_serializer.columns
+        rows = self.serialize_rows(items, export_serializer, serializer_context)
+        with open(filename, mode=mode, newline="") as file:
+            writer = get_export_writer(file, export_serializer)
+            if write_header is True:
+                writer.writeheader()
+            writer.writerows(rows)
+
+    @staticmethod
+    def is_exported(item):
+        """ YT_GENRE_CHANNELS have no data and should not be on any export """
+        return item.main.id not in YT_GENRE_CHANNELS
+
+    @staticmethod
+    def serialize_rows(items, export_serializer, serializer_context):
+        """ Serialize items to csv export rows """
         rows = []
         for item in items:
-            # YT_GENRE_CHANNELS have no data and should not be on any export
-            if item.main.id in YT_GENRE_CHANNELS:
+            if not GenerateSegmentUtils.is_exported(item):
                 continue
             row = export_serializer(item, context=serializer_context).data
             rows.append(row)
-
-        with open(filename, mode=mode, newline="") as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction="ignore", quotechar='"',
-                                    quoting=csv.QUOTE_MINIMAL)
-            if write_header is True:
-                writer.writeheader()
-            writer.writerows(rows)
+        return rows
 
     def add_aggregations(self, aggregations, items):
         """
@@ -1,7 +1,12 @@
+from itertools import islice
+
+from botocore.exceptions import ClientError
 from django.conf import settings
 from django.utils import timezone
 
+from segment.models.utils import export_ids_index
 from segment.models.utils.export_context_manager import ExportContextManager
+from utils.aws.s3_exporter import ReportNotFoundException
 from utils.aws.s3_exporter import S3Exporter
 from utils.utils import validate_youtube_url
 
@@ -19,14 +24,8 @@ class SegmentExporter(S3Exporter):
         raise NotImplementedError("Method should be defined segment models")
 
     def export_to_s3(self, segment, s3_key, queryset=None, extra_args=None):
-        extra_args = extra_args or {}
-        with ExportContextManager(segment=segment, queryset=queryset) as exported_file_name:
-            self._s3().upload_file(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Filename=exported_file_name,
-                ExtraArgs=extra_args,
-            )
+        content_exporter = ExportContextManager(segment=segment, queryset=queryset)
+        self.export_stream_to_s3(content_exporter, s3_key, get_key=False, extra_args=extra_args)
 
     def export_file_to_s3(self, filename, s3_key, extra_args=None):
         extra_args = extra_args or {}
@@ -52,8 +51,7 @@ class SegmentExporter(S3Exporter):
         export.save()
 
     def get_export_lines_stream(self, s3_key):
-        export_content = self._get_s3_object(s3_key, get_key=False)
-        for byte in export_content["Body"].iter_lines():
+        for byte in self.iter_s3_lines(s3_key, get_key=False):
             row = byte.decode("utf-8").split(",")
             yield row
 
@@ -64,11 +62,9 @@ class SegmentExporter(S3Exporter):
         """
         if s3_key is None:
             s3_key = self.segment.get_s3_key()
-        # pylint: disable=protected-access
-        export_content = self._get_s3_object(s3_key, get_key=False)
-        # pylint: enable=protected-access
         url_index = None
-        for byte in export_content["Body"].iter_lines():
+        # Export is read in byte ranges so that callers may stop early without downloading the entire export
+        for byte in self.iter_s3_lines(s3_key, get_key=False):
             row = (byte.decode("utf-8")).split(",")
             if url_index is None:
                 try:
@@ -79,6 +75,106 @@ class SegmentExporter(S3Exporter):
             item_id = validate_youtube_url(row[url_index], self.segment.segment_type)
             yield item_id
 
+    def get_export_ids(self, s3_key=None, limit=None):
+        """
+        Get Channel or video ids of export in export order, reading from the export ids index if possible
+            and falling back to parsing the csv export
+        :param s3_key: str -> S3 key of csv export
+        :param limit: int -> Maximum number of ids to get
+        :return: list
+        """
+        if s3_key is None:
+            s3_key = self.segment.get_s3_key()
+        ids = None
+        if settings.CTL_IDS_INDEX_ENABLED is True:
+            ids = self._get_index_ids(s3_key, limit=limit)
+        if ids is None:
+            ids = list(islice(self.get_extract_export_ids(s3_key), limit))
+        return ids
+
+    def export_ids_index(self, s3_key=None, ids=None, source_etag=None):
+        """
+        Upload packed ids index of csv export next to the export
+        :param s3_key: str -> S3 key of csv export
+        :param ids: list -> Ids of export. If None, ids are parsed from csv export
+        :param source_etag: str -> ETag of csv export. If None, ETag is retrieved from S3
+        :return: bytes | None -> Packed index or None if ids could not be packed
+        """
+        width = export_ids_index.ID_WIDTHS.get(self.segment.segment_type)
+        if width is None:
+            return None
+        if s3_key is None:
+            s3_key = self.segment.get_s3_key()
+        if source_etag is None:
+            source_etag = self._s3().head_object(Bucket=self.bucket_name, Key=s3_key)["ETag"]
+        if ids is None:
+            ids = self.get_extract_export_ids(s3_key)
+        metadata = {export_ids_index.SOURCE_ETAG_METADATA: source_etag}
+        try:
+            data = export_ids_index.pack_ids(ids, width)
+        except (AttributeError, ValueError, UnicodeError):
+            # Export contains invalid ids. An empty index marked as not indexable is stored so that readers read the
+            # csv export without trying to build the index again until the export changes
+            data = None
+            metadata[export_ids_index.NOT_INDEXABLE_METADATA] = "true"
+        self._s3().put_object(
+            Bucket=self.bucket_name,
+            Key=export_ids_index.get_index_key(s3_key),
+            Body=data or b"",
+            Metadata=metadata,
+        )
+        return data
+
+    def _get_index_ids(self, s3_key, limit=None):
+        """
+        Get ids from export ids index. Only limit * id width bytes of the index are requested, and the index is built
+            if it does not exist or was built from a previous version of the export
+        :param s3_key: str -> S3 key of csv export
+        :param limit: int -> Maximum number of ids to get
+        :return: list | None -> None if ids must be read from csv export
+        """
+        width = export_ids_index.ID_WIDTHS.get(self.segment.segment_type)
+        if width is None:
+            return None
+        s3 = self._s3()
+        try:
+            source_etag = s3.head_object(Bucket=self.bucket_name, Key=s3_key)["ETag"]
+        except ClientError:
+            return None
+        cache_key = (self.bucket_name, s3_key, source_etag)
+        if export_ids_index.is_local_not_indexable(cache_key):
+            return None
+        data = export_ids_index.get_local(cache_key, width, limit=limit)
+        if data is None:
+            index_key = export_ids_index.get_index_key(s3_key)
+            try:
+                index = s3.head_object(Bucket=self.bucket_name, Key=index_key)
+            except ClientError:
+                index = dict(Metadata={}, ContentLength=0)
+            metadata = index["Metadata"]
+            if metadata.get(export_ids_index.SOURCE_ETAG_METADATA) != source_etag:
+                ids = list(self.get_extract_export_ids(s3_key))
+                data = self.export_ids_index(s3_key, ids=ids, source_etag=source_etag)
+                if data is None:
+                    export_ids_index.set_local_not_indexable(cache_key)
+                    # Ids parsed to build the index are returned instead of reading the export again
+                    return ids[:limit]
+                complete = True
+            elif metadata.get(export_ids_index.NOT_INDEXABLE_METADATA):
+                export_ids_index.set_local_not_indexable(cache_key)
+                return None
+            else:
+                size = index["ContentLength"]
+                end = size if limit is None else min(size, limit * width)
+                try:
+                    data, _ = self.get_s3_object_range(index_key, 0, end - 1, get_key=False) if end > 0 else (b"", 0)
+                except ReportNotFoundException:
+                    return None
+                complete = end >= size
+            export_ids_index.set_local(cache_key, data, complete)
+        ids = export_ids_index.unpack_ids(data, width, limit=limit)
+        return ids
+
     def delete_export(self, s3_key=None):
         """
         Delete csv from s3
@@ -88,6 +184,7 @@ class SegmentExporter(S3Exporter):
         if s3_key is None:
             s3_key = self.segment.get_s3_key()
         self.delete_obj(s3_key)
+        self.delete_obj(export_ids_index.get_index_key(s3_key))
 
     def get_export_file(self, s3_key):
         export_content = self.get_s3_export_content(s3_key, get_key=False).iter_chunks()
@@ -167,7 +167,7 @@ def _get_placements(segment: CustomSegment, audit_id: AuditProcessor.pk) -> list
             .annotate(yt_id=F(audit_config["id_annotation"]))
             .values_list("yt_id", flat=True)
     )
-    ctl_ids = segment.s3.get_extract_export_ids()
+    ctl_ids = segment.s3.get_export_ids()
     to_export = []
     for placement_id in ctl_ids:
         if placement_id in clean_ids:
@@ -18,6 +18,7 @@ from es_components.models.video import VideoSectionBrandSafety
 from es_components.query_builder import QueryBuilder
 from es_components.tests.utils import ESTestCase
 from segment.utils.bulk_search import bulk_search
+from segment.utils.bulk_search import bulk_search_raw
 from utils.unittests.int_iterator import int_iterator
 from utils.unittests.test_case import ExtendedAPITestCase
 
@@ -162,3 +163,34 @@ class BulkSearchTestCase(ExtendedAPITestCase, ESTestCase):
                 sort=model_map[model]["sort"],
                 cursor_field=model_map[model]["cursor_field"],
             )
+
+    def test_ties_not_dropped(self):
+        """ Test that documents sharing the same cursor value across batches are all retrieved """
+        channels = []
+        for _ in range(7):
+            channel = Channel(f"channel_{next(int_iterator)}")
+            channel.populate_stats(subscribers=100)
+            channel.brand_safety = ChannelSectionBrandSafety(overall_score=100)
+            channels.append(channel)
+        manager = ChannelManager(sections=(Sections.STATS, Sections.BRAND_SAFETY))
+        manager.upsert(channels)
+        query = QueryBuilder().build().must().range().field("brand_safety.overall_score").gte(100).get()
+        sort = [{SUBSCRIBERS_FIELD: {"order": SortDirections.DESCENDING}}]
+        batches = list(bulk_search(Channel, query, sort, SUBSCRIBERS_FIELD, batch_size=3))
+        retrieved = [item.main.id for batch in batches for item in batch]
+        self.assertEqual(len(batches), 3)
+        self.assertEqual(set(retrieved), {channel.main.id for channel in channels})
+        self.assertEqual(len(retrieved), len(channels))
+
+    def test_raw_hits(self):
+        """ Test that raw hit dicts are yielded with requested source fields """
+        channel = Channel(f"channel_{next(int_iterator)}")
+        channel.populate_stats(subscribers=1)
+        channel.brand_safety = ChannelSectionBrandSafety(overall_score=99)
+        manager = ChannelManager(sections=(Sections.STATS, Sections.BRAND_SAFETY))
+        manager.upsert([channel])
+        query = QueryBuilder().build().must().term().field("main.id").value(channel.main.id).get()
+        batches = list(bulk_search_raw(Channel, query, None, SUBSCRIBERS_FIELD, source=("main.id",)))
+        hits = [hit for batch in batches for hit in batch]
+        self.assertEqual(len(hits), 1)
+        self.assertEqual(hits[0]["_source"]["main"]["id"], channel.main.id)
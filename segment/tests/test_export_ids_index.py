@@ -0,0 +1,96 @@
+import os
+import tempfile
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.test import override_settings
+
+from segment.models.constants import SegmentTypeEnum
+from segment.models.persistent.constants import YT_GENRE_CHANNELS
+from segment.models.utils import export_ids_index
+from segment.models.utils.generate_segment_utils import ExportFileWriter
+from segment.models.utils.segment_exporter import SegmentExporter
+from utils.unittests.s3_mock import mock_s3
+
+
+@override_settings(CTL_IDS_INDEX_ENABLED=True)
+class ExportIdsIndexTestCase(SimpleTestCase):
+    s3_key = "test/export.csv"
+
+    def tearDown(self):
+        export_ids_index.clear_local()
+
+    def _get_exporter(self, segment_type=SegmentTypeEnum.CHANNEL.value):
+        segment = MagicMock(segment_type=segment_type)
+        segment.get_s3_key.return_value = self.s3_key
+        exporter = SegmentExporter(segment, bucket_name=settings.AMAZON_S3_BUCKET_NAME)
+        return exporter
+
+    def _upload_export(self, exporter, ids):
+        lines = ["URL"] + [f"https://www.youtube.com/channel/{_id}" for _id in ids]
+        with exporter.open_upload(self.s3_key, get_key=False) as upload:
+            upload.write("\r\n".join(lines))
+
+    def test_pack_ids(self):
+        ids = ["a" * 11, "b" * 11]
+        data = export_ids_index.pack_ids(ids, 11)
+        self.assertEqual(len(data), 22)
+        self.assertEqual(export_ids_index.unpack_ids(data, 11), ids)
+        self.assertEqual(export_ids_index.unpack_ids(data, 11, limit=1), ids[:1])
+        with self.assertRaises(ValueError):
+            export_ids_index.pack_ids(["a" * 24], 11)
+
+    @mock_s3
+    def test_index_built_and_read(self):
+        """ Test index is built from export on first read and ids are then read from index """
+        exporter = self._get_exporter()
+        ids = [f"channel_{i}".zfill(24) for i in range(5)]
+        self._upload_export(exporter, ids)
+        self.assertEqual(exporter.get_export_ids(limit=2), ids[:2])
+        self.assertTrue(exporter.exists(export_ids_index.get_index_key(self.s3_key), get_key=False))
+
+        export_ids_index.clear_local()
+        with patch.object(SegmentExporter, "get_extract_export_ids") as mock_get_ids:
+            self.assertEqual(exporter.get_export_ids(limit=3), ids[:3])
+            self.assertEqual(exporter.get_export_ids(), ids)
+        mock_get_ids.assert_not_called()
+
+    @mock_s3
+    def test_index_rebuilt_for_new_export(self):
+        """ Test index is rebuilt if export is overwritten after index was built """
+        exporter = self._get_exporter()
+        self._upload_export(exporter, [f"channel_{i}".zfill(24) for i in range(5)])
+        exporter.get_export_ids()
+        new_ids = [f"new_channel_{i}".zfill(24) for i in range(3)]
+        self._upload_export(exporter, new_ids)
+        self.assertEqual(exporter.get_export_ids(), new_ids)
+
+    @mock_s3
+    def test_invalid_ids_read_from_export(self):
+        """ Test exports with ids that can not be packed are marked as not indexable and read from csv export """
+        exporter = self._get_exporter(segment_type=SegmentTypeEnum.VIDEO.value)
+        with exporter.open_upload(self.s3_key, get_key=False) as upload:
+            upload.write("URL\r\nhttps://www.youtube.com/watch?v=aaaaaaaaaaa\r\ninvalid")
+        self.assertEqual(exporter.get_export_ids(), ["aaaaaaaaaaa", None])
+        index = exporter._s3().head_object(Bucket=exporter.bucket_name,
+                                           Key=export_ids_index.get_index_key(self.s3_key))
+        self.assertEqual(index["Metadata"][export_ids_index.NOT_INDEXABLE_METADATA], "true")
+
+        export_ids_index.clear_local()
+        with patch.object(SegmentExporter, "export_ids_index") as mock_export_index:
+            self.assertEqual(exporter.get_export_ids(limit=1), ["aaaaaaaaaaa"])
+            self.assertEqual(exporter.get_export_ids(limit=1), ["aaaaaaaaaaa"])
+        mock_export_index.assert_not_called()
+
+    def test_writer_keeps_written_ids(self):
+        """ Test ids kept for the index are the ids written to the export, which excludes genre channels """
+        ids = ["channel_1".zfill(24), next(iter(YT_GENRE_CHANNELS)), "channel_2".zfill(24)]
+        items = [MagicMock(main=MagicMock(id=item_id)) for item_id in ids]
+        serializer = MagicMock(columns=["URL"])
+        serializer.return_value.data = dict(URL="url")
+        with tempfile.TemporaryDirectory() as directory:
+            with ExportFileWriter(os.path.join(directory, "export.csv"), serializer, keep_ids=True) as writer:
+                writer.write(items, {})
+        self.assertEqual(writer.ids, [ids[0], ids[2]])
@@ -1,20 +1,28 @@
-from operator import attrgetter
+import logging
 
+from elasticsearch.exceptions import TransportError
 from elasticsearch_dsl import Q
+from elasticsearch_dsl.connections import connections
 
 from es_components.constants import MAIN_ID_FIELD
 from es_components.constants import SortDirections
 from es_components.query_builder import QueryBuilder
 
+# Keep alive for point in time between each batch request
+PIT_KEEP_ALIVE = "5m"
+
+logger = logging.getLogger(__name__)
+
 
 def bulk_search(model, query, sort, cursor_field, batch_size=10000, source=None, options=None, direction=0,
-                include_cursor_exclusions=False):
+                include_cursor_exclusions=False, raw=False):
     """
-    Util function to retrieve items greater than Elasticsearch limit by using cursor
+    Util function to retrieve items greater than Elasticsearch limit by using a point in time and search_after cursor
     :param model: Elasticsearch model
     :param query: Base query
     :param sort: list
-    :param cursor_field: str -> Field to use as cursor when retrieving items
+    :param cursor_field: str -> Field that items are paged by. Items without the field are only retrieved if
+        include_cursor_exclusions is True
     :param options: list -> Additional queries to sequentially apply to base query
         This is to ensure retrieving items with specific filters in order
         # First retrieve all items with monetization, then all items without monetization
@@ -24,16 +32,20 @@ def bulk_search(model, query, sort, cursor_field, batch_size=10000, source=None,
         ]
     :param batch_size: int
     :param source: list[str] -> Returned document fields to deserialize
-    :param direction:
+    :param direction: Used to sort by cursor_field if sort is not provided
         0 -> Retrieve items descending
         1 -> Retrieve items ascending
     :param include_cursor_exclusions: tells the search generator to include results which were excluded as a result of
         the cursor_field option
+    :param raw: bool -> Yield lists of raw Elasticsearch hit dicts instead of model instances
     :return:
     """
-    base_search = model.search()
-    if sort:
-        base_search = base_search.sort(*sort)
+    if direction not in (0, 1):
+        raise ValueError("direction kwarg must be 0 or 1")
+    if not sort:
+        order = SortDirections.DESCENDING if direction == 0 else SortDirections.ASCENDING
+        sort = [{cursor_field: {"order": order}}]
+    base_search = model.search().sort(*with_tiebreaker(sort))
     if source:
         base_search = base_search.source(source)
     # If no options set, use base query
@@ -41,8 +53,8 @@ def bulk_search(model, query, sort, cursor_field, batch_size=10000, source=None,
         options = [None]
     # Create generator for each option to yield all results from
     generators = [
-        search_generator(model, base_search, query, cursor_field, size=batch_size, option=option, direction=direction,
-                         include_cursor_exclusions=include_cursor_exclusions)
+        search_generator(model, base_search, query, cursor_field, size=batch_size, option=option,
+                         include_cursor_exclusions=include_cursor_exclusions, raw=raw)
         for option in options
     ]
     # Yield all results from each generator sequentially
@@ -50,56 +62,35 @@ def bulk_search(model, query, sort, cursor_field, batch_size=10000, source=None,
         yield from gen
 
 
-def search_generator(model, search, query, cursor_field, size=1000, option=None, direction=0, include_cursor_exclusions=False):
+def bulk_search_raw(model, query, sort, cursor_field, **kwargs):
+    """
+    Convenience function for bulk_search that yields lists of raw Elasticsearch hit dicts
+        Skips model instance construction for export paths that only require a few fields
+    """
+    yield from bulk_search(model, query, sort, cursor_field, raw=True, **kwargs)
+
+
+def search_generator(model, search, query, cursor_field, size=1000, option=None, include_cursor_exclusions=False,
+                     raw=False):
     """
     Helper function to encapsulate batch cursor queries
-        Search object should have all options except query applied
-        Max / min item obtained using query and sort applied to search object and used as initial cursor
-        Direction determines subsequent gte or lte range queries
-        First query uses gte / lte option to include min/max item in first batch
-        Subsequent queries will use gt / lt to exclude last item retrieved in each batch
+        Search object should have all options except query applied, and must be sorted with a unique tiebreaker so
+        that documents sharing the same sort values are not dropped between batches
     :param model: Elasticsearch model. Will be used to potentially recurse with bulk_search
     :param search: Elasticsearch Search object
     :param query: QueryBuilder object
     :param cursor_field: str
     :param size: int
     :param option: QueryBuilder object
-    :param direction: int
     :param include_cursor_exclusions: include/exclude results which were excluded as a result of the cursor_field option
+    :param raw: bool -> Yield lists of raw hit dicts instead of model instances
     :return:
     """
-    try:
-        search.query = query
-        first = search.execute().hits[0]
-        cursor = attrgetter(cursor_field)(first)
-    except IndexError:
-        return
     if isinstance(query, dict):
         query = Q(query)
-    if direction not in (0, 1):
-        raise ValueError("direction kwarg must be 0 or 1")
-
-    if direction == 0:
-        range_opt = "lte"
-        cursor = cursor if cursor is not None else 10**15
-    else:
-        range_opt = "gte"
-        cursor = cursor if cursor is not None else 0
-    while True:
-        cursor_query = QueryBuilder().build().must().range().field(cursor_field)
-        cursor_query = getattr(cursor_query, range_opt)(cursor).get()
-        full_query = query & cursor_query & option if option is not None else query & cursor_query
-        search.query = full_query
-        results = search[0:size].execute()
-        data = results.hits
-        if data:
-            yield data
-            cursor = attrgetter(cursor_field)(data[-1])
-            # first has been processed, change queries to lt / gt
-            range_opt = range_opt[:-1] if first is not None else range_opt
-            first = None
-        else:
-            break
+    cursor_query = QueryBuilder().build().must().exists().field(cursor_field).get()
+    full_query = query & cursor_query & option if option is not None else query & cursor_query
+    yield from search_after_generator(search.query(full_query), size=size, raw=raw)
 
     # add in results as part of the option but for whom the sort field does not exist
     if include_cursor_exclusions:
@@ -109,10 +100,84 @@ def search_generator(model, search, query, cursor_field, size=1000, option=None,
             else query & cursor_exclusion_query
         results = []
         # Recursively call bulk_search to retrieve rest of items with exclusion query
-        for batch in bulk_search(model, full_cursor_exclusion_query, [{MAIN_ID_FIELD: {"order": SortDirections.DESCENDING}}], "main.id"):
+        exclusion_sort = [{MAIN_ID_FIELD: {"order": SortDirections.DESCENDING}}]
+        source = search.to_dict().get("_source")
+        for batch in bulk_search(model, full_cursor_exclusion_query, exclusion_sort, MAIN_ID_FIELD, batch_size=size,
+                                 source=source, raw=raw):
             for hit in batch:
                 results.append(hit)
                 if len(results) >= size:
                     yield results
-                    results.clear()
+                    results = []
         yield results
+
+
+def search_after_generator(search, size=1000, raw=False):
+    """
+    Page through all results of search in a point in time with search_after
+    Falls back to search_after on the live index if a point in time can not be opened
+    :param search: Elasticsearch Search object with query and sort applied
+    :param size: int
+    :param raw: bool -> Yield lists of raw hit dicts instead of model instances
+    :return:
+    """
+    es = connections.get_connection(search._using)
+    pit_id = _open_point_in_time(es, search._index)
+    if pit_id is not None:
+        # Point in time searches must not target an index
+        search = search.index()
+    last_sort = None
+    try:
+        while True:
+            page = search[0:size]
+            if pit_id is not None:
+                page = page.extra(pit={"id": pit_id, "keep_alive": PIT_KEEP_ALIVE})
+            if last_sort is not None:
+                page = page.extra(search_after=last_sort)
+            response = page.execute()
+            response_data = response.to_dict()
+            hits = response_data["hits"]["hits"]
+            if not hits:
+                break
+            # Point in time id may change between requests
+            pit_id = response_data.get("pit_id", pit_id)
+            yield hits if raw is True else response.hits
+            if len(hits) < size:
+                break
+            last_sort = hits[-1]["sort"]
+    finally:
+        _close_point_in_time(es, pit_id)
+
+
+def with_tiebreaker(sort):
+    """
+    Add unique main.id sort to sort if not already present so that search_after cursors are unique
+    :param sort: list
+    :return: list
+    """
+    sort = list(sort)
+    sort_fields = set()
+    for field in sort:
+        name = field if isinstance(field, str) else next(iter(field))
+        sort_fields.add(name.lstrip("-"))
+    if MAIN_ID_FIELD not in sort_fields:
+        sort.append({MAIN_ID_FIELD: {"order": SortDirections.ASCENDING}})
+    return sort
+
+
+def _open_point_in_time(es, index):
+    try:
+        pit_id = es.open_point_in_time(index=index, keep_alive=PIT_KEEP_ALIVE)["id"]
+    except (TransportError, AttributeError):
+        logger.warning("Unable to open point in time for index: %s. Paging live index.", index)
+        pit_id = None
+    return pit_id
+
+
+def _close_point_in_time(es, pit_id):
+    if pit_id is None:
+        return
+    try:
+        es.close_point_in_time(body={"id": pit_id})
+    except TransportError:
+        pass
@@ -3,6 +3,7 @@ import os
 import tempfile
 from collections import defaultdict
 
+from botocore.exceptions import ClientError
 from django.conf import settings
 from elasticsearch_dsl import Q
 
@@ -18,6 +19,7 @@ from segment.utils.utils import delete_related
 from userprofile.constants import StaticPermissions
 from utils.exception import retry
 from utils.utils import chunks_generator
+from utils.utils import prefetch_generator
 
 
 BATCH_SIZE = os.environ.get("CTL_BATCH_SIZE", 2000)
@@ -45,6 +47,7 @@ def generate_segment(segment, query_dict, size, sort=None, s3_key=None, admin_s3
     :return:
     """
     # Keep import statement here to avoid circular import
+    from segment.models.utils.generate_segment_utils import ExportFileWriter
     from segment.models.utils.generate_segment_utils import GenerateSegmentUtils
     generate_utils = GenerateSegmentUtils(segment)
     # file for admin or vetted only exports
@@ -74,11 +77,15 @@ def generate_segment(segment, query_dict, size, sort=None, s3_key=None, admin_s3
         item_ids = []
         aggregations = defaultdict(int)
         default_search_config = generate_utils.default_search_config
-        # Must use bool flag to determine if we should write header instead of seen. If there is a source_list, then
-        # a batch may be empty since we check set membership for the current bulk_search batch in the source list
-        write_header = True
         if options is None:
             options = default_search_config["options"]
+        is_admin = segment.owner.has_permission(StaticPermissions.BUILD__CTL_EXPORT_ADMIN)
+        # Export files are kept open and written to with each batch
+        admin_writer = ExportFileWriter(admin_filename, segment.admin_export_serializer)
+        user_writer = ExportFileWriter(filename, segment.user_export_serializer,
+                                       keep_ids=settings.CTL_IDS_INDEX_ENABLED) if segment.is_vetting is False \
+            else None
+        es_generator = None
         try:
             if source_list:
                 es_generator = with_source_generator(segment, source_list, query_dict, sort)
@@ -88,10 +95,11 @@ def generate_segment(segment, query_dict, size, sort=None, s3_key=None, admin_s3
                 )
                 es_generator = bulk_search(segment.es_manager.model, query_dict, sort,
                                            default_search_config["cursor_field"], **bulk_search_kwargs)
-
+            # Retrieve and clean blocklist items for the next batch while the current batch is enriched and written
+            es_generator = prefetch_generator(
+                es_generator, transform=lambda batch: generate_utils.clean_blocklist(batch, segment.segment_type)
+            )
             for batch in es_generator:
-                # Clean blocklist items
-                batch = generate_utils.clean_blocklist(batch, segment.segment_type)
                 # Ensure that we are not adding items past limit
                 batch = batch[:size - seen]
                 batch_item_ids = [item.main.id for item in batch]
@@ -99,26 +107,29 @@ def generate_segment(segment, query_dict, size, sort=None, s3_key=None, admin_s3
                 # Get the current batch's Postgres vetting data context for serialization
                 vetting = generate_utils.get_vetting_data(segment, batch_item_ids)
                 context["vetting"] = vetting
-                generate_utils.write_to_file(batch, admin_filename, segment.admin_export_serializer, \
-                                             context, write_header=write_header is True)
+                admin_writer.write(batch, context)
                 # Only write user version ctl data up to user export cap size
-                if (segment.is_vetting is False) and (seen < user_size):
+                if user_writer is not None and seen < user_size:
                     # context not required since user export only contains URL data
-                    generate_utils.write_to_file(batch[:user_size - seen], filename, segment.user_export_serializer, \
-                                                 {}, write_header=write_header is True)
+                    user_writer.write(batch[:user_size - seen], {})
                     # if segment is user generated, add aggregations for user version export
-                    if not segment.owner.has_permission(StaticPermissions.BUILD__CTL_EXPORT_ADMIN):
+                    if not is_admin:
                         generate_utils.add_aggregations(aggregations, batch[:user_size - seen])
                 # if segment is admin generated, add aggregations for admin version export
-                if segment.owner.has_permission(StaticPermissions.BUILD__CTL_EXPORT_ADMIN):
+                if is_admin:
                     generate_utils.add_aggregations(aggregations, batch)
                 seen += len(batch_item_ids)
-                write_header = False
                 if seen >= size:
                     raise MaxItemsException
         except MaxItemsException:
             pass
-        if (not segment.owner.has_permission(StaticPermissions.BUILD__CTL_EXPORT_ADMIN)) and (seen > user_size):
+        finally:
+            if es_generator is not None:
+                es_generator.close()
+            admin_writer.close()
+            if user_writer is not None:
+                user_writer.close()
+        if not is_admin and seen > user_size:
             seen = user_size
         generate_utils.finalize_aggregations(aggregations, seen)
         if add_uuid is True:
@@ -151,6 +162,13 @@ def generate_segment(segment, query_dict, size, sort=None, s3_key=None, admin_s3
             segment.s3.export_file_to_s3(admin_filename, admin_s3_key, extra_args={"ContentDisposition": content_disposition})
             if segment.is_vetting is False:
                 segment.s3.export_file_to_s3(filename, s3_key, extra_args={"ContentDisposition": content_disposition})
+                if settings.CTL_IDS_INDEX_ENABLED is True:
+                    # Index is optional as export ids are read from the csv export if it does not exist. Index is
+                    # built from the ids written to the export, which excludes YT_GENRE_CHANNELS
+                    try:
+                        segment.s3.export_ids_index(s3_key, ids=user_writer.ids)
+                    except ClientError:
+                        logger.exception("Unable to export ids index for segment: %s", segment.id)
             download_url = segment.s3.generate_temporary_url(admin_s3_key, time_limit=3600 * 24)
             results = {
                 "statistics": statistics,
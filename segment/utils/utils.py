@@ -235,12 +235,13 @@ def get_gads_sync_code(account: Account):
     for sync in syncs:
         ctl_to_adgroups[sync.segment_id].append(sync.adgroup_id)
     sync_data = {}
+    segments = CustomSegment.objects.in_bulk(list(ctl_to_adgroups))
     # Prepare data for Google Ads scripts
     for segment_id in ctl_to_adgroups:
-        segment = CustomSegment.objects.get(id=segment_id)
+        segment = segments[segment_id]
         # Placement type is required as video and channel function names in Google Ads scripts are different
         placement_type = SegmentTypeEnum(segment.segment_type).name.capitalize()
-        placement_ids = list(segment.s3.get_extract_export_ids())[:GADS_ADGROUP_PLACEMENT_LIMIT]
+        placement_ids = segment.s3.get_export_ids(limit=GADS_ADGROUP_PLACEMENT_LIMIT)
         sync_data[segment_id] = {
             "adgroupIds": ctl_to_adgroups[segment_id],
             "placementIds": placement_ids,
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.test import override_settings
+
+from transcripts.utils import YTTranscriptsScraper
+
+CAPTIONS_URL = "http://www.youtube.com/api/timedtext?v={vid_id}&lang=en"
+VIDEO_RESPONSE = '"captions":{"playerCaptionsTracklistRenderer":{"captionTracks":[{"baseUrl":"%s"' % CAPTIONS_URL
+CAPTIONS_RESPONSE = """<?xml version="1.0" encoding="utf-8"?>""" \
+    """<transcript><text start="0.74">hello world</text></transcript>"""
+
+
+class FakeResponse:
+    def __init__(self, status, text):
+        self.status = status
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        return False
+
+    async def text(self):
+        return self._text
+
+
+class FakeSession:
+    """ Video pages of videos with "missing" in id have no captions, requests for "down" videos always fail """
+    def __init__(self, *_, **__):
+        self.urls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        return False
+
+    # pylint: disable=unused-argument
+    def get(self, url, proxy=None, headers=None):
+        self.urls.append(url)
+        if "down" in url:
+            return FakeResponse(503, "")
+        if "timedtext" in url:
+            return FakeResponse(200, CAPTIONS_RESPONSE)
+        vid_id = url.split("v=")[1]
+        return FakeResponse(200, "" if "missing" in vid_id else VIDEO_RESPONSE.replace("{vid_id}", vid_id))
+    # pylint: enable=unused-argument
+
+
+@override_settings(TRANSCRIPTS_ASYNC_SCRAPER=True)
+class AsyncTranscriptsScraperTestCase(SimpleTestCase):
+    def test_results(self):
+        """ Test async scraper exposes successful videos and failure reasons """
+        session = FakeSession()
+        with patch("transcripts.utils.ClientSession", return_value=session), \
+                patch("transcripts.utils.TCPConnector", MagicMock()), \
+                patch.object(YTTranscriptsScraper, "RETRY_BACKOFF", 0):
+            scraper = YTTranscriptsScraper(vid_ids=["video_1", "video_missing", "video_down"])
+            scraper.run_scraper()
+
+        self.assertEqual(set(scraper.successful_vids.keys()), {"video_1"})
+        self.assertEqual(scraper.successful_vids["video_1"].captions, "hello world")
+        self.assertEqual(scraper.successful_vids["video_1"].captions_language, "en")
+        self.assertEqual(scraper.num_failed_vids, 2)
+        self.assertEqual(str(scraper.failure_reasons["video_down"]), "Exceeded connection attempts to URL.")
+        self.assertIsInstance(scraper.failure_reasons["video_missing"], IndexError)
+        self.assertEqual(session.urls.count("http://www.youtube.com/watch?v=video_down"),
+                         YTTranscriptsScraper.NUM_RETRIES + 1)
@@ -1,8 +1,14 @@
+import asyncio
+import random
 import re
 import requests
 from html import unescape
 from threading import Thread
 
+from aiohttp import ClientError
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
 from bs4 import BeautifulSoup
 from celery.exceptions import Retry
 from datetime import timedelta
@@ -43,6 +49,8 @@ class YTTranscriptsScraper(object):
     """ Utility Class for scraping ASR Transcripts"""
     EMAILER_LOCK_NAME = "transcripts_alert_emailer"
     NUM_RETRIES = 3
+    # Seconds to wait before the first retry of async requests, doubled for each following retry
+    RETRY_BACKOFF = 0.5
     NUM_THREADS = settings.TRANSCRIPTS_NUM_THREADS
     TIMEOUT = settings.TRANSCRIPTS_TIMEOUT
     YT_HEADERS = {
@@ -77,6 +85,29 @@ class YTTranscriptsScraper(object):
             self.vids.append(yt_vid)
 
     def retrieve_transcripts(self):
+        """ Retrieve ASR captions for all YTVideo objects in self.vids """
+        if settings.TRANSCRIPTS_ASYNC_SCRAPER:
+            asyncio.run(self.async_retrieve_transcripts())
+        else:
+            self.threaded_retrieve_transcripts()
+
+    async def async_retrieve_transcripts(self):
+        """
+        Asynchronous method for retrieving ASR captions for all YTVideo objects in self.vids
+        At most NUM_THREADS videos are scraped at once, and a new video is started as soon as any video finishes.
+        Requests share a session with a pool of NUM_THREADS connections to the proxy
+        """
+        semaphore = asyncio.Semaphore(self.NUM_THREADS)
+
+        async def get_captions(vid, session):
+            async with semaphore:
+                await vid.async_get_captions(session)
+
+        connector = TCPConnector(limit=self.NUM_THREADS)
+        async with ClientSession(connector=connector, timeout=ClientTimeout(total=self.TIMEOUT)) as session:
+            await asyncio.gather(*[get_captions(vid, session) for vid in self.vids])
+
+    def threaded_retrieve_transcripts(self):
         """ Multithreaded method for Retrieving ASR captions for all YTVideo objects in self.vids """
         threads = []
         for vid in self.vids:
@@ -122,6 +153,10 @@ class YTTranscriptsScraper(object):
             "https": f"http://{self.host}:{self.port}"
         }
 
+    def get_async_proxy(self):
+        """ Generates proxy URL to pass in as the value for the proxy parameter when making requests with aiohttp """
+        return f"http://{self.host}:{self.port}"
+
     def get_user_agent(self):
         """
         This method was used for User Agent switching, but the User Agent switching package we used before broke, so now
@@ -238,21 +273,46 @@ class YTVideo(object):
         """
         try:
             vid_response, self.vid_url_status = self.get_response_through_proxy(self.scraper, self.vid_url)
-            raw_captions_url = self.get_raw_captions_url(vid_response)
-            self.captions_url = self.clean_url(raw_captions_url)
+            self.set_captions_url(vid_response)
             self.captions_url_response, self.captions_url_status = \
                 self.get_response_through_proxy(self.scraper, self.captions_url)
-            soup = BeautifulSoup(self.captions_url_response, 'xml')
-            captions = get_formatted_captions_from_soup(soup)
-            if not captions:
-                raise ValueError("Caption is an empty string")
-            self.captions = captions
-            self.captions_language = self.get_captions_language(self.captions_url)
+            self.set_captions()
         # pylint: disable=broad-except
         except Exception as e:
             # pylint: enable=broad-except
             self.update_failure_reason(e)
 
+    async def async_get_captions(self, session: ClientSession):
+        """
+        Asynchronous version of get_captions making requests with the given aiohttp session
+        :param session: ClientSession shared by all videos of scraper
+        """
+        try:
+            vid_response, self.vid_url_status = \
+                await self.async_get_response_through_proxy(self.scraper, session, self.vid_url)
+            self.set_captions_url(vid_response)
+            self.captions_url_response, self.captions_url_status = \
+                await self.async_get_response_through_proxy(self.scraper, session, self.captions_url)
+            self.set_captions()
+        # pylint: disable=broad-except
+        except Exception as e:
+            # pylint: enable=broad-except
+            self.update_failure_reason(e)
+
+    def set_captions_url(self, vid_response: str):
+        """ Find captions URL in the response from the YT Video's URL """
+        raw_captions_url = self.get_raw_captions_url(vid_response)
+        self.captions_url = self.clean_url(raw_captions_url)
+
+    def set_captions(self):
+        """ Clean and store captions and language from the response from the captions URL """
+        soup = BeautifulSoup(self.captions_url_response, 'xml')
+        captions = get_formatted_captions_from_soup(soup)
+        if not captions:
+            raise ValueError("Caption is an empty string")
+        self.captions = captions
+        self.captions_language = self.get_captions_language(self.captions_url)
+
     def get_response_through_proxy(self, scraper, url):
         """
         All scraper requests should be made through this method. It will handle all the proxy switching edge cases.
@@ -282,4 +342,22 @@ class YTVideo(object):
         response_status = response.status_code
         return response_text, response_status
 
+    async def async_get_response_through_proxy(self, scraper, session: ClientSession, url):
+        """
+        Asynchronous version of get_response_through_proxy. Requests are retried NUM_RETRIES times on connection
+        errors, timeouts and unsuccessful responses, with jittered exponential backoff between attempts so that
+        concurrent requests do not retry against the proxy at the same time
+        """
+        proxy = scraper.get_async_proxy()
+        for attempt in range(scraper.NUM_RETRIES + 1):
+            if attempt > 0:
+                await asyncio.sleep(scraper.RETRY_BACKOFF * 2 ** (attempt - 1) * random.uniform(0.5, 1))
+            try:
+                async with session.get(url, proxy=proxy, headers=scraper.get_headers()) as response:
+                    if response.status == 200:
+                        return await response.text(), response.status
+            except (ClientError, asyncio.TimeoutError):
+                continue
+        raise Exception("Exceeded connection attempts to URL.")
+
 # pylint: enable=too-many-instance-attributes
@@ -7,6 +7,7 @@ from userprofile.api.serializers import PermissionItemSerializer
 from userprofile.models import PermissionItem
 from userprofile.models import Role
 from userprofile.models import UserRole
+from userprofile.models import invalidate_cached_permissions
 
 
 class RoleSerializer(serializers.ModelSerializer):
@@ -76,6 +77,8 @@ class RoleSerializer(serializers.ModelSerializer):
         UserRole.objects.filter(user_id__in=user_ids).update(role=role)
         # Remove existing user roles from this role
         UserRole.objects.filter(role=role).exclude(user_id__in=user_ids).update(role=None)
+        # Bulk queries do not send model signals
+        invalidate_cached_permissions()
 
     def _update_default(self, permissions):
         all_perms = {
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase
+from django.test import override_settings
+
+from userprofile.constants import StaticPermissions
+from userprofile.models import PermissionItem
+from userprofile.models import Role
+from userprofile.models import UserRole
+from userprofile.models import clear_cached_permissions
+from utils import tiered_cache
+from utils.unittests.int_iterator import int_iterator
+from utils.unittests.redis_mock import FakeRedis
+
+
+@override_settings(TIERED_CACHE_ENABLED=True)
+class PermissionSnapshotTestCase(TransactionTestCase):
+    def setUp(self):
+        tiered_cache.clear_local()
+        clear_cached_permissions()
+        self.patcher = patch.object(tiered_cache, "redis", FakeRedis())
+        self.patcher.start()
+        PermissionItem.load_permissions()
+
+    def tearDown(self):
+        self.patcher.stop()
+        tiered_cache.clear_local()
+        clear_cached_permissions()
+
+    def _create_user(self, role=None):
+        user = get_user_model().objects.create(email=f"tester@{next(int_iterator)}.com")
+        if role is not None:
+            UserRole.objects.create(user=user, role=role)
+        return get_user_model().objects.get(id=user.id)
+
+    def test_permissions_resolved_once(self):
+        """ Test permissions are checked without queries after the snapshot is computed """
+        role = Role.objects.create(name="test", permissions={StaticPermissions.PERFORMIQ: True})
+        user = self._create_user(role=role)
+        self.assertTrue(user.has_permission(StaticPermissions.PERFORMIQ))
+        with self.assertNumQueries(0):
+            self.assertFalse(user.has_permission(StaticPermissions.ADMIN))
+            self.assertFalse(user.has_permission(StaticPermissions.USER_MANAGEMENT))
+
+    def test_shared_between_instances(self):
+        """ Test snapshot is reused by other instances of the same user """
+        user = self._create_user()
+        user.has_permission(StaticPermissions.PERFORMIQ)
+        other = get_user_model().objects.get(id=user.id)
+        with self.assertNumQueries(0):
+            self.assertFalse(other.has_permission(StaticPermissions.PERFORMIQ))
+
+    def test_separate_local_cache(self):
+        """ Test snapshots are not stored in the shared tiered cache and read the version stamp once """
+        user = self._create_user()
+        with patch.object(tiered_cache, "get_version", wraps=tiered_cache.get_version) as mock_get_version:
+            user.has_permission(StaticPermissions.PERFORMIQ)
+        mock_get_version.assert_called_once()
+        self.assertEqual(len(tiered_cache._local_cache), 0)
+
+    def test_invalidated_on_role_change(self):
+        """ Test cached snapshots are invalidated when roles change """
+        role = Role.objects.create(name="test", permissions={StaticPermissions.PERFORMIQ: False})
+        user = self._create_user(role=role)
+        self.assertFalse(user.has_permission(StaticPermissions.PERFORMIQ))
+        role.permissions = {StaticPermissions.PERFORMIQ: True}
+        role.save()
+        self.assertTrue(get_user_model().objects.get(id=user.id).has_permission(StaticPermissions.PERFORMIQ))
+
+    def test_invalid_permission(self):
+        user = self._create_user()
+        with self.assertRaises(Exception):
+            user.has_permission("invalid_permission")
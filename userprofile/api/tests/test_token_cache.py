@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.http import HttpRequest
+from django.test import override_settings
+from rest_framework.status import HTTP_200_OK
+from rest_framework.status import HTTP_401_UNAUTHORIZED
+
+from saas.urls.namespaces import Namespace
+from userprofile import token_cache
+from userprofile.api.urls.names import UserprofilePathName
+from userprofile.authentication import resolve_token
+from userprofile.models import UserDeviceToken
+from utils.unittests.redis_mock import FakeRedis
+from utils.unittests.reverse import reverse
+from utils.unittests.test_case import ExtendedAPITestCase
+
+
+@override_settings(AUTH_TOKEN_CACHE_ENABLED=True)
+class TokenCacheTestCase(ExtendedAPITestCase):
+    _url = reverse(UserprofilePathName.USER_PROFILE, [Namespace.USER_PROFILE])
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.patcher = patch.object(token_cache, "redis", self.redis)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_resolved_once_per_request(self):
+        """ Test token is resolved with a single query per request """
+        user = self.create_test_user()
+        key = UserDeviceToken.objects.filter(user=user).last().key
+        request = HttpRequest()
+        with self.assertNumQueries(1):
+            self.assertEqual(resolve_token(key, request=request).user, user)
+        self.redis.data.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_token(key, request=request).user, user)
+
+    def test_shared_between_requests(self):
+        """ Test tokens resolved by one request are served from the shared cache to the next requests """
+        user = self.create_test_user()
+        token = UserDeviceToken.objects.filter(user=user).last()
+        resolve_token(token.key, request=HttpRequest())
+        # Only the user is loaded by id
+        with self.assertNumQueries(1):
+            cached_token = resolve_token(token.key, request=HttpRequest())
+        self.assertEqual(cached_token.user, user)
+        self.assertEqual((cached_token.id, cached_token.key, cached_token.device_id, cached_token.created_at),
+                         (token.id, token.key, token.device_id, token.created_at))
+
+    def test_secrets_not_cached(self):
+        """ Test cached entries do not contain the token key or user data """
+        user = self.create_test_user()
+        key = UserDeviceToken.objects.filter(user=user).last().key
+        resolve_token(key)
+        value = self.redis.data[token_cache.get_cache_key(key)]
+        self.assertNotIn(key.encode(), value)
+        self.assertNotIn(user.password.encode(), value)
+        self.assertNotIn(user.email.encode(), value)
+
+    def test_inactive_user_rejected(self):
+        """ Test cached tokens of users deactivated without model signals are rejected """
+        user = self.create_test_user()
+        self.assertEqual(self.client.get(self._url).status_code, HTTP_200_OK)
+        get_user_model().objects.filter(id=user.id).update(is_active=False)
+        self.assertEqual(self.client.get(self._url).status_code, HTTP_401_UNAUTHORIZED)
+
+    def test_invalidated_on_delete(self):
+        """ Test deleted tokens are removed from the shared cache """
+        user = self.create_test_user()
+        token = UserDeviceToken.objects.filter(user=user).last()
+        resolve_token(token.key)
+        token.delete()
+        self.assertIsNone(resolve_token(token.key))
+
+    def test_invalidated_on_user_save(self):
+        """ Test cached tokens are refreshed when their user is updated """
+        user = self.create_test_user()
+        key = UserDeviceToken.objects.filter(user=user).last().key
+        resolve_token(key)
+        user.first_name = "Updated"
+        user.save()
+        self.assertEqual(resolve_token(key).user.first_name, "Updated")
+
+    def test_logout(self):
+        """ Test tokens can not be used after logout """
+        self.create_test_user()
+        self.assertEqual(self.client.get(self._url).status_code, HTTP_200_OK)
+        self.client.delete(reverse(UserprofilePathName.AUTH, [Namespace.USER_PROFILE]))
+        self.assertEqual(self.client.get(self._url).status_code, HTTP_401_UNAUTHORIZED)
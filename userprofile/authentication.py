@@ -1,11 +1,61 @@
 from datetime import timedelta
+from uuid import UUID
 
 from django.conf import settings
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
+from userprofile import token_cache
 from userprofile.models import UserDeviceToken
+from userprofile.models import UserProfile
+
+
+def resolve_token(key, request=None):
+    """
+    Get token with its user, checking tokens resolved during request and the shared token cache before the database
+        Users of cached tokens are always loaded by id, so user changes apply immediately
+    :param key: str -> Token key
+    :param request: HttpRequest | rest_framework.request.Request -> Request to memoize resolved token on
+    :return: UserDeviceToken | None
+    """
+    memo = token_cache.get_request_memo(request) if request is not None else {}
+    if key in memo:
+        return memo[key]
+    cached = token_cache.get_token(key) if token_cache.is_enabled() else None
+    token = load_cached_token(key, cached) if cached is not None else None
+    if token is None:
+        try:
+            token = UserDeviceToken.objects.select_related("user").get(key=key)
+        except UserDeviceToken.DoesNotExist:
+            token = None
+        else:
+            if token_cache.is_enabled():
+                token_cache.set_token(key, token)
+    memo[key] = token
+    return token
+
+
+def load_cached_token(key, cached):
+    """
+    Rebuild token from cached token fields and its user loaded by id
+    :param key: str -> Token key
+    :param cached: dict -> Token fields cached with token_cache.set_token
+    :return: UserDeviceToken | None -> None if user does not exist
+    """
+    try:
+        user = UserProfile.objects.get(pk=cached["user_id"])
+    except UserProfile.DoesNotExist:
+        return None
+    token = UserDeviceToken.from_db(
+        None,
+        ["id", "user_id", "key", "device_id", "created_at"],
+        [cached["id"], user.id, key, UUID(cached["device_id"]), parse_datetime(cached["created_at"])],
+    )
+    token.user = user
+    return token
 
 
 class ExpiringTokenAuthentication(TokenAuthentication):
@@ -14,8 +64,17 @@ class ExpiringTokenAuthentication(TokenAuthentication):
     """
     model = UserDeviceToken
 
+    def authenticate(self, request):
+        self.request = request
+        return super().authenticate(request)
+
     def authenticate_credentials(self, key):
-        user, token = super().authenticate_credentials(key)
+        token = resolve_token(key, request=getattr(self, "request", None))
+        # Same checks as TokenAuthentication.authenticate_credentials
+        if token is None:
+            raise AuthenticationFailed(_("Invalid token."))
+        if not token.user.is_active:
+            raise AuthenticationFailed(_("User inactive or deleted."))
         threshold = timezone.now() - timedelta(days=settings.AUTH_TOKEN_EXPIRES)
         if token.created_at < threshold:
             raise AuthenticationFailed("Token expired. Please log in again.")
@@ -23,4 +82,4 @@ class ExpiringTokenAuthentication(TokenAuthentication):
             raise AuthenticationFailed(
                 "You have provided a temporary token which does not grant you access to this page. Please log in again."
             )
-        return user, token
+        return token.user, token
@@ -6,7 +6,7 @@ from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
-from userprofile.models import UserDeviceToken
+from userprofile.authentication import resolve_token
 from userprofile.utils import is_apex_user
 from userprofile.utils import is_correct_apex_domain
 
@@ -18,14 +18,12 @@ class ApexUserCheck(MiddlewareMixin):
         if header_token is None:
             return None
 
-        try:
-            token = sub("Token", "", request.META.get("HTTP_AUTHORIZATION", None))
-            token_obj = UserDeviceToken.objects.get(key=token.strip())
-            user = token_obj.user
-        except UserDeviceToken.DoesNotExist:
+        token = sub("Token", "", header_token)
+        token_obj = resolve_token(token.strip(), request=request)
+        if token_obj is None:
             return None
 
-        user_email = user.email
+        user_email = token_obj.user.email
         request_origin = request.META.get("HTTP_ORIGIN") or request.META.get("HTTP_REFERER")
 
         if not request_origin:
@@ -4,8 +4,10 @@ Userprofile models module
 import binascii
 import logging
 import os
+import threading
 from uuid import uuid4
 
+from cachetools import TTLCache
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
@@ -13,8 +15,13 @@ from django.contrib.auth.models import PermissionsMixin
 from django.contrib.auth.models import UserManager
 from django.core import validators
 from django.db import models
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
+from redis.exceptions import ConnectionError
 
 from .constants import StaticPermissions
 from administration.notifications import send_html_email
@@ -22,10 +29,20 @@ from aw_reporting.demo.data import DEMO_ACCOUNT_ID
 from aw_reporting.models import Opportunity
 from userprofile.constants import DEFAULT_DOMAIN
 from userprofile.constants import UserSettingsKey
+from userprofile import token_cache
+from utils import tiered_cache
 from utils.models import Timestampable
 
 logger = logging.getLogger(__name__)
 
+PERMISSIONS_CACHE_NAME = "user_permissions"
+# Role permissions of each user and the default permissions are kept apart from other tiered cache entries, so
+# snapshots of many users do not evict those entries or each other
+PERMISSIONS_LOCAL_CACHE_SIZE = 10000
+
+_permissions_cache = TTLCache(maxsize=PERMISSIONS_LOCAL_CACHE_SIZE, ttl=tiered_cache.LOCAL_CACHE_TTL)
+_permissions_cache_lock = threading.Lock()
+
 
 def get_default_settings():
     return {
@@ -131,22 +148,43 @@ class UserProfile(AbstractBaseUser, PermissionsMixin):
         :param perm: PermissionItem.permission value
         :return: bool
         """
-        try:
-            # user_role is related name on UserRole model
-            user_perms = self.user_role.role.permissions
-        except (AttributeError, UserRole.DoesNotExist):
-            user_perms = self.perms
+        role_perms, default_perms = self.get_permission_snapshot()
+        user_perms = role_perms if role_perms is not None else self.perms
         # if user is admin, they automatically get whatever permission
         if user_perms.get("admin") and user_perms.get("admin") is True:
             return True
         if user_perms.get(perm) is not None:
             return user_perms[perm]
-        else:
-            # Attempt to return the default permission value being checked as permission was not set on user
-            try:
-                return PermissionItem.objects.get(permission=perm).default_value
-            except Exception as e:
-                raise Exception("invalid permission name")
+        # Return the default permission value being checked as permission was not set on user
+        try:
+            return default_perms[perm]
+        except KeyError:
+            raise Exception("invalid permission name")
+
+    def get_permission_snapshot(self):
+        """
+        Get role permissions and PermissionItem defaults used to resolve permissions of user
+            Snapshot is computed once per user instance and is cached across requests until roles, user roles or
+            permission items change
+        :return: tuple -> (dict | None, dict) Role permissions, None if user has no role, and default permission values
+        """
+        snapshot = getattr(self, "_permission_snapshot", None)
+        if snapshot is None:
+            role_key = ("role", self.id)
+            permissions = get_cached_permissions({
+                role_key: self._get_role_permissions,
+                "defaults": get_default_permissions,
+            })
+            snapshot = (permissions[role_key], permissions["defaults"])
+            self._permission_snapshot = snapshot
+        return snapshot
+
+    def refresh_from_db(self, using=None, fields=None):
+        self._permission_snapshot = None
+        super().refresh_from_db(using=using, fields=fields)
+
+    def _get_role_permissions(self):
+        return UserRole.objects.filter(user_id=self.id).values_list("role__permissions", flat=True).first()
 
     class Meta:
         """
@@ -375,9 +413,12 @@ class UserDeviceToken(models.Model):
         return key
 
     def update_key(self):
+        old_key = self.key
         self.key = self.generate_key()
         self.created_at = timezone.now()
         self.save()
+        if token_cache.is_enabled():
+            token_cache.invalidate_tokens(old_key)
 
     # pylint: disable=signature-differs
     def save(self, *args, **kwargs):
@@ -425,3 +466,63 @@ class UserRole(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["user", "role"], name="unique_user_role")
         ]
+
+
+def get_default_permissions():
+    return dict(PermissionItem.objects.values_list("permission", "default_value"))
+
+
+def get_cached_permissions(getters):
+    """
+    Get permissions data from in process cache, computing it with getters on miss
+        The permissions version stamp is read once for all requested data
+    :param getters: dict -> Key of permissions data to callable computing the data
+    :return: dict -> Key of permissions data to data
+    """
+    if not tiered_cache.is_enabled():
+        return {key: getter() for key, getter in getters.items()}
+    try:
+        version = tiered_cache.get_version(PERMISSIONS_CACHE_NAME)
+    except ConnectionError:
+        return {key: getter() for key, getter in getters.items()}
+    permissions = {}
+    for key, getter in getters.items():
+        with _permissions_cache_lock:
+            cached = _permissions_cache.get((version, key))
+        # Values are wrapped in tuple to cache None values
+        if cached is None:
+            cached = (getter(),)
+            with _permissions_cache_lock:
+                _permissions_cache[(version, key)] = cached
+        permissions[key] = cached[0]
+    return permissions
+
+
+def clear_cached_permissions():
+    with _permissions_cache_lock:
+        _permissions_cache.clear()
+
+
+def invalidate_cached_permissions():
+    """
+    Invalidate cached permissions of all processes once current transaction is committed
+    """
+    if tiered_cache.is_enabled():
+        transaction.on_commit(lambda: tiered_cache.bump_version(PERMISSIONS_CACHE_NAME))
+
+
+@receiver(post_save, sender=Role, dispatch_uid="save_role_permissions_receiver")
+@receiver(post_delete, sender=Role, dispatch_uid="delete_role_permissions_receiver")
+@receiver(post_save, sender=UserRole, dispatch_uid="save_user_role_permissions_receiver")
+@receiver(post_delete, sender=UserRole, dispatch_uid="delete_user_role_permissions_receiver")
+@receiver(post_save, sender=PermissionItem, dispatch_uid="save_permission_item_permissions_receiver")
+@receiver(post_delete, sender=PermissionItem, dispatch_uid="delete_permission_item_permissions_receiver")
+def invalidate_permissions_receiver(sender, instance, **_):
+    invalidate_cached_permissions()
+
+
+@receiver(post_save, sender=UserDeviceToken, dispatch_uid="save_device_token_receiver")
+@receiver(post_delete, sender=UserDeviceToken, dispatch_uid="delete_device_token_receiver")
+def invalidate_device_token_receiver(sender, instance, **_):
+    if token_cache.is_enabled():
+        token_cache.invalidate_tokens(instance.key)
@@ -0,0 +1,89 @@
+"""
+Cache of resolved auth tokens shared by the middleware, authentication and permission classes
+    Tokens are memoized on the request so that a token is resolved once per request. Token fields other than the key
+    are stored in redis for AUTH_TOKEN_CACHE_TTL seconds keyed by the hash of the token key, and users are loaded by
+    id so user data is never cached. Entries are invalidated when the token is saved or deleted
+"""
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from redis.exceptions import ConnectionError
+
+from utils.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "auth_token"
+REQUEST_MEMO_ATTR = "_resolved_auth_tokens"
+
+redis = get_redis_client()
+
+
+def is_enabled():
+    return settings.AUTH_TOKEN_CACHE_ENABLED
+
+
+def get_cache_key(key):
+    key_hash = hashlib.sha256(key.encode()).hexdigest()
+    return f"{KEY_PREFIX}.{key_hash}"
+
+
+def get_request_memo(request):
+    """
+    Get tokens resolved during request. DRF requests share the memo of the wrapped django request
+    :param request: HttpRequest | rest_framework.request.Request
+    :return: dict
+    """
+    http_request = getattr(request, "_request", request)
+    memo = getattr(http_request, REQUEST_MEMO_ATTR, None)
+    if memo is None:
+        memo = {}
+        setattr(http_request, REQUEST_MEMO_ATTR, memo)
+    return memo
+
+
+def get_token(key):
+    """
+    Get cached token fields
+    :param key: str -> Token key
+    :return: dict | None -> Token id, user id, device id and creation time
+    """
+    try:
+        value = redis.get(get_cache_key(key))
+    except ConnectionError:
+        logger.warning("Unable to get cached auth token")
+        return None
+    return json.loads(value) if value else None
+
+
+def set_token(key, token):
+    """
+    Cache token fields needed to rebuild the token from its key and user
+    :param key: str -> Token key
+    :param token: UserDeviceToken
+    """
+    value = dict(
+        id=token.id,
+        user_id=token.user_id,
+        device_id=str(token.device_id),
+        created_at=token.created_at.isoformat(),
+    )
+    try:
+        redis.set(get_cache_key(key), json.dumps(value), settings.AUTH_TOKEN_CACHE_TTL)
+    except ConnectionError:
+        logger.warning("Unable to cache auth token")
+
+
+def invalidate_tokens(*keys):
+    """
+    Remove cached tokens
+    :param keys: str -> Token keys
+    """
+    if not keys:
+        return
+    try:
+        redis.delete(*[get_cache_key(key) for key in keys])
+    except ConnectionError:
+        logger.warning("Unable to invalidate cached auth tokens")
@@ -1,13 +1,58 @@
+import os
+import threading
+
 import boto3
+from botocore.client import Config
 from django.conf import settings
 
+_clients = {}
+_clients_lock = threading.Lock()
+_clients_pid = None
+
+
+def get_client(service_name, aws_access_key_id=None, aws_secret_access_key=None, signature_version=None):
+    """
+    Get boto3 client for service. Clients are thread safe and are pooled per process by credentials and config
+        if AWS_CLIENT_POOL_ENABLED is set, as creating a client requires resolving credentials and loading
+        service models
+    :param service_name: str
+    :param aws_access_key_id: str -> Defaults to AMAZON_S3_ACCESS_KEY_ID
+    :param aws_secret_access_key: str -> Defaults to AMAZON_S3_SECRET_ACCESS_KEY
+    :param signature_version: str -> e.g. s3v4 for presigned urls
+    :return: botocore client
+    """
+    aws_access_key_id = aws_access_key_id or settings.AMAZON_S3_ACCESS_KEY_ID
+    aws_secret_access_key = aws_secret_access_key or settings.AMAZON_S3_SECRET_ACCESS_KEY
+    if not settings.AWS_CLIENT_POOL_ENABLED:
+        return _create_client(service_name, aws_access_key_id, aws_secret_access_key, signature_version)
+
+    global _clients_pid
+    key = (service_name, aws_access_key_id, aws_secret_access_key, signature_version)
+    with _clients_lock:
+        # Clients hold connection pools that must not be shared with forked processes
+        if _clients_pid != os.getpid():
+            _clients.clear()
+            _clients_pid = os.getpid()
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _create_client(service_name, aws_access_key_id, aws_secret_access_key,
+                                                    signature_version)
+    return client
+
+
+def clear_clients():
+    with _clients_lock:
+        _clients.clear()
+
 
-def get_client(service_name):
-    return boto3.client(
-        service_name,
-        aws_access_key_id=settings.AMAZON_S3_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AMAZON_S3_SECRET_ACCESS_KEY
+def _create_client(service_name, aws_access_key_id, aws_secret_access_key, signature_version=None):
+    kwargs = dict(
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
     )
+    if signature_version is not None:
+        kwargs["config"] = Config(signature_version=signature_version)
+    return boto3.client(service_name, **kwargs)
 
 
 class AWSService:
@@ -20,21 +20,28 @@ class ExportContextManager:
     def __enter__(self):
         _, self.filename = tempfile.mkstemp(dir=settings.TEMPDIR)
         with open(self.filename, mode="w+", newline="") as export_file:
-            writer = csv.DictWriter(export_file, fieldnames=self.fieldnames)
-            writer.writeheader()
-
-            for batch in chunks_generator(self.items, size=1000):
-                chunk = list(batch)
-                # Ignore videos if its channel is blocklisted
-                if isinstance(self.items, VideoListDataGenerator):
-                    chunk = self._clean_blocklist(chunk)
-                # Each chunk may be a sequence itself from a generator
-                if isinstance(chunk, collections.abc.Sequence) and not isinstance(chunk, str):
-                    writer.writerows(self._get_export_data(chunk, sequence=True))
-                else:
-                    writer.writerow(self._get_export_data(chunk, sequence=False))
+            self.write(export_file)
         return self.filename
 
+    def write(self, export_file):
+        """
+        Write csv export to file object e.g. file opened with newline="" or S3MultipartUpload
+        :param export_file: Object with write method
+        """
+        writer = csv.DictWriter(export_file, fieldnames=self.fieldnames)
+        writer.writeheader()
+
+        for batch in chunks_generator(self.items, size=1000):
+            chunk = list(batch)
+            # Ignore videos if its channel is blocklisted
+            if isinstance(self.items, VideoListDataGenerator):
+                chunk = self._clean_blocklist(chunk)
+            # Each chunk may be a sequence itself from a generator
+            if isinstance(chunk, collections.abc.Sequence) and not isinstance(chunk, str):
+                writer.writerows(self._get_export_data(chunk, sequence=True))
+            else:
+                writer.writerow(self._get_export_data(chunk, sequence=False))
+
     def __exit__(self, *args):
         os.remove(self.filename)
 
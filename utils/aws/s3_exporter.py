@@ -1,15 +1,98 @@
 from abc import ABC
 from abc import abstractmethod
 
-import boto3
-from botocore.client import Config
+from botocore.exceptions import ClientError
 from django.conf import settings
 
+from utils.aws.base_service import AWSService
+from utils.aws.base_service import get_client
+
+# Size of parts buffered by S3MultipartUpload. Parts other than the last must be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 ** 2
+# Size of byte ranges requested by S3Exporter.iter_s3_lines
+RANGE_READ_SIZE = 4 * 1024 ** 2
+
 
 class ReportNotFoundException(Exception):
     pass
 
 
+class S3MultipartUpload:
+    """
+    Writable file like object that uploads content to S3 as it is written
+    Content is buffered up to part_size bytes before each part is uploaded, so exports can be written directly to S3
+        without staging temporary files. If the upload is smaller than a single part, it is uploaded with put_object
+        when closed. The multipart upload is aborted if an exception is raised within the context manager
+
+    Usage:
+        with S3Exporter.open_upload(s3_key) as upload:
+            writer = csv.writer(upload)
+            writer.writerows(rows)
+    """
+    def __init__(self, s3, bucket_name, key, part_size=MULTIPART_PART_SIZE, encoding="utf-8", extra_args=None):
+        self.s3 = s3
+        self.bucket_name = bucket_name
+        self.key = key
+        self.part_size = part_size
+        self.encoding = encoding
+        self.extra_args = extra_args or {}
+        self.upload_id = None
+        self._buffer = bytearray()
+        self._parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *_):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, data) -> int:
+        """
+        Write str or bytes data, uploading parts as the buffer fills
+        :param data: str | bytes
+        :return: int
+        """
+        if isinstance(data, str):
+            data = data.encode(self.encoding)
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+        return len(data)
+
+    def close(self) -> None:
+        """
+        Upload remaining buffered data and complete upload
+        """
+        if self.upload_id is None:
+            self.s3.put_object(Bucket=self.bucket_name, Key=self.key, Body=bytes(self._buffer), **self.extra_args)
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            self.s3.complete_multipart_upload(
+                Bucket=self.bucket_name, Key=self.key, UploadId=self.upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+        self._buffer.clear()
+
+    def abort(self) -> None:
+        if self.upload_id is not None:
+            self.s3.abort_multipart_upload(Bucket=self.bucket_name, Key=self.key, UploadId=self.upload_id)
+        self._buffer.clear()
+
+    def _upload_part(self, body: bytes) -> None:
+        if self.upload_id is None:
+            response = self.s3.create_multipart_upload(Bucket=self.bucket_name, Key=self.key, **self.extra_args)
+            self.upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        response = self.s3.upload_part(Bucket=self.bucket_name, Key=self.key, UploadId=self.upload_id,
+                                       PartNumber=part_number, Body=body)
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+
 class S3Exporter(ABC):
     bucket_name = settings.AMAZON_S3_BUCKET_NAME
     aws_access_key_id = settings.AMAZON_S3_ACCESS_KEY_ID
@@ -22,8 +105,8 @@ class S3Exporter(ABC):
 
     @classmethod
     def _s3(cls):
-        s3 = boto3.client(
-            "s3",
+        s3 = get_client(
+            AWSService.S3,
             aws_access_key_id=cls.aws_access_key_id,
             aws_secret_access_key=cls.aws_secret_access_key
         )
@@ -38,6 +121,29 @@ class S3Exporter(ABC):
                 Filename=exported_file_name,
             )
 
+    @classmethod
+    def export_stream_to_s3(cls, content_exporter, name, get_key=True, extra_args=None):
+        """
+        Export content by writing directly to a multipart upload instead of a temporary file
+        :param content_exporter: Object with write method that writes content to a file object
+        :param name: str
+        :param get_key: bool -> Whether to get s3 key with get_s3_key
+        :param extra_args: dict -> Additional put_object / create_multipart_upload parameters
+        """
+        with cls.open_upload(name, get_key=get_key, extra_args=extra_args) as upload:
+            content_exporter.write(upload)
+
+    @classmethod
+    def open_upload(cls, name, get_key=True, extra_args=None, part_size=MULTIPART_PART_SIZE):
+        """
+        Open streaming multipart upload to write to
+        :return: S3MultipartUpload
+        """
+        return S3MultipartUpload(
+            S3Exporter._s3(), cls.bucket_name, cls.get_s3_key(name) if get_key is True else name,
+            part_size=part_size, extra_args=extra_args,
+        )
+
     @classmethod
     def export_object_to_s3(cls, file_obj, s3_key):
         S3Exporter._s3().upload_fileobj(
@@ -71,6 +177,57 @@ class S3Exporter(ABC):
         except s3.exceptions.NoSuchKey:
             raise ReportNotFoundException()
 
+    @classmethod
+    def get_s3_object_range(cls, name, start, end, get_key=True):
+        """
+        Get byte range of object
+        :param name: str
+        :param start: int -> First byte position
+        :param end: int -> Last byte position, inclusive
+        :param get_key: bool
+        :return: tuple -> (bytes, total object size)
+        """
+        s3 = S3Exporter._s3()
+        try:
+            response = s3.get_object(
+                Bucket=cls.bucket_name,
+                Key=cls.get_s3_key(name) if get_key else name,
+                Range=f"bytes={start}-{end}",
+            )
+        except s3.exceptions.NoSuchKey:
+            raise ReportNotFoundException()
+        except ClientError as e:
+            # Range starting after the last byte of object, e.g. empty objects
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b"", 0
+            raise
+        size = int(response["ContentRange"].rsplit("/", 1)[-1])
+        return response["Body"].read(), size
+
+    @classmethod
+    def iter_s3_lines(cls, name, get_key=True, range_size=RANGE_READ_SIZE):
+        """
+        Yield lines of object without line endings, requesting range_size bytes at a time so that callers that stop
+            iterating early do not download the entire object
+        :param name: str
+        :param get_key: bool
+        :param range_size: int
+        :return: bytes
+        """
+        start = 0
+        pending = b""
+        while True:
+            data, size = cls.get_s3_object_range(name, start, start + range_size - 1, get_key=get_key)
+            lines = (pending + data).splitlines(True)
+            for line in lines[:-1]:
+                yield line.splitlines()[0]
+            pending = lines[-1] if lines else b""
+            start += range_size
+            if not data or start >= size:
+                break
+        if pending:
+            yield pending.splitlines()[0]
+
     @classmethod
     def generate_temporary_url(cls, key_name, time_limit=3600):
         return cls._presigned_s3().generate_presigned_url(
@@ -84,11 +241,11 @@ class S3Exporter(ABC):
 
     @classmethod
     def _presigned_s3(cls):
-        s3 = boto3.client(
-            "s3",
+        s3 = get_client(
+            AWSService.S3,
             aws_access_key_id=cls.aws_access_key_id,
             aws_secret_access_key=cls.aws_secret_access_key,
-            config=Config(signature_version="s3v4")
+            signature_version="s3v4"
         )
         return s3
 
@@ -2,8 +2,8 @@ from abc import abstractmethod
 import hashlib
 import json
 import logging
-import re
 from abc import abstractmethod
+from functools import lru_cache
 from typing import Union
 from urllib.parse import unquote
 
@@ -19,8 +19,10 @@ from rest_framework.serializers import Serializer
 import brand_safety.constants as brand_safety_constants
 from cache.constants import RESEARCH_CHANNELS_DEFAULT_CACHE_KEY
 from cache.constants import RESEARCH_VIDEOS_DEFAULT_CACHE_KEY
-from channel.constants import RESEARCH_CHANNELS_DEFAULT_SORT
-from video.constants import RESEARCH_VIDEOS_DEFAULT_SORT
+from cache.utils import get_cache_item_value
+from cache.utils import get_research_cache_page_key
+from channel.constants import RESEARCH_CHANNELS_CACHED_SORTS
+from video.constants import RESEARCH_VIDEOS_CACHED_SORTS
 from es_components.constants import Sections
 from es_components.models import Video
 from es_components.iab_categories import IAB_TIER1_CATEGORIES
@@ -38,8 +40,6 @@ from utils.utils import prune_iab_categories
 from utils.utils import slice_generator
 import video.constants as video_constants
 
-import pickle
-
 DEFAULT_PAGE_SIZE = 50
 UI_STATS_HISTORY_FIELD_LIMIT = 30
 
@@ -625,26 +625,35 @@ class ESQuerysetAdapter:
         self.search_limit = search_limit
         return self
 
-    @cached_method(timeout=900)
-    def get_data(self, start=0, end=None):
-        data = self.manager.search(
+    def get_hits_body(self, start=0, end=None):
+        """
+        Get raw Elasticsearch hits body of a page. The body is cached by get_data instead of elasticsearch_dsl objects
+        :return: dict
+        """
+        response = self.manager.search(
             filters=self.filter_query,
             sort=self.sort,
             offset=start,
             limit=end,
         ) \
-            .source(includes=self.fields_to_load).execute().hits
-        return data
+            .source(includes=self.fields_to_load).execute()
+        return response.to_dict()["hits"]
+
+    def load_hits(self, hits_body):
+        """
+        Build elasticsearch_dsl hits from a raw hits body
+        :param hits_body: dict
+        :return: AttrList
+        """
+        response = Response(self.manager.search(filters=self.filter_query), {"hits": hits_body})
+        return response.hits
+
+    @cached_method(timeout=900, deserializer=load_hits)
+    def get_data(self, start=0, end=None):
+        return self.get_hits_body(start, end)
 
     def uncached_get_data(self, start=0, end=None):
-        data = self.manager.search(
-            filters=self.filter_query,
-            sort=self.sort,
-            offset=start,
-            limit=end,
-        ) \
-            .source(includes=self.fields_to_load).execute().hits
-        return data
+        return self.load_hits(self.get_hits_body(start, end))
 
     def get_aggregations(self):
         if self.cached_aggregations and self.aggregations:
@@ -698,15 +707,21 @@ class ESQuerysetAdapter:
 
 
 class ResearchESQuerysetAdapter(ESQuerysetAdapter):
+    def __init__(self, manager, *args, filter_names=(), **kwargs):
+        """
+        :param filter_names: Query params applied as filters by the view, in addition to section filters
+        """
+        super().__init__(manager, *args, **kwargs)
+        self.filter_names = frozenset(filter_names)
 
     def get_data(self, start=0, end=None):
         kwargs_config = {
             0: {
-                "target_sort": RESEARCH_VIDEOS_DEFAULT_SORT,
+                "cached_sorts": RESEARCH_VIDEOS_CACHED_SORTS,
                 "cache_key": RESEARCH_VIDEOS_DEFAULT_CACHE_KEY
             },
             1: {
-                "target_sort": RESEARCH_CHANNELS_DEFAULT_SORT,
+                "cached_sorts": RESEARCH_CHANNELS_CACHED_SORTS,
                 "cache_key": RESEARCH_CHANNELS_DEFAULT_CACHE_KEY
             }
         }
@@ -719,94 +734,87 @@ class ResearchESQuerysetAdapter(ESQuerysetAdapter):
 
     def _get_from_cache(self, start: int, end: int = DEFAULT_PAGE_SIZE,
                         cache_key: str = RESEARCH_CHANNELS_DEFAULT_CACHE_KEY,
-                        target_sort: list = RESEARCH_CHANNELS_DEFAULT_SORT, ) -> Response:
+                        cached_sorts: list = RESEARCH_CHANNELS_CACHED_SORTS, ) -> Response:
         """
         Get Research data from cache based on request query parameters
-        Cached data is cached with celery beat in cache.tasks.cache_research_defaults
+        Cached data is cached with celery beat in cache.tasks.cache_research_defaults as pages of
+            CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE raw hits for each sort of cached_sorts
 
-        Cached responses will only be used if the first page is being requested, the request sorting matches target_sort,
-            and no filters are applied
-            e.g. First page of Research Channels is defined as page 1, no filters, and sorting of
-                RESEARCH_CHANNELS_DEFAULT_SORT
-                If the request matches those conditions, we will retrieve cached data
+        Cached responses will only be used if the requested slice is within the cached pages, the request sorting is
+            one of cached_sorts, and no filters are applied
+            e.g. Page 2 of Research Channels with a page size of 20, no filters, and sorting of
+                RESEARCH_CHANNELS_DEFAULT_SORT is built from the hits 20 to 40 of the first cached page
 
         :param start: int -> The start index of the response data. If 0, then the first page is being requested.
-            This will be multiples of the request page size "end"
+            This will be multiples of the request page size
             e.g. page size requested = 50
             page 1 start = 0
             page 2 start = 50
             page 3 start = 100
             ...
-        :param end: The size of the requested page, which determines the sliced index end
-        :param target_sort: The sort value to check if we should use cached data
-        :param cache_key: Key to retrieve cached data from redis
+        :param end: The end index of the response data
+        :param cached_sorts: Sort values that are cached
+        :param cache_key: Key prefix to retrieve cached pages from redis
         :return: Elasticsearch DSL Response object
         """
-        if not self._should_get_cache(target_sort, start):
+        if not self._should_get_cache(cached_sorts, start, end):
             raise ValueError
-        data = None
+        page_size = settings.CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE
+        first_page = start // page_size
+        last_page = (end - 1) // page_size
+        keys = [get_research_cache_page_key(cache_key, self.sort, page) for page in range(first_page, last_page + 1)]
         try:
-            cached_data = pickle.loads(redis.get(cache_key))
-            updated_response = self._get_response_body(cached_data)
-            # Build new response body depending on request query params as cached data caches all ES model sections
-            # with different page size
-            for i in range(len(cached_data.hits)):
-                dict_doc = cached_data.hits.hits._l_[i]
-                # Copy sections requested by client
-                dict_doc["_source"] = {
-                    key: val for key, val in dict_doc["_source"].items() if key in self.fields_to_load
-                }
-                updated_response["hits"]["hits"].append(dict_doc)
-                # Copy until the target page size
-                if i >= end - 1:
-                    break
-            # Build new elasticsearch_dsl Response object. By default Research uses forced filters for all queries
-            data = Response(self.manager.search(self.manager.forced_filters()), updated_response)
-        except (pickle.PickleError, ConnectionError, IndexError):
-            pass
-        finally:
-            if data is None:
-                raise ValueError
-        return data
-
-    def _get_response_body(self, cached_response: Response):
-        """
-        Prepare new dict response body to add "hits" data to
-        hits must be processed in case client is requesting different ES model sections or page size
-        :param cached_response: elasticsearch_dsl Response
-        """
-        new_response = {
-            key: getattr(cached_response, key)
-            for key in dir(cached_response) if key != "hits"
-        }
-        new_response["hits"] = dict(
-            max_score=cached_response.hits.max_score,
-            total=cached_response.hits.total,
-            hits=[],
+            pages = [json.loads(page) for page in redis.mget(keys)]
+        except (ConnectionError, TypeError, ValueError):
+            raise ValueError
+        hits = [hit for page in pages for hit in page["hits"]]
+        offset = first_page * page_size
+        # Copy sections requested by client as cached data caches all ES model sections
+        fields_to_load = set(self.fields_to_load or ())
+        requested_hits = [
+            {**hit, "_source": {key: val for key, val in hit["_source"].items() if key in fields_to_load}}
+            for hit in hits[start - offset:end - offset]
+        ]
+        response = dict(
+            hits=dict(
+                total=pages[0]["total"],
+                max_score=pages[0]["max_score"],
+                hits=requested_hits,
+            )
         )
-        return new_response
+        # Build new elasticsearch_dsl Response object. By default Research uses forced filters for all queries
+        data = Response(self.manager.search(self.manager.forced_filters()), response)
+        return data
 
-    def _should_get_cache(self, target_sort: list[dict], start: int) -> bool:
+    def _should_get_cache(self, cached_sorts: list[list[dict]], start: int, end: int) -> bool:
         """
         Determine if cache data should be retrieved
         Client applies request filters by adding key value pairs in request query parameters
-            If a section is detected in query params, then filters are being applied. Return False to retrieve
-            uncached data
-        :param start: Start index of queryset and indicates request page. Refer to _get_from_cache docstring
-        :param target_sort: Request sorting. Refer to _get_from_cache docstring
+            If a query param is a filter of the view or starts with a section, then filters are being applied. Return
+            False to retrieve uncached data
+        :param cached_sorts: Sorts with cached data. Refer to _get_from_cache docstring
+        :param start: Start index of queryset. Refer to _get_from_cache docstring
+        :param end: End index of queryset. Refer to _get_from_cache docstring
         :return: bool -> Whether or not data should be retrieved from cache
         """
-        if start != 0 or self.sort != target_sort:
+        max_cached = settings.CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE * settings.CACHE_RESEARCH_DEFAULT_PAGES
+        if end is None or not 0 <= start < end <= max_cached or self.sort not in cached_sorts:
             return False
-        filters_pattern = "|".join((
-            f"({s})" for s in self.manager.allowed_sections
-        ))
-        get_cache = True
-        # Search for filters being applied in in request query params
-        with_filters = re.search(filters_pattern, "".join(self.query_params.keys()))
-        if with_filters:
-            get_cache = False
-        return get_cache
+        section_names = get_section_names(type(self.manager))
+        # Search for filters being applied in request query params
+        with_filters = any(
+            key in self.filter_names or key.split(".", 1)[0] in section_names
+            for key in (self.query_params or {}).keys()
+        )
+        return not with_filters
+
+
+@lru_cache()
+def get_section_names(manager_class) -> frozenset:
+    """
+    Get section names of manager class, used to detect Research filters in request query params
+    """
+    return frozenset(manager_class.allowed_sections)
 
 
 class ESFilterBackend(BaseFilterBackend):
@@ -913,6 +921,13 @@ class APIViewMixin:
     exists_filter = ()
     params_adapters = ()
 
+    def get_filter_names(self) -> frozenset:
+        """
+        Get query params applied as filters by the view
+        """
+        return frozenset((*self.terms_filter, *self.must_not_terms_filter, *self.range_filter,
+                          *self.match_phrase_filter, *self.exists_filter))
+
     def get_cached_aggregations_key(self):
         """
         gets cached aggregations key depending on user type:
@@ -933,8 +948,7 @@ class APIViewMixin:
 
         key = self.get_cached_aggregations_key()
         try:
-            cached_aggregations_object = self.cache_class.objects.get(key=key)
-            self.cached_aggregations = cached_aggregations_object.value
+            self.cached_aggregations = get_cache_item_value(key)
         # pylint: disable=broad-except
         except Exception as e:
             # pylint: enable=broad-except
@@ -1,20 +1,39 @@
 import logging
 import pickle
+import time
 
 from django.conf import settings
 from redis import ConnectionError
+from redis.exceptions import LockError
 
 from utils.redis import get_redis_client
 
 DEFAULT_PAGE_SIZE = 50
+DEFAULT_TTL_THRESHOLD = 0.2
+# Max time a single worker may hold the refresh lock of a key before another worker may refresh it
+REFRESH_LOCK_TIMEOUT = 60
 
 logger = logging.getLogger(__name__)
 redis = get_redis_client()
 
 CACHE_KEY_PREFIX = "restapi.ESQueryset"
-
-
-def cached_method(timeout, extended_timeout=14400, ttl_threshold=0.2):
+# Version of cached entry payloads. Entries with another version, such as pickled elasticsearch_dsl objects cached
+# without an expiry time, are treated as misses. Increase when the payload format changes
+CACHE_PAYLOAD_VERSION = 2
+
+
+def cached_method(timeout, extended_timeout=14400, ttl_threshold=DEFAULT_TTL_THRESHOLD, deserializer=None):
+    """
+    Cache method results in redis with stale while revalidate semantics
+        Entries are fresh until their remaining time is less than ttl_threshold of their timeout. Stale entries are
+        served to all callers while a single caller holding the key refresh lock recomputes the entry
+    :param timeout: int -> Entry timeout in seconds
+    :param extended_timeout: int -> Entry timeout in seconds if obj.is_default_page
+    :param ttl_threshold: float -> Fraction of timeout remaining after which an entry is refreshed
+    :param deserializer: callable(obj, data) -> Build return value from the cached data returned by the method,
+        allowing methods to cache plain payloads instead of pickled objects
+    :return:
+    """
     def wrapper(method):
         def wrapped(obj, *args, **kwargs):
             options = (args, kwargs)
@@ -32,8 +51,16 @@ def cached_method(timeout, extended_timeout=14400, ttl_threshold=0.2):
                 data = None
                 ttl = 0
             if data is None or ttl <= cache_timeout * ttl_threshold:
-                data = method(obj, *args, **kwargs)
-                set_to_cache(obj, part=part, options=options, data=data, timeout=cache_timeout)
+                refresh_lock = get_refresh_lock(obj, part=part, options=options) if data is not None else None
+                # Serve stale data if another caller is already refreshing the entry
+                if refresh_lock is not False:
+                    try:
+                        data = method(obj, *args, **kwargs)
+                        set_to_cache(obj, part=part, options=options, data=data, timeout=cache_timeout)
+                    finally:
+                        release_refresh_lock(refresh_lock)
+            if deserializer is not None:
+                data = deserializer(obj, data)
             return data
 
         return wrapped
@@ -52,17 +79,49 @@ def flush_cache():
 
 
 def get_from_cache(obj, part, options):
+    """
+    Get cached data with a single redis round trip
+    :return: tuple -> (cached data or None, seconds until the entry expires)
+    """
     key, key_json = obj.get_cache_key(part, options)
     cached = redis.get(key)
     ttl = 0
     if cached:
         cached = pickle.loads(cached)
-        cached = cached.get("data") if cached and key_json == cached.get("key_json") else None
-        ttl = redis.ttl(key)
+        if cached and cached.get("version") == CACHE_PAYLOAD_VERSION and key_json == cached.get("key_json"):
+            ttl = cached.get("expires_at", 0) - time.time()
+            cached = cached.get("data")
+        else:
+            cached = None
     return cached, ttl
 
 
 def set_to_cache(obj, part, options, data, timeout):
     key, key_json = obj.get_cache_key(part, options)
-    serialized_data = pickle.dumps(dict(key_json=key_json, data=data))
+    serialized_data = pickle.dumps(dict(version=CACHE_PAYLOAD_VERSION, key_json=key_json, data=data,
+                                        expires_at=time.time() + timeout))
     redis.set(key, serialized_data, timeout)
+
+
+def get_refresh_lock(obj, part, options):
+    """
+    Try to acquire the lock to refresh a cache entry without blocking
+    :return: Lock if acquired, False if another caller holds the lock, None if redis is unavailable
+    """
+    key, _ = obj.get_cache_key(part, options)
+    refresh_lock = redis.lock(f"{key}.lock", timeout=REFRESH_LOCK_TIMEOUT)
+    try:
+        is_acquired = refresh_lock.acquire(blocking=False)
+    except ConnectionError:
+        return None
+    return refresh_lock if is_acquired else False
+
+
+def release_refresh_lock(refresh_lock):
+    if not refresh_lock:
+        return
+    try:
+        refresh_lock.release()
+    except (LockError, ConnectionError):
+        # Lock expired while refreshing and may be held by another caller
+        pass
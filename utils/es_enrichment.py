@@ -0,0 +1,75 @@
+"""
+Bulk enrichment of items with Elasticsearch document fields
+    Documents are retrieved as raw _source dicts with concurrent mget requests that only include the requested fields,
+    and fields are read with precompiled paths instead of building es_components model instances
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+from elasticsearch_dsl.connections import connections
+
+from utils.utils import chunks_generator
+
+MGET_BATCH_SIZE = 2000
+MGET_MAX_WORKERS = 4
+
+
+def compile_field_paths(fields: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Split dotted document fields into paths of keys
+    :param fields: list -> Dotted field names e.g. general_data.primary_category
+    :return: dict
+    """
+    paths = {field: tuple(field.split(".")) for field in fields}
+    return paths
+
+
+def get_path_value(source: dict, path: Tuple[str, ...]):
+    """
+    Get value of field path in raw _source dict
+    :param source: dict -> Document _source
+    :param path: tuple -> Path compiled with compile_field_paths
+    :return: Field value or None if any part of path is missing
+    """
+    value = source
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def mget_sources(model, ids: Iterable[str], fields: Iterable[str], batch_size=MGET_BATCH_SIZE,
+                 max_workers=MGET_MAX_WORKERS) -> Iterator[Tuple[str, dict]]:
+    """
+    Retrieve _source of documents with concurrent mget requests in batches of batch_size ids
+        Documents are yielded in order of ids and missing documents are skipped
+    :param model: es_components model e.g. Channel
+    :param ids: list -> Document ids
+    :param fields: list -> Dotted fields to include in _source
+    :param batch_size: int
+    :param max_workers: int -> Maximum concurrent mget requests
+    :return: tuple -> (document id, _source dict)
+    """
+    fields = list(fields)
+    batches = [list(batch) for batch in chunks_generator(ids, size=batch_size)]
+    if not batches:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        for docs in executor.map(lambda batch: _mget(model, batch, fields), batches):
+            for doc in docs:
+                if doc.get("found") and doc.get("_source") is not None:
+                    yield doc["_id"], doc["_source"]
+
+
+def _mget(model, ids: list, fields: list) -> list:
+    """
+    Retrieve raw documents with a single mget request
+    :return: list -> mget response docs
+    """
+    es = connections.get_connection(model._get_using())
+    response = es.mget(body={"ids": ids}, index=model._get_index(), _source_includes=fields)
+    return response["docs"]
@@ -1,4 +1,6 @@
+import hashlib
 import re
+import threading
 from collections import namedtuple
 from enum import Enum
 from functools import reduce
@@ -6,9 +8,15 @@ from types import GeneratorType
 from typing import Sequence
 
 import langid
+from cachetools import LRUCache
 from fasttext.FastText import _FastText as FastText
 
 FAST_TEXT_MODEL = None
+# Minimum fastText confidence before falling back to langid
+FAST_TEXT_MIN_CONFIDENCE = .5
+# Detected languages by hash of cleaned text
+FAST_TEXT_LANG_CACHE = LRUCache(maxsize=50000)
+FAST_TEXT_LANG_CACHE_LOCK = threading.Lock()
 
 
 def flatten(l):
@@ -106,26 +114,71 @@ def replace_apostrophes(s):
     return apostrophe_regex.sub("'", s)
 
 
-# Returns Language Detected by FastText, falls back to langid if assurance val is less than 50%
-def fasttext_lang(string):
+def get_fast_text_model():
     # pylint: disable=global-statement
     global FAST_TEXT_MODEL
     # pylint: enable=global-statement
-    string = remove_mentions_hashes_urls(string)
-    string = string.replace("\n", " ")
     if FAST_TEXT_MODEL is None:
         FAST_TEXT_MODEL = FastText("lid.176.bin")
-    fast_text_result = FAST_TEXT_MODEL.predict(string)
-    try:
-        if fast_text_result[1][0] < .5:
-            return langid.classify(string)[0].lower()
-        return fast_text_result[0][0].split("__")[-1].lower()
-    # pylint: disable=broad-except
-    # pylint: disable=broad-except
-    except Exception:
-    # pylint: enable=broad-except
-        return ""
-    # pylint: enable=broad-except
+    return FAST_TEXT_MODEL
+
+
+# Returns Language Detected by FastText, falls back to langid if assurance val is less than 50%
+def fasttext_lang(string):
+    return fasttext_lang_many([string])[0]
+
+
+def fasttext_lang_many(strings: Sequence[str]) -> list:
+    """
+    Detect languages of many strings with a single fastText predict call
+    langid fallback is only run for strings detected with less than 50% assurance. Results are memoized by
+        hash of cleaned text
+    :param strings: Sequence of str
+    :return: list -> Language codes in the same order as strings. Empty string if language could not be detected
+    """
+    cleaned = [remove_mentions_hashes_urls(string).replace("\n", " ") for string in strings]
+    keys = [hashlib.md5(string.encode("utf-8")).digest() for string in cleaned]
+    languages = [None] * len(cleaned)
+    pending = {}
+    with FAST_TEXT_LANG_CACHE_LOCK:
+        for index, key in enumerate(keys):
+            try:
+                languages[index] = FAST_TEXT_LANG_CACHE[key]
+            except KeyError:
+                pending.setdefault(key, []).append(index)
+    if not pending:
+        return languages
+
+    texts = [cleaned[indexes[0]] for indexes in pending.values()]
+    detected = _predict_languages(texts)
+    with FAST_TEXT_LANG_CACHE_LOCK:
+        for (key, indexes), language in zip(pending.items(), detected):
+            FAST_TEXT_LANG_CACHE[key] = language
+            for index in indexes:
+                languages[index] = language
+    return languages
+
+
+def _predict_languages(texts: list) -> list:
+    """
+    Predict languages of cleaned texts, falling back to langid for low confidence predictions
+    :param texts: list -> Texts without new lines
+    :return: list
+    """
+    labels, probabilities = get_fast_text_model().predict(texts)
+    languages = []
+    for text, text_labels, text_probabilities in zip(texts, labels, probabilities):
+        try:
+            if text_probabilities[0] < FAST_TEXT_MIN_CONFIDENCE:
+                language = langid.classify(text)[0].lower()
+            else:
+                language = text_labels[0].split("__")[-1].lower()
+        # pylint: disable=broad-except
+        except Exception:
+        # pylint: enable=broad-except
+            language = ""
+        languages.append(language)
+    return languages
 
 
 def is_english(s):
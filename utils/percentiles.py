@@ -1,36 +1,66 @@
 import logging
 import pickle
 
+from redis.exceptions import ConnectionError
+
+from utils import tiered_cache
 from utils.redis import get_redis_client
 
 logger = logging.getLogger(__name__)
 
 CACHE_TIMEOUT = 86400
 
+redis = get_redis_client()
+
 
 def get_percentiles(manager, fields, add_suffix=None):
-    redis = get_redis_client()
+    """
+    Get cached percentiles of fields, checking the in process cache before fetching all fields with a single MGET
+    :param manager: es_components manager
+    :param fields: list[str]
+    :param add_suffix: str -> Suffix of returned field names. Redis keys are used as names if None
+    :return: dict
+    """
+    fields = list(fields)
+    name = get_version_name(manager.model)
+    local_key = (tuple(fields), add_suffix)
+    version = None
+    if tiered_cache.is_enabled():
+        try:
+            version = tiered_cache.get_version(name)
+        except ConnectionError:
+            version = None
+        percentiles = tiered_cache.get_local(name, version, key=local_key) if version is not None else None
+        if percentiles is not None:
+            return dict(percentiles)
+
+    keys = [get_redis_key(model=manager.model, field=field) for field in fields]
+    values = redis.mget(keys) if keys else []
     percentiles = {}
-    for field in fields:
-        key = get_redis_key(model=manager.model, field=field)
-        value = redis.get(key)
+    for field, key, value in zip(fields, keys, values):
         if not value:
             continue
-        name = key if add_suffix is None else f"{field}{add_suffix}"
-        percentiles[name] = pickle.loads(value)
-    return percentiles
+        name_key = key if add_suffix is None else f"{field}{add_suffix}"
+        percentiles[name_key] = pickle.loads(value)
+    if version is not None:
+        tiered_cache.set_local(name, version, percentiles, key=local_key)
+    return dict(percentiles)
 
 
 def update_percentiles(manager):
-    redis = get_redis_client()
     for field in manager.percentiles_aggregation_fields:
         logger.info("Get percentiles for %s.%s", manager.model.__name__, field)
         values = manager.fetch_percentiles(field=field)
         key = get_redis_key(model=manager.model, field=field)
         redis.set(key, pickle.dumps(values), CACHE_TIMEOUT)
         logger.info(values)
+    tiered_cache.bump_version(get_version_name(manager.model))
 
 
 def get_redis_key(model, field):
     key = f"aggregation_percentiles:{model.__name__}.{field}"
     return key
+
+
+def get_version_name(model):
+    return f"aggregation_percentiles:{model.__name__}"
@@ -1,7 +1,7 @@
 from django.contrib.auth import get_user_model
 from rest_framework import permissions
 
-from userprofile.models import UserDeviceToken
+from userprofile.authentication import resolve_token
 from userprofile.constants import StaticPermissions
 
 
@@ -37,11 +37,7 @@ class IsAuthQueryTokenPermission(permissions.BasePermission):
         token = request.query_params.get("auth_token")
         if not token:
             return False
-        try:
-            UserDeviceToken.objects.get(key=token)
-        except UserDeviceToken.DoesNotExist:
-            return False
-        return True
+        return resolve_token(token, request=request) is not None
 
 
 class OrPermissionsBase(permissions.BasePermission):
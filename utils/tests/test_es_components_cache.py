@@ -0,0 +1,80 @@
+import pickle
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from utils.es_components_cache import cached_method
+from utils.es_components_cache import set_to_cache
+from utils.unittests.redis_mock import FakeRedis
+
+
+class CachedObject:
+    from_cache = True
+
+    def __init__(self):
+        self.calls = 0
+
+    # pylint: disable=unused-argument
+    def get_cache_key(self, part, options):
+        return f"test.{part}", "key_json"
+    # pylint: enable=unused-argument
+
+    @cached_method(timeout=100)
+    def count(self):
+        self.calls += 1
+        return self.calls
+
+    @cached_method(timeout=100, deserializer=lambda obj, data: dict(body=data))
+    def get_body(self):
+        return [1, 2]
+
+
+class CachedMethodTestCase(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.patcher = patch("utils.es_components_cache.redis", self.redis)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def _set_stale(self, obj, data):
+        with patch("utils.es_components_cache.time.time", return_value=time.time() - 90):
+            set_to_cache(obj, "count", ((), {}), data, 100)
+
+    def test_fresh_hit(self):
+        """ Test fresh entries are returned without recomputing """
+        obj = CachedObject()
+        self.assertEqual(obj.count(), 1)
+        self.assertEqual(obj.count(), 1)
+        self.assertEqual(obj.calls, 1)
+
+    def test_stale_served_while_refreshing(self):
+        """ Test stale entries are served if another caller holds the refresh lock """
+        obj = CachedObject()
+        self._set_stale(obj, "stale")
+        self.redis.lock_acquired = False
+        self.assertEqual(obj.count(), "stale")
+        self.assertEqual(obj.calls, 0)
+
+    def test_stale_refreshed_by_lock_holder(self):
+        """ Test stale entries are recomputed by the caller acquiring the refresh lock """
+        obj = CachedObject()
+        self._set_stale(obj, "stale")
+        self.assertEqual(obj.count(), 1)
+        self.assertEqual(obj.count(), 1)
+        self.assertEqual(obj.calls, 1)
+
+    def test_unversioned_entry_is_miss(self):
+        """ Test entries cached before payloads were versioned are recomputed instead of served stale """
+        obj = CachedObject()
+        self.redis.set("test.count", pickle.dumps(dict(key_json="key_json", data="unversioned")))
+        self.redis.lock_acquired = False
+        self.assertEqual(obj.count(), 1)
+        self.assertEqual(obj.calls, 1)
+
+    def test_deserializer(self):
+        """ Test cached payload is deserialized on miss and on hit """
+        obj = CachedObject()
+        self.assertEqual(obj.get_body(), dict(body=[1, 2]))
+        self.assertEqual(obj.get_body(), dict(body=[1, 2]))
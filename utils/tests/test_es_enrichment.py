@@ -0,0 +1,32 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from utils.es_enrichment import compile_field_paths
+from utils.es_enrichment import get_path_value
+from utils.es_enrichment import mget_sources
+
+
+class ESEnrichmentTestCase(TestCase):
+    def test_get_path_value(self):
+        paths = compile_field_paths(["main.id", "general_data.iab_categories", "task_us_data.content_type"])
+        source = dict(main=dict(id="channel"), general_data=dict(iab_categories=["Music"]), task_us_data=None)
+        self.assertEqual(get_path_value(source, paths["main.id"]), "channel")
+        self.assertEqual(get_path_value(source, paths["general_data.iab_categories"]), ["Music"])
+        self.assertIsNone(get_path_value(source, paths["task_us_data.content_type"]))
+
+    def test_mget_sources(self):
+        """ Test documents are retrieved in batches with only requested fields and yielded in order """
+        es = MagicMock()
+        es.mget.side_effect = lambda body, **_: dict(docs=[
+            dict(_id=_id, found=_id != "2", _source=dict(main=dict(id=_id))) for _id in body["ids"]
+        ])
+        model = MagicMock()
+        model._get_index.return_value = "channels"
+        with patch("utils.es_enrichment.connections.get_connection", return_value=es):
+            sources = list(mget_sources(model, [str(i) for i in range(5)], ["main.id"], batch_size=2))
+        self.assertEqual([_id for _id, _ in sources], ["0", "1", "3", "4"])
+        self.assertEqual(es.mget.call_count, 3)
+        for call in es.mget.call_args_list:
+            self.assertEqual(call.kwargs["_source_includes"], ["main.id"])
+            self.assertEqual(call.kwargs["index"], "channels")
@@ -1,5 +1,9 @@
 from unittest import TestCase
+from unittest import mock
 
+from utils.lang import FAST_TEXT_LANG_CACHE
+from utils.lang import fasttext_lang
+from utils.lang import fasttext_lang_many
 from utils.lang import merge_sort
 
 
@@ -39,3 +43,36 @@ class MergeSort(TestCase):
 
 def as_generator(*args):
     yield from args
+
+
+class FastTextLangManyTestCase(TestCase):
+    def setUp(self):
+        FAST_TEXT_LANG_CACHE.clear()
+
+    def test_single_predict_call(self):
+        """ Test languages are detected with a single predict call and low confidence texts fall back to langid """
+        model = mock.Mock()
+        model.predict.return_value = ([["__label__en"], ["__label__de"]], [[.9], [.1]])
+        with mock.patch("utils.lang.get_fast_text_model", return_value=model), \
+                mock.patch("utils.lang.langid.classify", return_value=("FR", 1)) as mock_classify:
+            result = fasttext_lang_many(["english text", "low confidence text", "english text"])
+        self.assertEqual(result, ["en", "fr", "en"])
+        model.predict.assert_called_once_with(["english text", "low confidence text"])
+        mock_classify.assert_called_once_with("low confidence text")
+
+    def test_cached(self):
+        """ Test detected languages are memoized by content """
+        model = mock.Mock()
+        model.predict.return_value = ([["__label__en"]], [[.9]])
+        with mock.patch("utils.lang.get_fast_text_model", return_value=model):
+            fasttext_lang_many(["english text"])
+            result = fasttext_lang("english text")
+        self.assertEqual(result, "en")
+        model.predict.assert_called_once()
+
+    def test_empty_prediction(self):
+        model = mock.Mock()
+        model.predict.return_value = ([[]], [[]])
+        with mock.patch("utils.lang.get_fast_text_model", return_value=model):
+            result = fasttext_lang_many([""])
+        self.assertEqual(result, [""])
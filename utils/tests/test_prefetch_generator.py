@@ -0,0 +1,67 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from utils.utils import prefetch_generator
+
+
+class PrefetchGeneratorTestCase(TestCase):
+    def test_order(self):
+        result = list(prefetch_generator(range(10), size=3))
+        self.assertEqual(list(range(10)), result)
+
+    def test_transform(self):
+        result = list(prefetch_generator([[1, 2], [3]], transform=len))
+        self.assertEqual([2, 1], result)
+
+    def test_raises_error(self):
+        def generator():
+            yield 1
+            raise ValueError
+
+        items = prefetch_generator(generator())
+        self.assertEqual(1, next(items))
+        with self.assertRaises(ValueError):
+            next(items)
+
+    def test_close(self):
+        """ Test that closing consumer stops retrieving items """
+        consumed = []
+
+        def generator():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        items = prefetch_generator(generator(), size=1)
+        self.assertEqual(0, next(items))
+        items.close()
+        self.assertLess(len(consumed), 100)
+
+    def test_close_closes_iterable(self):
+        """ Test that closing consumer closes the iterated generator """
+        closed = []
+
+        def generator():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.append(True)
+
+        items = prefetch_generator(generator(), size=1)
+        self.assertEqual(0, next(items))
+        items.close()
+        for _ in range(50):
+            if closed:
+                break
+            time.sleep(.01)
+        self.assertEqual(closed, [True])
+
+    def test_producer_stopped(self):
+        """ Test that consumer does not wait forever if background thread stops without finishing """
+        with patch("utils.utils.threading.Thread") as mock_thread:
+            mock_thread.return_value.is_alive.return_value = False
+            items = prefetch_generator(range(10), poll_timeout=.01)
+            with self.assertRaises(RuntimeError):
+                next(items)
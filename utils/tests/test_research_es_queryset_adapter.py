@@ -0,0 +1,67 @@
+import json
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.test import override_settings
+
+from cache.constants import RESEARCH_CHANNELS_DEFAULT_CACHE_KEY
+from cache.utils import get_research_cache_page_key
+from channel.constants import RESEARCH_CHANNELS_DEFAULT_SORT
+from channel.constants import TERMS_FILTER
+from utils.es_components_api_utils import ResearchESQuerysetAdapter
+
+
+class FakeManager:
+    allowed_sections = ("main", "stats")
+    model = object
+
+    def search(self, *_, **__):
+        return MagicMock()
+
+    def forced_filters(self):
+        return None
+
+
+@override_settings(CACHE_RESEARCH_DEFAULT_MAX_PAGE_SIZE=2, CACHE_RESEARCH_DEFAULT_PAGES=3)
+class ResearchESQuerysetAdapterTestCase(SimpleTestCase):
+    def setUp(self):
+        hits = [dict(_id=str(i), _source=dict(main=dict(id=str(i)), stats=dict(views=i))) for i in range(6)]
+        self.pages = {
+            get_research_cache_page_key(RESEARCH_CHANNELS_DEFAULT_CACHE_KEY, RESEARCH_CHANNELS_DEFAULT_SORT, page):
+                json.dumps(dict(total=dict(value=6), max_score=None, hits=hits[page * 2:(page + 1) * 2]))
+            for page in range(3)
+        }
+        self.redis_mock = MagicMock()
+        self.redis_mock.mget.side_effect = lambda keys: [self.pages.get(key) for key in keys]
+
+    def _get_adapter(self, query_params=None):
+        adapter = ResearchESQuerysetAdapter(FakeManager(), query_params=query_params or {}, filter_names=TERMS_FILTER)
+        adapter.sort = RESEARCH_CHANNELS_DEFAULT_SORT
+        adapter.fields_to_load = ["main"]
+        return adapter
+
+    def test_slice_across_pages(self):
+        """ Test slices spanning cached pages are built from the cached hits """
+        adapter = self._get_adapter()
+        with patch("utils.es_components_api_utils.redis", self.redis_mock):
+            response = adapter.get_data(1, 4)
+        hits = response.to_dict()["hits"]["hits"]
+        self.assertEqual([hit["_id"] for hit in hits], ["1", "2", "3"])
+        self.assertEqual(set(key for hit in hits for key in hit["_source"]), {"main"})
+
+    def test_uncached_slice(self):
+        """ Test slices beyond the cached pages are not served from cache """
+        adapter = self._get_adapter()
+        self.assertFalse(adapter._should_get_cache([RESEARCH_CHANNELS_DEFAULT_SORT], 4, 8))
+        self.assertTrue(adapter._should_get_cache([RESEARCH_CHANNELS_DEFAULT_SORT], 4, 6))
+
+    def test_filters_not_cached(self):
+        """ Test requests with section filters are not served from cache """
+        adapter = self._get_adapter(query_params={"stats.views": "1,10", "page": "1"})
+        self.assertFalse(adapter._should_get_cache([RESEARCH_CHANNELS_DEFAULT_SORT], 0, 2))
+
+    def test_view_filters_not_cached(self):
+        """ Test requests with view filters that do not start with a section are not served from cache """
+        adapter = self._get_adapter(query_params={"auth_channel": "true"})
+        self.assertFalse(adapter._should_get_cache([RESEARCH_CHANNELS_DEFAULT_SORT], 0, 2))
@@ -0,0 +1,72 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from django.conf import settings
+from django.test import override_settings
+
+from utils.aws import base_service
+from utils.aws.s3_exporter import S3Exporter
+from utils.aws.s3_exporter import S3MultipartUpload
+from utils.unittests.s3_mock import mock_s3
+
+
+class ExporterTest(S3Exporter):
+    bucket_name = settings.AMAZON_S3_BUCKET_NAME
+
+    @staticmethod
+    def get_s3_key(name):
+        return f"test/{name}"
+
+
+class S3ExporterTestCase(TestCase):
+    def tearDown(self):
+        base_service.clear_clients()
+
+    @override_settings(AWS_CLIENT_POOL_ENABLED=True)
+    def test_clients_pooled(self):
+        """ Test clients are reused for the same credentials and config """
+        self.assertIs(ExporterTest._s3(), ExporterTest._s3())
+        self.assertIsNot(ExporterTest._s3(), ExporterTest._presigned_s3())
+        self.assertIs(ExporterTest._presigned_s3(), ExporterTest._presigned_s3())
+
+    def test_multipart_upload_parts(self):
+        """ Test content is uploaded in parts as it is written """
+        s3 = MagicMock()
+        s3.create_multipart_upload.return_value = dict(UploadId="upload")
+        s3.upload_part.side_effect = lambda PartNumber, **_: dict(ETag=f"etag{PartNumber}")
+        with S3MultipartUpload(s3, "bucket", "key", part_size=4) as upload:
+            upload.write("abc")
+            s3.upload_part.assert_not_called()
+            upload.write(b"defghij")
+            self.assertEqual(s3.upload_part.call_count, 2)
+        self.assertEqual([call.kwargs["Body"] for call in s3.upload_part.call_args_list], [b"abcd", b"efgh", b"ij"])
+        s3.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key", UploadId="upload",
+            MultipartUpload={"Parts": [dict(ETag=f"etag{i}", PartNumber=i) for i in range(1, 4)]}
+        )
+        s3.put_object.assert_not_called()
+
+    def test_multipart_upload_aborted(self):
+        s3 = MagicMock()
+        s3.create_multipart_upload.return_value = dict(UploadId="upload")
+        with self.assertRaises(ValueError):
+            with S3MultipartUpload(s3, "bucket", "key", part_size=2) as upload:
+                upload.write("abc")
+                raise ValueError
+        s3.abort_multipart_upload.assert_called_once_with(Bucket="bucket", Key="key", UploadId="upload")
+        s3.complete_multipart_upload.assert_not_called()
+
+    @mock_s3
+    def test_small_upload_and_range_lines(self):
+        """ Test uploads smaller than a part are put as a single object and lines are read across ranges """
+        lines = [b"URL", b"", b"https://www.youtube.com/channel/" + b"a" * 24, b"last"]
+        with ExporterTest.open_upload("lines.csv") as upload:
+            upload.write(b"\r\n".join(lines))
+        self.assertEqual(list(ExporterTest.iter_s3_lines("lines.csv", range_size=5)), lines)
+        self.assertEqual(list(ExporterTest.iter_s3_lines("lines.csv")), lines)
+
+    @mock_s3
+    def test_range_lines_empty(self):
+        with ExporterTest.open_upload("empty.csv"):
+            pass
+        self.assertEqual(list(ExporterTest.iter_s3_lines("empty.csv")), [])
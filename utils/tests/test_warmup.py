@@ -0,0 +1,24 @@
+from django.test import SimpleTestCase
+from django.test import override_settings
+
+from saas.warmup import warm_up
+
+LOADED = []
+
+
+def load_resource():
+    LOADED.append(True)
+
+
+@override_settings(
+    PROJECT_APPS=("userprofile",),
+    WARMUP_RESOURCES=("utils.tests.test_warmup.load_resource", "utils.tests.test_warmup.missing_resource"),
+)
+class WarmUpTestCase(SimpleTestCase):
+    def test_warm_up(self):
+        """ Test modules and resources are loaded and timed, and failures do not stop warm up """
+        timings = warm_up()
+        self.assertEqual(LOADED, [True])
+        self.assertIsNotNone(timings["userprofile.models"])
+        self.assertIsNotNone(timings["utils.tests.test_warmup.load_resource"])
+        self.assertIsNone(timings["utils.tests.test_warmup.missing_resource"])
@@ -0,0 +1,78 @@
+"""
+In process cache tier for data that is shared through redis and rarely changes
+    Local entries are keyed by a version stamp stored in redis. Writers invalidate the local entries of every process by
+    bumping the version stamp with bump_version, and local entries expire after LOCAL_CACHE_TTL in any case. Version
+    stamps read from redis are reused for VERSION_CHECK_INTERVAL, so other processes see a bumped version within that
+    interval
+"""
+import threading
+import uuid
+
+from cachetools import TTLCache
+from django.conf import settings
+
+from utils.redis import get_redis_client
+
+# Entries are CacheItem values and percentiles of each requested set of fields. Entries of previous versions are
+# only evicted by size or ttl, so the size allows for several versions of each entry
+LOCAL_CACHE_SIZE = 1024
+LOCAL_CACHE_TTL = 600
+# Seconds a version stamp read from redis is used before it is read again
+VERSION_CHECK_INTERVAL = 5
+VERSION_KEY_PREFIX = "tiered_cache.version"
+
+redis = get_redis_client()
+_local_cache = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL)
+_local_versions = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=VERSION_CHECK_INTERVAL)
+_local_cache_lock = threading.Lock()
+
+
+def is_enabled():
+    return settings.TIERED_CACHE_ENABLED
+
+
+def get_version_key(name):
+    return f"{VERSION_KEY_PREFIX}.{name}"
+
+
+def get_version(name):
+    """
+    Get current version stamp of cached data, reading it from redis at most once per VERSION_CHECK_INTERVAL
+    :param name: str -> Name of cached data
+    :return: str
+    """
+    with _local_cache_lock:
+        version = _local_versions.get(name)
+    if version is None:
+        version = redis.get(get_version_key(name))
+        version = version.decode() if version else ""
+        with _local_cache_lock:
+            _local_versions[name] = version
+    return version
+
+
+def bump_version(name):
+    """
+    Invalidate cached data of all processes by writing a new version stamp
+    :param name: str -> Name of cached data
+    """
+    version = uuid.uuid4().hex
+    redis.set(get_version_key(name), version)
+    with _local_cache_lock:
+        _local_versions[name] = version
+
+
+def get_local(name, version, key=None):
+    with _local_cache_lock:
+        return _local_cache.get((name, version, key))
+
+
+def set_local(name, version, value, key=None):
+    with _local_cache_lock:
+        _local_cache[(name, version, key)] = value
+
+
+def clear_local():
+    with _local_cache_lock:
+        _local_cache.clear()
+        _local_versions.clear()
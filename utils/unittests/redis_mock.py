@@ -1,4 +1,5 @@
 from collections import defaultdict
+from unittest.mock import MagicMock
 
 
 class MockRedisLock:
@@ -43,3 +44,29 @@ class MockRedis:
 
     def lock(self, key, timeout=0, *args, **kwargs):
         return MockRedisLock(self, key, timeout)
+
+
+class FakeRedis:
+    """Imitate a Redis client with data kept per instance, so each test can patch in an empty client."""
+
+    def __init__(self):
+        self.data = {}
+        self.lock_acquired = True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    # pylint: disable=unused-argument
+    def set(self, key, value, timeout=None):
+        # Redis returns str values as bytes
+        self.data[key] = value.encode() if isinstance(value, str) else value
+    # pylint: enable=unused-argument
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def lock(self, *_, **__):
+        lock = MagicMock()
+        lock.acquire.return_value = self.lock_acquired
+        return lock
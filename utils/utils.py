@@ -1,5 +1,7 @@
 import hashlib
+import queue
 import string
+import threading
 from collections import Counter
 from django.db.models.query import QuerySet
 from itertools import count
@@ -124,6 +126,71 @@ def slice_generator(data_generator, limit):
         counter += 1
 
 
+def prefetch_generator(iterable, transform=None, size=1, poll_timeout=.1):
+    """
+    Iterate over iterable in a background thread so that following items are retrieved while the current item
+        is being consumed
+    Exceptions raised while iterating are raised to the consumer. Closing the generator stops the background thread,
+        which then closes iterable if it is a generator so that its cleanup runs without waiting for garbage collection
+    :param iterable: iterable
+    :param transform: callable -> Optional function applied to each item in the background thread
+    :param size: int -> Max number of items retrieved ahead of the consumer
+    :param poll_timeout: float -> Seconds between checks that the background thread is still running
+    """
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+    iterator = iter(iterable)
+
+    def put(item, error=None):
+        while not stop.is_set():
+            try:
+                items.put((item, error), timeout=poll_timeout)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterator:
+                if transform is not None:
+                    item = transform(item)
+                if put(item) is False:
+                    return
+            put(done)
+        # pylint: disable=broad-except
+        except BaseException as err:
+        # pylint: enable=broad-except
+            put(None, error=err)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            try:
+                item, error = items.get(timeout=poll_timeout)
+            except queue.Empty:
+                if producer.is_alive():
+                    continue
+                try:
+                    # Producer may have put its last item after the timeout
+                    item, error = items.get_nowait()
+                except queue.Empty:
+                    raise RuntimeError("Prefetch thread stopped without finishing iteration")
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
 def validate_youtube_url(url, url_type, default=None) -> str:
     """
     Return string youtube id if url is valid
@@ -0,0 +1,20 @@
+import copy
+from functools import lru_cache
+
+import yaml
+
+
+def load_yaml_config(path):
+    """
+    Load yaml config file. Files are parsed once per process and callers get their own copy of the parsed config
+    :param path: str -> Path of config file relative to application root
+    :return: dict
+    """
+    return copy.deepcopy(_read_yaml_config(path))
+
+
+@lru_cache()
+def _read_yaml_config(path):
+    with open(path, "r") as f:
+        conf = yaml.load(f, Loader=yaml.FullLoader)
+    return conf
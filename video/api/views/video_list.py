@@ -8,7 +8,6 @@ from rest_framework.generics import ListAPIView
 from audit_tool.models import BlacklistItem
 from cache.constants import ADMIN_VIDEO_AGGREGATIONS_KEY
 from cache.constants import VIDEO_AGGREGATIONS_KEY
-from cache.models import CacheItem
 from channel.utils import VettedParamsAdapter
 from es_components.constants import Sections
 from es_components.languages import LANGUAGES
@@ -88,8 +87,6 @@ class VideoListApiView(BrandSuitabilityFiltersMixin, VettingAdminAggregationsMix
     admin_manager_class = VettingAdminVideoManager
     serializer_class = VideoSerializer
 
-    cache_class = CacheItem
-
     allowed_percentiles = (
         "ads_stats.average_cpv:percentiles",
         "ads_stats.average_cpm:percentiles",
@@ -161,4 +158,5 @@ class VideoListApiView(BrandSuitabilityFiltersMixin, VettingAdminAggregationsMix
         self.add_fields()
         return ResearchESQuerysetAdapter(self.get_manager_class()(sections),
                                          cached_aggregations=self.get_cached_aggregations(),
-                                         query_params=self.request.query_params)
+                                         query_params=self.request.query_params,
+                                         filter_names=self.get_filter_names())
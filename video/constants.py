@@ -51,4 +51,20 @@ RESEARCH_VIDEOS_DEFAULT_SORT = [
     {"stats.views": {"order": "desc"}},
     {"main.id": {"order": "asc"}}
 ]
+# Popular Research videos sort orders to warm the cache for
+RESEARCH_VIDEOS_CACHED_SORTS = [
+    RESEARCH_VIDEOS_DEFAULT_SORT,
+    [
+        {"stats.last_30day_views": {"order": "desc"}},
+        {"main.id": {"order": "asc"}}
+    ],
+    [
+        {"stats.likes": {"order": "desc"}},
+        {"main.id": {"order": "asc"}}
+    ],
+    [
+        {"general_data.youtube_published_at": {"order": "desc"}},
+        {"main.id": {"order": "asc"}}
+    ],
+]
 
@@ -18,7 +18,7 @@ def export_videos_data(query_params, export_name, user_emails):
         VideoListDataGenerator(query_params),
         VIDEO_CSV_HEADERS
     )
-    ESDataS3Exporter.export_to_s3(content_exporter, export_name)
+    ESDataS3Exporter.export_stream_to_s3(content_exporter, export_name)
 
     export_url = ESDataS3Exporter.generate_temporary_url(ESDataS3Exporter.get_s3_key(export_name), time_limit=86400)
 